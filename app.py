@@ -7,10 +7,20 @@
 # Version: 1.0
 
 # 1.0 Imports
+from datetime import datetime, timedelta, timezone
 import streamlit as st
-import polars as pl  # Replaced pandas with polars
-from core.modules.watchlist_module import get_personal_watchlist, edit_and_sync
-from ui.components import editable_watchlist_table
+from core.modules.refresh_scheduler import RefreshScheduler
+from core.modules.watchlist_module import enabled_providers
+from core.modules.episode_module import tracked_show_ids
+from core.db.calendar_index import airing_next, premieres_since, last_visit, mark_visit, utc_now
+from core.modules.watchlist_store import WatchlistStore
+from ui.components import editable_watchlist_table, watchlist_filter_bar, page_controls, calendar_table
+from ui.watchlist_view import (
+    snapshot_frame, filter_options, filter_watchlist_frame, page_frame,
+    apply_pending_edits, collect_page_edits
+)
+from core.utils.http_cache import cache_stats
+from core.utils.helpers import load_config
 from core.utils.logger import logger
 
 # 2.0 App Setup
@@ -25,11 +35,54 @@ st.theme({
     'text': '#FFFFFF'
 })
 
+# 2.1 Shared Watchlist Store and Background Refresh (One per Process, Shared by All Sessions)
+@st.cache_resource
+def get_watchlist_store() -> WatchlistStore:
+    """Returns the process-wide watchlist store, warm-started from storage."""
+    store = WatchlistStore()
+    store.load_stored()
+    return store
+
+@st.cache_resource
+def get_refresh_scheduler() -> RefreshScheduler:
+    """Returns the process-wide refresh scheduler, started if enabled in config."""
+    refresh_config = load_config().get('refresh', {})
+    scheduler = RefreshScheduler(
+        get_watchlist_store(),
+        interval_minutes=refresh_config.get('interval_minutes', 30),
+        run_on_start=refresh_config.get('on_start', True),
+        episodes=refresh_config.get('episodes', True)
+    )
+    if refresh_config.get('enabled', True):
+        scheduler.start()
+    return scheduler
+
+def time_ago(when: datetime | None) -> str:
+    """Formats a timestamp as a short relative time."""
+    if when is None:
+        return "Never"
+    seconds = int((datetime.now(timezone.utc) - when).total_seconds())
+    if seconds < 60:
+        return "Just now"
+    if seconds < 3600:
+        return f"{seconds // 60} min ago"
+    if seconds < 86400:
+        return f"{seconds // 3600} h ago"
+    return f"{seconds // 86400} d ago"
+
+store = get_watchlist_store()
+scheduler = get_refresh_scheduler()
+snapshot = store.current()
+if st.session_state.get('seen_version') != snapshot.version:
+    # 2.2 Track the Rendered Version (Editor Widgets Are Keyed per Version, So Stale Edits Reset)
+    st.session_state.seen_version = snapshot.version
+    st.session_state.pending_edits = {}
+
 # 3.0 Sidebar Navigation
 st.sidebar.title("🚀 Portal Menu")
 page = st.sidebar.selectbox(
     "Go to",
-    ["Home", "Watchlist", "Sync", "Help"],
+    ["Home", "Watchlist", "Calendar", "Sync", "Help"],
     help="Navigate easily!"
 )
 
@@ -39,48 +92,67 @@ if page == "Watchlist":
     st.header("📺 My Watchlist & Favorites")
     st.info("Edit below to update favorites/watchlist. Sync pushes to APIs.")
     
-    # 4.2 Refresh Button
-    if st.button("🔄 Refresh Data", help="Pull latest from APIs"):
-        with st.spinner("Fetching from TVMaze, TMDB, Trakt..."):
-            watchlist = get_personal_watchlist()
-            st.session_state.watchlist = watchlist
-            logger.info("Watchlist refreshed")
+    # 4.2 Refresh Button (Runs in the Background; the Current Snapshot Stays Visible)
+    if st.button("🔄 Refresh Data", help="Pull latest from APIs", disabled=store.refreshing):
+        scheduler.trigger()
+        logger.info("Watchlist refresh requested")
+    if store.refreshing:
+        st.caption("Refreshing from TVMaze, TMDB, Trakt in the background…")
     
-    # 4.3 Display Table
-    if 'watchlist' in st.session_state:
-        df = pl.DataFrame([{
-            'Poster': i.poster_url,
-            'Name': i.name,
-            'Type': i.type,
-            'Score': i.score,
-            'Networks': ', '.join(n['name'] for n in i.networks or []),
-            'Favorite': i.is_favorite,
-            'Watchlist': i.is_watchlist,
-            'Trakt Synced': '✅' if i.trakt_id else '❌'
-        } for i in st.session_state.watchlist])
+    # 4.3 Filter, Sort and Page Server-Side (Only the Visible Page Is Sent to the Browser)
+    if snapshot.version:
+        frame = snapshot_frame(snapshot)
+        filters = watchlist_filter_bar(filter_options(frame))
+        matches = filter_watchlist_frame(frame, **filters)
+        page_index, page_size = page_controls(matches.height)
+        original_page = page_frame(matches, page_index, page_size)
         
-        edited_df = editable_watchlist_table(df)
+        # 4.4 Edit the Page; Edits Are Kept per Item ID Across Pages and Filters
+        pending = st.session_state.setdefault('pending_edits', {})
+        view_key = abs(hash(repr(sorted(filters.items()))))
+        edited_df = editable_watchlist_table(
+            apply_pending_edits(original_page, pending),
+            key=f"watchlist_editor_v{snapshot.version}_{view_key}_{page_index}_{page_size}"
+        )
+        collect_page_edits(original_page, edited_df, pending)
+        if pending:
+            st.caption(f"{len(pending)} unsaved change(s)")
         
-        # 4.4 Sync Changes
+        # 4.5 Sync Changes
         if st.button("💾 Save & Sync", help="Save to DB and push to APIs"):
-            changes = {}
-            for idx, row in edited_df.iter_rows(named=True):
-                orig = st.session_state.watchlist[idx]
-                if row['Favorite'] != orig.is_favorite or row['Watchlist'] != orig.is_watchlist:
-                    changes[orig.id] = {
-                        'is_favorite': row['Favorite'],
-                        'is_watchlist': row['Watchlist']
-                    }
+            changes = dict(pending)
             if changes:
                 with st.spinner("Syncing to APIs..."):
-                    success = edit_and_sync(st.session_state.watchlist, changes)
-                    if success:
+                    snapshot, results = store.sync(changes)
+                    st.session_state.seen_version = snapshot.version
+                    st.session_state.pending_edits = {}
+                    failed = [snapshot.by_id[item_id].name for item_id, ok in results.items() if not ok]
+                    if not failed:
                         st.success("Synced to TVMaze, TMDB, Trakt! 🎉")
                     else:
-                        st.error("Sync failed—check logs/errors.log")
+                        st.error(f"Sync failed for {len(failed)} item(s): {', '.join(failed)}—check logs/errors.log")
+
+elif page == "Calendar":
+    # 4.6 Calendar Page (Indexed Air-Date Range Queries)
+    st.header("📅 Airing Calendar")
+    show_names = {i.tvmaze_id: i.name for i in snapshot.items if i.tvmaze_id}
+    tracked = tracked_show_ids(list(snapshot.items))
+    
+    # 4.6.1 Upcoming Episodes
+    days = st.slider("Days ahead", min_value=1, max_value=30, value=7)
+    st.subheader(f"Airing in the next {days} days")
+    calendar_table(airing_next(days, show_ids=tracked), show_names)
+    
+    # 4.6.2 Premieres Since the Previous Visit (Remembered Once per Session)
+    if 'calendar_since' not in st.session_state:
+        st.session_state.calendar_since = last_visit() or utc_now() - timedelta(days=7)
+        mark_visit()
+    since = st.session_state.calendar_since
+    st.subheader(f"Premiered since {since:%d %b %Y}")
+    calendar_table(premieres_since(since, show_ids=tracked), show_names)
 
 elif page == "Help":
-    # 4.5 Help Page
+    # 4.7 Help Page
     st.markdown("""
     ### Quick Start
     1. Add API keys to `.env`.
@@ -95,15 +167,24 @@ elif page == "Help":
     - **Errors**: Check `logs/errors.log`.
     """)
 else:
-    # 4.6 Home Page
+    # 4.8 Home Page
     st.title("Welcome to MY_Fav_Shows+TV_Portal")
+    providers = enabled_providers()
+    last_success = {p: store.last_success(p) for p in providers}
+    synced = [when for when in last_success.values() if when]
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total Shows", len(st.session_state.get('watchlist', [])))
+        st.metric("Total Shows", len(snapshot.items))
     with col2:
-        st.metric("Sources Synced", "3/3" if 'watchlist' in st.session_state else "0/3")
+        st.metric("Sources Synced", f"{len(synced)}/{len(providers)}")
     with col3:
-        st.metric("Last Sync", "Never" if 'watchlist' not in st.session_state else "Just now")
+        st.metric("Last Sync", time_ago(max(synced) if synced else None))
+    st.caption(" · ".join(f"{p}: {time_ago(when)}" for p, when in last_success.items()))
+    stats = cache_stats()
+    st.caption(
+        f"HTTP cache: {stats['hits']} hits (304), {stats['misses']} downloads, "
+        f"{stats['revalidations']} revalidations"
+    )
 ```
 
 
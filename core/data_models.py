@@ -7,7 +7,7 @@
 # Version: 1.0
 
 # 1.0 Imports
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 from core.utils.logger import logger
@@ -16,11 +16,12 @@ from core.utils.logger import logger
 class MediaItem(BaseModel):
     """Represents a unified show or movie from multiple API sources."""
     # 2.1 Core Fields
-    id: str = Field(..., description="Composite ID (e.g., 'tmdb:123|tvmaze:456|trakt:789')")
+    id: str = Field(..., description="Composite ID (e.g., 'tmdb:tv:123|tvmaze:456|trakt:tv:789')")
     name: str = Field(..., description="Title of the show or movie")
     tmdb_id: Optional[int] = Field(None, description="TMDB ID, if available")
     tvmaze_id: Optional[int] = Field(None, description="TVMaze ID, if available")
     trakt_id: Optional[int] = Field(None, description="Trakt ID, if available")
+    tvdb_id: Optional[int] = Field(None, description="TheTVDB ID, if available (from Trakt and TVMaze externals)")
     type: str = Field(..., description="Media type: 'tv' or 'movie'")
     overview: Optional[str] = Field(None, description="Brief description")
     status: str = Field(default="unknown", description="Production status (e.g., 'ended')")
@@ -44,15 +45,20 @@ class MediaItem(BaseModel):
         validate_assignment = True
         extra = "forbid"
 
-    def __init__(self, **data):
-        """Initialize MediaItem and log creation."""
-        super().__init__(**data)
-        logger.debug("Created MediaItem: {}", self.name)
+    # 2.5 Trusted Construction
+    @classmethod
+    def from_storage(cls, data: dict) -> "MediaItem":
+        """Builds a MediaItem from a record we stored ourselves, skipping validation."""
+        updated_at = data.get('updated_at')
+        if isinstance(updated_at, str):
+            data = {**data, 'updated_at': datetime.fromisoformat(updated_at)}
+        return cls.model_construct(**data)
 
 # 3.0 Season Schema
 class Season(BaseModel):
     """Represents a season of a TV show."""
     # 3.1 Core Fields
+    id: Optional[int] = Field(None, description="Provider season ID (TVMaze)")
     number: int = Field(..., description="Season number")
     name: Optional[str] = Field(None, description="Season name, if available")
     poster_url: Optional[str] = Field(None, description="URL to season poster")
@@ -63,15 +69,12 @@ class Season(BaseModel):
         validate_assignment = True
         extra = "forbid"
 
-    def __init__(self, **data):
-        """Initialize Season and log creation."""
-        super().__init__(**data)
-        logger.debug("Created Season: number {}", self.number)
-
 # 4.0 Episode Schema
 class Episode(BaseModel):
     """Represents an episode of a TV show."""
     # 4.1 Core Fields
+    id: Optional[int] = Field(None, description="Provider episode ID (TVMaze)")
+    season: Optional[int] = Field(None, description="Season number the episode belongs to")
     number: int = Field(..., description="Episode number")
     name: str = Field(..., description="Episode title")
     air_date: Optional[datetime] = Field(None, description="Air date of episode")
@@ -82,11 +85,6 @@ class Episode(BaseModel):
         validate_assignment = True
         extra = "forbid"
 
-    def __init__(self, **data):
-        """Initialize Episode and log creation."""
-        super().__init__(**data)
-        logger.debug("Created Episode: {} (number {})", self.name, self.number)
-
 # 5.0 Schedule Schema
 class Schedule(BaseModel):
     """Represents a broadcast schedule for episodes."""
@@ -99,11 +97,15 @@ class Schedule(BaseModel):
         validate_assignment = True
         extra = "forbid"
 
-    def __init__(self, **data):
-        """Initialize Schedule and log creation."""
-        super().__init__(**data)
-        logger.debug("Created Schedule for date: {}", self.date)
-
 # 6.0 Resolve Forward Reference
 Season.update_forward_refs()
+
+# 7.0 Bulk Validation
+MEDIA_ITEM_LIST = TypeAdapter(List[MediaItem])
+
+def validate_media_items(records: list[dict]) -> list[MediaItem]:
+    """Validates a batch of provider records into MediaItems in one pass."""
+    items = MEDIA_ITEM_LIST.validate_python(records)
+    logger.debug("Validated {} media items", len(items))
+    return items
 ```
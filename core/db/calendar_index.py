@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# File: calendar_index.py
+# Description: Air-date range queries over the indexed episodes.air_date and schedule.date columns
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from sqlalchemy import select
+from core.db.models import EpisodeDB, ScheduleDB
+from core.db.sqlite_repo import get_engine
+from core.utils.logger import logger
+
+# 2.0 Tables and Visit State
+EPISODES = EpisodeDB.__table__
+SCHEDULE = ScheduleDB.__table__
+VISIT_FILE = Path("data/calendar_visit.json")
+CALENDAR_COLUMNS = [
+    EPISODES.c.id, EPISODES.c.show_tvmaze_id, EPISODES.c.season_number,
+    EPISODES.c.number, EPISODES.c.name, EPISODES.c.air_date
+]
+
+def utc_now() -> datetime:
+    """Returns the current time as naive UTC, matching the stored air dates."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+# 3.0 Range Queries (Index Range Scans, No Per-Show Iteration)
+def _episode_range(start: datetime, end: datetime, show_ids: list[int] | None):
+    """Builds the episodes query for air dates in [start, end), ordered by air date."""
+    query = (
+        select(*CALENDAR_COLUMNS)
+        .where(EPISODES.c.air_date >= start, EPISODES.c.air_date < end)
+        .order_by(EPISODES.c.air_date)
+    )
+    if show_ids is not None:
+        query = query.where(EPISODES.c.show_tvmaze_id.in_(show_ids))
+    return query
+
+def _fetch(query) -> list[dict]:
+    """Runs a calendar query and returns rows as dicts."""
+    with get_engine().connect() as conn:
+        return [dict(row) for row in conn.execute(query).mappings()]
+
+def scheduled_between(start: datetime, end: datetime, show_ids: list[int] | None = None) -> list[dict]:
+    """Returns scheduled airings in [start, end) from the schedule table, joined to their episodes."""
+    query = (
+        select(*CALENDAR_COLUMNS[:-1], SCHEDULE.c.date.label('air_date'))
+        .select_from(SCHEDULE.join(EPISODES, EPISODES.c.id == SCHEDULE.c.episode_id))
+        .where(SCHEDULE.c.date >= start, SCHEDULE.c.date < end)
+        .order_by(SCHEDULE.c.date)
+    )
+    if show_ids is not None:
+        query = query.where(SCHEDULE.c.show_tvmaze_id.in_(show_ids))
+    rows = _fetch(query)
+    logger.debug("Schedule query {} to {}: {} airings", start, end, len(rows))
+    return rows
+
+def airing_next(days: int = 7, show_ids: list[int] | None = None, now: datetime | None = None) -> list[dict]:
+    """Returns what airs in the next `days` days, from the schedule the episode ingestion keeps current."""
+    now = now or utc_now()
+    return scheduled_between(now, now + timedelta(days=days), show_ids)
+
+def premieres_since(since: datetime, show_ids: list[int] | None = None, now: datetime | None = None) -> list[dict]:
+    """Returns season and series premieres (episode 1) that aired between since and now."""
+    return _fetch(_episode_range(since, now or utc_now(), show_ids).where(EPISODES.c.number == 1))
+
+# 4.0 Last Visit
+def last_visit() -> datetime | None:
+    """Returns when the calendar was last opened, if ever."""
+    if not VISIT_FILE.exists():
+        return None
+    return datetime.fromisoformat(json.loads(VISIT_FILE.read_text())['last_visit'])
+
+def mark_visit(when: datetime | None = None) -> None:
+    """Records a calendar visit."""
+    VISIT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    VISIT_FILE.write_text(json.dumps({'last_visit': (when or utc_now()).isoformat()}))
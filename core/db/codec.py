@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# File: codec.py
+# Description: JSON codec layer for storage files (orjson fast path, optional gzip/zstd, atomic writes, streamed record loads)
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import gzip
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator
+from core.utils.logger import logger
+
+# 1.1 Optional Fast Codecs
+try:
+    import orjson
+except ImportError:  # Falls back to stdlib json
+    orjson = None
+try:
+    import zstandard
+except ImportError:  # zstd compression unavailable
+    zstandard = None
+
+# 2.0 Magic Bytes for Compressed Files
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# 3.0 JSON Encode / Decode
+def dumps(obj) -> bytes:
+    """Encodes obj as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def loads(data: bytes | str):
+    """Decodes JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# 4.0 Compression
+def compress(data: bytes, compression: str = "none") -> bytes:
+    """Compresses data with gzip or zstd; 'none' returns it unchanged."""
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if compression == "zstd":
+        if zstandard is None:
+            logger.warning("zstandard not installed, writing uncompressed")
+            return data
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+def _open_read(path: Path):
+    """Opens a file for binary line reading, decompressing by magic bytes."""
+    with path.open("rb") as f:
+        magic = f.read(4)
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError(f"{path} is zstd-compressed but zstandard is not installed")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True))
+    return path.open("rb")
+
+# 5.0 Atomic Writes
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Writes data to a temp file in the same directory, fsyncs, then renames over path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+# 6.0 Record Files
+def encode_records(records: list[dict]) -> bytes:
+    """Encodes records as a JSON array with one record per line (streamable, still valid JSON)."""
+    return b"[\n" + b",\n".join(dumps(r) for r in records) + b"\n]\n"
+
+def write_records(path: Path, records: list[dict], compression: str = "none") -> None:
+    """Atomically writes records, optionally compressed."""
+    atomic_write_bytes(path, compress(encode_records(records), compression))
+
+def iter_records(path: Path) -> Iterator[dict]:
+    """Yields records one at a time from a file written by write_records.
+
+    Files in any other JSON layout (e.g. indented) are parsed whole instead.
+    """
+    with _open_read(path) as f:
+        # 6.1 Detect One-Record-per-Line Layout
+        first = f.readline().strip()
+        yielded = 0
+        if first == b"[":
+            for line in f:
+                line = line.strip().rstrip(b",")
+                if line in (b"", b"]"):
+                    continue
+                try:
+                    record = loads(line)
+                except ValueError:
+                    if yielded:
+                        raise
+                    break  # Not line-delimited; fall back below
+                yielded += 1
+                yield record
+            else:
+                return
+
+    # 6.2 Fallback: Parse Whole File
+    with _open_read(path) as f:
+        logger.debug("Parsing {} as a whole (not line-delimited)", path.name)
+        yield from loads(f.read())
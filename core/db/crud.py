@@ -7,9 +7,10 @@
 # Version: 1.0
 
 # 1.0 Imports
-import json
 from pathlib import Path
 from core.data_models import MediaItem
+from core.db.codec import iter_records, write_records
+from core.utils.helpers import load_config
 from core.utils.logger import logger
 
 # 2.0 JSON File Path
@@ -21,17 +22,11 @@ def load_media_items() -> list[MediaItem]:
     # 3.1 Check File Existence
     if not DATA_FILE.exists():
         logger.info("JSON file not found, creating empty file")
-        DATA_FILE.parent.mkdir(exist, parents=True)
-        with DATA_FILE.open("w") as f:
-            json.dump([], f)
+        write_records(DATA_FILE, [])
         return []
     
-    # 3.2 Load JSON
-    with DATA_FILE.open("r") as f:
-        data = json.load(f)
-    
-    # 3.3 Parse to MediaItem
-    items = [MediaItem(**d) for d in data]
+    # 3.2 Stream Records into Trusted MediaItems as They Are Read (We Wrote Them)
+    items = [MediaItem.from_storage(d) for d in iter_records(DATA_FILE)]
     logger.debug("Loaded {} media items from JSON", len(items))
     return items
 
@@ -39,11 +34,10 @@ def load_media_items() -> list[MediaItem]:
 def save_media_items(items: list[MediaItem]) -> None:
     """Saves media items to JSON file."""
     # 4.1 Convert to Dict
-    data = [i.dict() for i in items]
+    data = [i.model_dump(mode="json") for i in items]
     
-    # 4.2 Write JSON
-    with DATA_FILE.open("w") as f:
-        json.dump(data, f, indent=4)
+    # 4.2 Write JSON Atomically (Temp File + Rename), Optionally Compressed
+    write_records(DATA_FILE, data, load_config().get('storage', {}).get('compression', 'none'))
     
     # 4.3 Log Completion
     logger.info("Saved {} media items to JSON", len(items))
@@ -62,6 +56,16 @@ def upsert_media_items(items: list[MediaItem]) -> None:
     # 5.3 Save Updated Data
     save_media_items(list(existing.values()))
     logger.info("Upserted {} media items to JSON", len(items))
+
+# 6.0 Prune Media Items
+def prune_media_items(keep_ids: set[str]) -> int:
+    """Deletes stored items whose ID is not in keep_ids; returns how many were deleted."""
+    existing = load_media_items()
+    kept = [i for i in existing if i.id in keep_ids]
+    if len(kept) < len(existing):
+        save_media_items(kept)
+    logger.info("Pruned {} media items from JSON", len(existing) - len(kept))
+    return len(existing) - len(kept)
 ```
 
 
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# File: episode_repo.py
+# Description: SQLite persistence for seasons, episodes and schedule rows (bulk writes, changed seasons only)
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.sqlite import insert
+from core.data_models import Season, Episode
+from core.db.models import SeasonDB, EpisodeDB, ScheduleDB
+from core.db.sqlite_repo import get_engine
+from core.utils.logger import logger
+
+# 2.0 Tables
+SEASONS = SeasonDB.__table__
+EPISODES = EpisodeDB.__table__
+SCHEDULE = ScheduleDB.__table__
+
+# 3.0 Row Conversion
+def _season_row(show_id: int, season: Season, content_hash: str) -> dict:
+    """Converts a Season to a seasons row."""
+    return {
+        'id': season.id, 'show_tvmaze_id': show_id, 'number': season.number,
+        'name': season.name, 'poster_url': season.poster_url, 'content_hash': content_hash
+    }
+
+def _episode_row(show_id: int, season: Season, episode: Episode) -> dict:
+    """Converts an Episode to an episodes row."""
+    return {
+        'id': episode.id, 'show_tvmaze_id': show_id, 'season_id': season.id, 'season_number': season.number,
+        'number': episode.number, 'name': episode.name, 'air_date': episode.air_date, 'image_url': episode.image_url
+    }
+
+# 4.0 Stored Hashes
+def season_hashes(show_ids: list[int]) -> dict[int, tuple[int, str]]:
+    """Returns {season id: (show id, content hash)} for the given shows."""
+    if not show_ids:
+        return {}
+    with get_engine().connect() as conn:
+        rows = conn.execute(
+            select(SEASONS.c.id, SEASONS.c.show_tvmaze_id, SEASONS.c.content_hash)
+            .where(SEASONS.c.show_tvmaze_id.in_(show_ids))
+        ).all()
+    return {row.id: (row.show_tvmaze_id, row.content_hash) for row in rows}
+
+# 5.0 Bulk Save
+def save_show_episodes(shows: dict[int, list[tuple[Season, str]]],
+                       schedule: dict[int, list[Episode]]) -> tuple[int, int]:
+    """Rewrites only new or changed seasons (and their episodes) plus the shows' schedules in one transaction.
+
+    shows maps a TVMaze show ID to its (season, content hash) pairs; returns
+    (seasons written, episodes written).
+    """
+    # 5.1 Diff Against Stored Hashes
+    stored = season_hashes(list(shows))
+    changed = [
+        (show_id, season, content_hash)
+        for show_id, seasons in shows.items()
+        for season, content_hash in seasons
+        if stored.get(season.id, (None, None))[1] != content_hash
+    ]
+    current = {season.id for seasons in shows.values() for season, _ in seasons}
+    removed = [season_id for season_id in stored if season_id not in current]
+    rewrite = [season.id for _, season, _ in changed] + removed
+
+    # 5.2 Build Rows
+    season_rows = [_season_row(show_id, season, content_hash) for show_id, season, content_hash in changed]
+    episode_rows = [
+        _episode_row(show_id, season, episode)
+        for show_id, season, _ in changed for episode in season.episodes
+    ]
+    schedule_rows = [
+        {'episode_id': e.id, 'show_tvmaze_id': show_id, 'date': e.air_date}
+        for show_id, episodes in schedule.items() for e in episodes if e.air_date
+    ]
+
+    # 5.3 Write in One Transaction with Executemany Inserts
+    with get_engine().begin() as conn:
+        if rewrite:
+            conn.execute(delete(EPISODES).where(EPISODES.c.season_id.in_(rewrite)))
+        if removed:
+            conn.execute(delete(SEASONS).where(SEASONS.c.id.in_(removed)))
+        if season_rows:
+            stmt = insert(SEASONS)
+            conn.execute(stmt.on_conflict_do_update(
+                index_elements=[SEASONS.c.id],
+                set_={c.name: stmt.excluded[c.name] for c in SEASONS.columns if c.name != 'id'}
+            ), season_rows)
+        if episode_rows:
+            conn.execute(insert(EPISODES).prefix_with("OR REPLACE"), episode_rows)
+        conn.execute(delete(SCHEDULE).where(SCHEDULE.c.show_tvmaze_id.in_(list(schedule))))
+        if schedule_rows:
+            conn.execute(insert(SCHEDULE).prefix_with("OR REPLACE"), schedule_rows)
+    logger.info("Saved {} changed seasons ({} episodes), {} removed, {} schedule rows",
+                len(season_rows), len(episode_rows), len(removed), len(schedule_rows))
+    return len(season_rows), len(episode_rows)
+
+# 6.0 Load Seasons
+def load_seasons(show_id: int) -> list[Season]:
+    """Loads a show's seasons with their episodes, ordered by season and episode number."""
+    with get_engine().connect() as conn:
+        seasons = conn.execute(
+            select(SEASONS).where(SEASONS.c.show_tvmaze_id == show_id).order_by(SEASONS.c.number)
+        ).mappings().all()
+        episodes = conn.execute(
+            select(EPISODES).where(EPISODES.c.show_tvmaze_id == show_id).order_by(EPISODES.c.number)
+        ).mappings().all()
+    by_season = {}
+    for row in episodes:
+        by_season.setdefault(row['season_id'], []).append(Episode(
+            id=row['id'], season=row['season_number'], number=row['number'],
+            name=row['name'], air_date=row['air_date'], image_url=row['image_url']
+        ))
+    return [
+        Season(id=row['id'], number=row['number'], name=row['name'], poster_url=row['poster_url'],
+               episodes=by_season.get(row['id'], []))
+        for row in seasons
+    ]
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# File: log_store.py
+# Description: Append-only changelog storage for media items with snapshot replay and background compaction
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import os
+import threading
+from pathlib import Path
+from core.data_models import MediaItem
+from core.db.codec import atomic_write_bytes, compress, dumps, encode_records, iter_records, loads
+from core.utils.helpers import load_config
+from core.utils.logger import logger
+
+# 2.0 File Paths and In-Memory State
+SNAPSHOT_FILE = Path("data/media.snapshot.json")
+LOG_FILE = Path("data/media.log")
+COMPACTING_FILE = Path("data/media.log.compacting")  # Log segment being folded into the snapshot
+
+_STATE: dict[str, dict] | None = None  # Item ID -> stored record
+_LOCK = threading.RLock()
+_COMPACTOR: threading.Thread | None = None
+_GENERATION = 0  # Bumped by save_media_items so a running compaction cannot overwrite it
+_COMPACTIONS = 0  # Bumped per compaction so only the newest one may swap in its snapshot
+
+# 3.0 Replay
+def _replay(path: Path, state: dict) -> int:
+    """Applies every log record in path to state; returns the number applied."""
+    if not path.exists():
+        return 0
+    applied = 0
+    with path.open("rb") as f:
+        for line in f:
+            try:
+                entry = loads(line)
+            except ValueError:
+                logger.warning("Skipping torn log record in {}", path.name)
+                continue
+            if entry.get('op') == 'delete':
+                state.pop(entry['id'], None)
+            else:
+                state[entry['item']['id']] = entry['item']
+            applied += 1
+    return applied
+
+def _load_state() -> dict[str, dict]:
+    """Returns the current state, rebuilding it from snapshot + logs on first use."""
+    global _STATE
+    with _LOCK:
+        if _STATE is None:
+            state = {}
+            if SNAPSHOT_FILE.exists():
+                state = {d['id']: d for d in iter_records(SNAPSHOT_FILE)}
+            replayed = _replay(COMPACTING_FILE, state) + _replay(LOG_FILE, state)
+            _STATE = state
+            logger.debug("Rebuilt {} items from snapshot + {} log records", len(state), replayed)
+        return _STATE
+
+# 4.0 Snapshot Writing
+def _write_temp_snapshot(records: list[dict], suffix: str) -> Path:
+    """Writes records (compressed per storage.compression) to a temp file next to the snapshot."""
+    tmp = SNAPSHOT_FILE.with_suffix(suffix)
+    compression = load_config().get('storage', {}).get('compression', 'none')
+    atomic_write_bytes(tmp, compress(encode_records(records), compression))
+    return tmp
+
+# 5.0 Compaction
+def compact() -> None:
+    """Folds the log into a new snapshot; appends continue to a fresh log meanwhile."""
+    global _COMPACTIONS
+    # 5.1 Rotate Log and Copy State Under Lock
+    with _LOCK:
+        if LOG_FILE.exists() and COMPACTING_FILE.exists():
+            # Leftover segment from an interrupted compaction: fold the live log into it
+            with COMPACTING_FILE.open("ab") as f:
+                f.write(LOG_FILE.read_bytes())
+            LOG_FILE.unlink()
+        elif LOG_FILE.exists():
+            os.replace(LOG_FILE, COMPACTING_FILE)
+        elif not COMPACTING_FILE.exists():
+            return
+        records = list(_load_state().values())
+        generation = _GENERATION
+        _COMPACTIONS += 1
+        ticket = _COMPACTIONS
+
+    # 5.2 Write Snapshot Outside Lock, to a Temp File of Its Own
+    tmp = _write_temp_snapshot(records, f".compact.{ticket}.tmp")
+
+    # 5.3 Swap In and Drop the Folded Segment, Unless a Full Save or a Newer Compaction Started Meanwhile
+    with _LOCK:
+        if generation != _GENERATION or ticket != _COMPACTIONS:
+            tmp.unlink(missing_ok=True)
+            logger.debug("Discarded superseded compaction {}", ticket)
+            return
+        os.replace(tmp, SNAPSHOT_FILE)
+        COMPACTING_FILE.unlink(missing_ok=True)
+    logger.info("Compacted media log into snapshot of {} items", len(records))
+
+def _maybe_compact() -> None:
+    """Starts background compaction once the log passes storage.log_compact_bytes."""
+    global _COMPACTOR
+    threshold = load_config().get('storage', {}).get('log_compact_bytes', 1_048_576)
+    with _LOCK:
+        if not LOG_FILE.exists() or LOG_FILE.stat().st_size < threshold:
+            return
+        if _COMPACTOR is not None and _COMPACTOR.is_alive():
+            return
+        _COMPACTOR = threading.Thread(target=compact, name="log-compactor", daemon=True)
+        _COMPACTOR.start()
+
+# 6.0 Load Data
+def load_media_items() -> list[MediaItem]:
+    """Loads media items from snapshot + changelog."""
+    with _LOCK:
+        records = list(_load_state().values())
+    items = [MediaItem.from_storage(d) for d in records]
+    logger.debug("Loaded {} media items from log store", len(items))
+    return items
+
+# 7.0 Save Data
+def save_media_items(items: list[MediaItem]) -> None:
+    """Replaces all items: writes a fresh snapshot and clears the log."""
+    global _STATE, _GENERATION
+    records = [i.model_dump(mode="json") for i in items]
+    with _LOCK:
+        os.replace(_write_temp_snapshot(records, ".tmp"), SNAPSHOT_FILE)
+        _GENERATION += 1
+        LOG_FILE.unlink(missing_ok=True)
+        COMPACTING_FILE.unlink(missing_ok=True)
+        _STATE = {d['id']: d for d in records}
+    logger.info("Saved {} media items to log store snapshot", len(items))
+
+# 8.0 Upsert Media Items
+def _same_record(a: dict, b: dict) -> bool:
+    """Compares two records ignoring updated_at, which changes on every fetch."""
+    return {k: v for k, v in a.items() if k != 'updated_at'} == {k: v for k, v in b.items() if k != 'updated_at'}
+
+def upsert_media_items(items: list[MediaItem]) -> None:
+    """Appends only the records that changed to the log."""
+    # 8.1 Diff Against Current State
+    with _LOCK:
+        state = _load_state()
+        changed = []
+        for item in items:
+            record = item.model_dump(mode="json")
+            existing = state.get(item.id)
+            if existing is None or not _same_record(existing, record):
+                changed.append(record)
+
+        # 8.2 Append Changed Records
+        if changed:
+            LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with LOG_FILE.open("ab") as f:
+                f.write(b"".join(dumps({'op': 'upsert', 'item': r}) + b"\n" for r in changed))
+            for record in changed:
+                state[record['id']] = record
+
+    # 8.3 Log and Compact in Background if Needed
+    logger.info("Upserted {} media items ({} changed) to log store", len(items), len(changed))
+    _maybe_compact()
+
+# 9.0 Prune Media Items
+def prune_media_items(keep_ids: set[str]) -> int:
+    """Appends a delete record for every stored ID not in keep_ids; returns how many."""
+    with _LOCK:
+        state = _load_state()
+        stale = [i for i in state if i not in keep_ids]
+        if stale:
+            LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with LOG_FILE.open("ab") as f:
+                f.write(b"".join(dumps({'op': 'delete', 'id': i}) + b"\n" for i in stale))
+            for i in stale:
+                del state[i]
+    logger.info("Pruned {} media items from log store", len(stale))
+    _maybe_compact()
+    return len(stale)
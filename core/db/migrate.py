@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# File: migrate.py
+# Description: One-shot migration of data/media.json into the SQLite store
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from core.db import crud, sqlite_repo
+from core.utils.logger import logger
+
+# 2.0 Migration Logic
+def migrate_json_to_sqlite() -> int:
+    """Copies every item from the JSON file into SQLite; returns the number migrated."""
+    # 2.1 Check Source File
+    if not crud.DATA_FILE.exists():
+        logger.warning("No JSON data at {}, nothing to migrate", crud.DATA_FILE)
+        return 0
+    
+    # 2.2 Bulk Upsert into SQLite
+    items = crud.load_media_items()
+    sqlite_repo.upsert_media_items(items)
+    
+    # 2.3 Log Completion
+    logger.info("Migrated {} items from {} to SQLite", len(items), crud.DATA_FILE)
+    return len(items)
+
+# 3.0 Main Execution
+if __name__ == "__main__":
+    # 3.1 Run Migration (python -m core.db.migrate), then set storage.backend: sqlite
+    migrate_json_to_sqlite()
@@ -7,7 +7,7 @@
 # Version: 1.0
 
 # 1.0 Imports
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from core.utils.logger import logger
 
@@ -22,9 +22,10 @@ class MediaItemDB(Base):
     
     id = Column(String, primary_key=True)  # Composite ID (e.g., "tmdb:123|tvmaze:456|trakt:789")
     name = Column(String, nullable=False)
-    tmdb_id = Column(Integer, nullable=True)
-    tvmaze_id = Column(Integer, nullable=True)
-    trakt_id = Column(Integer, nullable=True)
+    tmdb_id = Column(Integer, nullable=True, index=True)
+    tvmaze_id = Column(Integer, nullable=True, index=True)
+    trakt_id = Column(Integer, nullable=True, index=True)
+    tvdb_id = Column(Integer, nullable=True, index=True)
     type = Column(String, nullable=False)  # "tv" or "movie"
     overview = Column(String, nullable=True)
     status = Column(String, default="unknown")
@@ -44,4 +45,39 @@ class MediaItemDB(Base):
         super().__init__(**kwargs)
         # 3.3 Log Creation
         logger.debug("Created MediaItemDB: {}", self.name)
+
+# 4.0 Season Table
+class SeasonDB(Base):
+    """SQLAlchemy table for Season schema (one row per TVMaze season)."""
+    __tablename__ = "seasons"
+    
+    id = Column(Integer, primary_key=True)  # TVMaze season ID
+    show_tvmaze_id = Column(Integer, nullable=False, index=True)
+    number = Column(Integer, nullable=False)
+    name = Column(String, nullable=True)
+    poster_url = Column(String, nullable=True)
+    content_hash = Column(String, nullable=False)  # Hash of the season and its episodes; unchanged seasons are skipped
+
+# 5.0 Episode Table
+class EpisodeDB(Base):
+    """SQLAlchemy table for Episode schema (one row per TVMaze episode)."""
+    __tablename__ = "episodes"
+    
+    id = Column(Integer, primary_key=True)  # TVMaze episode ID
+    show_tvmaze_id = Column(Integer, nullable=False, index=True)
+    season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False, index=True)
+    season_number = Column(Integer, nullable=True)
+    number = Column(Integer, nullable=False)
+    name = Column(String, nullable=False)
+    air_date = Column(DateTime, nullable=True, index=True)  # UTC; indexed for calendar range queries
+    image_url = Column(String, nullable=True)
+
+# 6.0 Schedule Table
+class ScheduleDB(Base):
+    """SQLAlchemy table for Schedule schema (upcoming airings of tracked shows)."""
+    __tablename__ = "schedule"
+    
+    episode_id = Column(Integer, primary_key=True)  # TVMaze episode ID
+    show_tvmaze_id = Column(Integer, nullable=False, index=True)
+    date = Column(DateTime, nullable=False, index=True)  # UTC air time; indexed for calendar range queries
 ```
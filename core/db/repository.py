@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# File: repository.py
+# Description: Storage backend selection for media items (JSON file, SQLite or append-only log, per app_config.yaml)
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from types import ModuleType
+from core.data_models import MediaItem
+from core.utils.helpers import load_config
+from core.utils.logger import logger
+
+# 2.0 Backend Selection
+def get_backend() -> ModuleType:
+    """Returns the configured storage module (storage.backend: json | sqlite | log)."""
+    name = load_config().get('storage', {}).get('backend', 'json')
+    if name == 'sqlite':
+        from core.db import sqlite_repo
+        return sqlite_repo
+    if name == 'log':
+        from core.db import log_store
+        return log_store
+    if name != 'json':
+        logger.warning("Unknown storage backend {}, using json", name)
+    from core.db import crud
+    return crud
+
+# 3.0 Delegating Operations
+def load_media_items() -> list[MediaItem]:
+    """Loads media items from the configured backend."""
+    return get_backend().load_media_items()
+
+def save_media_items(items: list[MediaItem]) -> None:
+    """Saves media items to the configured backend."""
+    get_backend().save_media_items(items)
+
+def upsert_media_items(items: list[MediaItem]) -> None:
+    """Upserts media items into the configured backend."""
+    get_backend().upsert_media_items(items)
+
+def prune_media_items(keep_ids: set[str]) -> int:
+    """Deletes stored items whose ID is not in keep_ids from the configured backend; returns how many."""
+    return get_backend().prune_media_items(keep_ids)
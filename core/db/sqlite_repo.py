@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# File: sqlite_repo.py
+# Description: SQLite storage backend for media items, built on the MediaItemDB table (WAL mode, bulk upserts)
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import threading
+from pathlib import Path
+from sqlalchemy import create_engine, event, inspect, select, delete, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+from core.data_models import MediaItem
+from core.db.models import Base, MediaItemDB
+from core.utils.helpers import load_config
+from core.utils.logger import logger
+
+# 2.0 Engine Setup
+_ENGINE: Engine | None = None
+_ENGINE_LOCK = threading.Lock()
+TABLE = MediaItemDB.__table__
+COLUMNS = [c.name for c in TABLE.columns]
+
+def _enable_wal(dbapi_connection, connection_record) -> None:
+    """Switches each new SQLite connection to WAL journaling."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+def _add_missing_columns(engine: Engine) -> None:
+    """Adds columns introduced after a database was created (SQLite ALTER TABLE ADD COLUMN)."""
+    existing = {c['name'] for c in inspect(engine).get_columns(TABLE.name)}
+    missing = [c for c in TABLE.columns if c.name not in existing]
+    if not missing:
+        return
+    with engine.begin() as conn:
+        for column in missing:
+            conn.execute(text(f"ALTER TABLE {TABLE.name} ADD COLUMN {column.name} {column.type.compile(engine.dialect)}"))
+            logger.info("Added column {} to {}", column.name, TABLE.name)
+
+def _ensure_indexes(engine: Engine) -> None:
+    """Creates indexes declared after their table already existed (create_all skips existing tables)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+def get_engine() -> Engine:
+    """Returns the shared engine, creating the database file and tables on first use."""
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            # 2.1 Create Engine with WAL Pragmas
+            db_path = Path(load_config().get('storage', {}).get('sqlite_path', 'data/media.db'))
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            _ENGINE = create_engine(f"sqlite:///{db_path}")
+            event.listen(_ENGINE, "connect", _enable_wal)
+
+            # 2.2 Create Tables and ID Indexes
+            Base.metadata.create_all(_ENGINE)
+            _add_missing_columns(_ENGINE)
+            _ensure_indexes(_ENGINE)
+            logger.info("Opened SQLite store at {}", db_path)
+        return _ENGINE
+
+# 3.0 Row Conversion
+def _to_row(item: MediaItem) -> dict:
+    """Converts a MediaItem to a media_items row."""
+    return item.model_dump(include=set(COLUMNS))
+
+# 4.0 Load Data
+def load_media_items() -> list[MediaItem]:
+    """Loads media items from SQLite."""
+    with get_engine().connect() as conn:
+        rows = conn.execute(select(TABLE)).mappings().all()
+    items = [MediaItem.from_storage(dict(row)) for row in rows]
+    logger.debug("Loaded {} media items from SQLite", len(items))
+    return items
+
+# 5.0 Save Data
+def save_media_items(items: list[MediaItem]) -> None:
+    """Replaces all stored media items."""
+    with get_engine().begin() as conn:
+        conn.execute(delete(TABLE))
+        if items:
+            conn.execute(TABLE.insert(), [_to_row(i) for i in items])
+    logger.info("Saved {} media items to SQLite", len(items))
+
+# 6.0 Upsert Media Items
+def upsert_media_items(items: list[MediaItem]) -> None:
+    """Upserts media items with one bulk INSERT ... ON CONFLICT(id) DO UPDATE."""
+    if not items:
+        return
+    stmt = insert(TABLE)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TABLE.c.id],
+        set_={c: stmt.excluded[c] for c in COLUMNS if c != 'id'}
+    )
+    with get_engine().begin() as conn:
+        conn.execute(stmt, [_to_row(i) for i in items])
+    logger.info("Upserted {} media items to SQLite", len(items))
+
+# 7.0 Prune Media Items
+def prune_media_items(keep_ids: set[str]) -> int:
+    """Deletes rows whose ID is not in keep_ids; returns how many were deleted."""
+    with get_engine().begin() as conn:
+        stored = conn.execute(select(TABLE.c.id)).scalars().all()
+        stale = [i for i in stored if i not in keep_ids]
+        if stale:
+            conn.execute(delete(TABLE).where(TABLE.c.id.in_(stale)))
+    logger.info("Pruned {} media items from SQLite", len(stale))
+    return len(stale)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# File: sync_state.py
+# Description: Tracks last-synced favorite/watchlist flags per provider and plans minimal sync mutations
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import json
+from pathlib import Path
+from core.data_models import MediaItem
+from core.utils.logger import logger
+
+# 2.0 State File and Provider Capabilities
+SYNC_STATE_FILE = Path("data/sync_state.json")
+PROVIDER_ID_FIELDS = {'tvmaze': 'tvmaze_id', 'tmdb': 'tmdb_id', 'trakt': 'trakt_id'}
+PROVIDER_FLAGS = {
+    'tvmaze': ('is_favorite',),
+    'tmdb': ('is_favorite', 'is_watchlist'),
+    'trakt': ('is_watchlist',),
+}
+
+# 3.0 Load and Save
+def load_sync_state() -> dict:
+    """Loads {provider: {state key: {flag: value}}}; empty if never synced."""
+    if not SYNC_STATE_FILE.exists():
+        return {p: {} for p in PROVIDER_FLAGS}
+    with SYNC_STATE_FILE.open("r") as f:
+        state = json.load(f)
+    for provider in PROVIDER_FLAGS:
+        state.setdefault(provider, {})
+    return state
+
+def save_sync_state(state: dict) -> None:
+    """Saves the last-synced state."""
+    SYNC_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with SYNC_STATE_FILE.open("w") as f:
+        json.dump(state, f)
+    logger.debug("Saved sync state for {} providers", len(state))
+
+# 4.0 Record Remote State
+def state_key(item: MediaItem, provider: str) -> str | None:
+    """Returns an item's key in a provider's state ('tv:1399'); provider IDs are only unique per media type."""
+    provider_id = getattr(item, PROVIDER_ID_FIELDS[provider])
+    return f"{item.type}:{provider_id}" if provider_id else None
+
+def record_remote_state(state: dict, provider: str, items: list[MediaItem]) -> None:
+    """Replaces a provider's state with the flags it just returned from a fetch."""
+    state[provider] = {
+        state_key(i, provider): {flag: getattr(i, flag) for flag in PROVIDER_FLAGS[provider]}
+        for i in items if state_key(i, provider)
+    }
+    logger.debug("Recorded {} remote {} entries", len(state[provider]), provider)
+
+def mark_synced(state: dict, provider: str, item: MediaItem, flags) -> None:
+    """Records flags as pushed to a provider for one item."""
+    entry = state[provider].setdefault(state_key(item, provider), {})
+    for flag in flags:
+        entry[flag] = getattr(item, flag)
+
+# 5.0 Mutation Plan
+def plan_mutations(items: list[MediaItem], state: dict) -> dict[str, dict[str, list[str]]]:
+    """Returns {provider: {item_id: [flags]}} for flags that differ from the last-synced state."""
+    plan = {p: {} for p in PROVIDER_FLAGS}
+    for item in items:
+        for provider, flags in PROVIDER_FLAGS.items():
+            key = state_key(item, provider)
+            if not key:
+                continue
+            synced = state[provider].get(key, {})
+            changed = [f for f in flags if synced.get(f, False) != getattr(item, f)]
+            if changed:
+                plan[provider][item.id] = changed
+    logger.debug("Planned mutations: {}", {p: len(m) for p, m in plan.items()})
+    return plan
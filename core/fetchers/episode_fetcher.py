@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# File: episode_fetcher.py
+# Description: Fetches seasons, episodes and the next airing of a TVMaze show in one embedded request
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import hashlib
+from collections import defaultdict
+from datetime import datetime, timezone
+from core.data_models import Season, Episode
+from core.utils.logger import logger
+from core.utils.helpers import get_tvmaze_session
+from core.utils.http_cache import cached_get_json
+
+# 2.0 Endpoint
+TVMAZE_API_URL = "https://api.tvmaze.com"
+EMBEDS = ['seasons', 'episodes', 'nextepisode']
+
+# 3.0 Fetch
+def fetch_show(tvmaze_id: int) -> dict:
+    """GETs a show with its seasons, episodes and next episode embedded (conditional request)."""
+    data, _ = cached_get_json(
+        get_tvmaze_session(), f"{TVMAZE_API_URL}/shows/{tvmaze_id}", {'embed[]': EMBEDS}
+    )
+    return data
+
+# 4.0 Parsing
+def _air_date(episode: dict) -> datetime | None:
+    """Returns an episode's airstamp as naive UTC, or None if unscheduled."""
+    stamp = episode.get('airstamp')
+    if not stamp:
+        return None
+    return datetime.fromisoformat(stamp).astimezone(timezone.utc).replace(tzinfo=None)
+
+def _episode(raw: dict) -> Episode:
+    """Builds an Episode from a TVMaze episode object (specials get number 0)."""
+    return Episode(
+        id=raw['id'],
+        season=raw.get('season'),
+        number=raw.get('number') or 0,
+        name=raw.get('name') or "TBA",
+        air_date=_air_date(raw),
+        image_url=(raw.get('image') or {}).get('medium')
+    )
+
+def season_hash(season: Season) -> str:
+    """Fingerprints a season and all its episodes; equal hashes mean nothing to rewrite."""
+    return hashlib.sha1(season.model_dump_json().encode()).hexdigest()
+
+def parse_seasons(show: dict) -> list[Season]:
+    """Groups a show's embedded episodes under its embedded seasons."""
+    embedded = show.get('_embedded', {})
+    by_season = defaultdict(list)
+    for raw in embedded.get('episodes', []):
+        by_season[raw.get('season')].append(_episode(raw))
+    seasons = [
+        Season(
+            id=raw['id'],
+            number=raw['number'],
+            name=raw.get('name') or None,
+            poster_url=(raw.get('image') or {}).get('medium'),
+            episodes=by_season.get(raw['number'], [])
+        )
+        for raw in embedded.get('seasons', [])
+    ]
+    logger.debug("Parsed {} seasons for show {}", len(seasons), show.get('id'))
+    return seasons
+
+def upcoming_episodes(show: dict, seasons: list[Season], now: datetime | None = None) -> list[Episode]:
+    """Returns episodes airing from now on, including the embedded next episode."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    upcoming = {e.id: e for s in seasons for e in s.episodes if e.air_date and e.air_date >= now}
+    next_raw = show.get('_embedded', {}).get('nextepisode')
+    if next_raw and next_raw['id'] not in upcoming:
+        upcoming[next_raw['id']] = _episode(next_raw)
+    return sorted(upcoming.values(), key=lambda e: e.air_date or now)
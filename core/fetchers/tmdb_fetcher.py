@@ -1,60 +1,109 @@
 ```python
 # -*- coding: utf-8 -*-
 # File: tmdb_fetcher.py
-# Description: Fetches favorites and watchlists from TMDB API
+# Description: Fetches favorites and watchlists (TV and movies, all pages) from the TMDB v3 REST API
 # Author: Grok 4 (xAI)
 # Created: 2025-10-10
-# Version: 1.0
+# Version: 1.1
 
 # 1.0 Imports
-from tmdbv3api import TMDb, Account
-from core.data_models import MediaItem
+from concurrent.futures import ThreadPoolExecutor
+from core.data_models import MediaItem, validate_media_items
 from core.utils.logger import logger
-from core.utils.helpers import load_env_vars, retry_api
+from core.utils.helpers import get_tmdb_session, load_config, load_env_vars, retry_api
+from core.utils.http_cache import cached_get_json
 
-# 2.0 Fetch Logic
+# 2.0 Endpoints
+TMDB_API_URL = "https://api.themoviedb.org/3"
+TMDB_IMAGE_URL = "https://image.tmdb.org/t/p/w500"
+LISTS = {'favorite': 'is_favorite', 'watchlist': 'is_watchlist'}
+MEDIA_TYPES = {'tv': 'tv', 'movie': 'movies'}  # MediaItem.type -> account list path segment
+
+# 3.0 Request Helpers
+def _get(path: str, params: dict | None = None) -> dict:
+    """GETs a TMDB endpoint through the conditional-request cache."""
+    data, _ = cached_get_json(get_tmdb_session(), f"{TMDB_API_URL}{path}", params)
+    return data
+
+def _genre_names(media_type: str) -> dict[int, str]:
+    """Returns TMDB's genre id -> name table for tv or movie."""
+    return {g['id']: g['name'] for g in _get(f"/genre/{media_type}/list").get('genres', [])}
+
+# 4.0 Paginated Lists
+def _fetch_lists(executor: ThreadPoolExecutor, account_id: int, token: str) -> dict[tuple[str, str], list[dict]]:
+    """Fetches every page of the four account lists; returns results keyed by (list, media type)."""
+    # 4.1 First Pages (Carry total_pages)
+    paths = {
+        (list_name, media_type): f"/account/{account_id}/{list_name}/{segment}"
+        for list_name in LISTS for media_type, segment in MEDIA_TYPES.items()
+    }
+    first = {
+        key: executor.submit(_get, path, {'session_id': token, 'page': 1})
+        for key, path in paths.items()
+    }
+    first = {key: future.result() for key, future in first.items()}
+    
+    # 4.2 Remaining Pages of All Lists Concurrently
+    rest = {
+        (key, page): executor.submit(_get, paths[key], {'session_id': token, 'page': page})
+        for key, data in first.items()
+        for page in range(2, data.get('total_pages', 1) + 1)
+    }
+    results = {key: list(data.get('results', [])) for key, data in first.items()}
+    for (key, page), future in sorted(rest.items(), key=lambda entry: entry[0][1]):
+        results[key].extend(future.result().get('results', []))
+    logger.debug("Fetched TMDB lists: {}", {f"{l}/{t}": len(r) for (l, t), r in results.items()})
+    return results
+
+# 5.0 Fetch Logic
 @retry_api()
 def get_favorites_and_watchlist() -> list[MediaItem]:
-    """Fetches TMDB favorites and watchlists."""
-    # 2.1 Load Environment Variables
+    """Fetches TMDB favorites and watchlists for TV and movies."""
+    # 5.1 Load Environment Variables
     env_vars = load_env_vars()
     api_key = env_vars.get('API_TMDB_KEY')
     token = env_vars.get('API_TMDB_TOKEN')
     
-    # 2.2 Validate Credentials
+    # 5.2 Validate Credentials
     if not api_key or not token:
         logger.critical("Missing TMDB credentials")
         raise ValueError("TMDB API key or token not set")
     
-    # 2.3 Initialize TMDB Client
-    tmdb = TMDb()
-    tmdb.api_key = api_key
-    account = Account()
-    
-    # 2.4 Fetch Favorites and Watchlist
-    favorites = account.get_favorites(session_id=token)
-    watchlist = account.get_watchlist(session_id=token)
+    # 5.3 Resolve Account and Fetch Lists and Genre Tables Concurrently
+    account_id = _get("/account", {'session_id': token})['id']
+    workers = load_config().get('rate_limits', {}).get('tmdb', {}).get('max_concurrency', 8)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tmdb") as executor:
+        genre_futures = {t: executor.submit(_genre_names, t) for t in MEDIA_TYPES}
+        lists = _fetch_lists(executor, account_id, token)
+        genres = {t: future.result() for t, future in genre_futures.items()}
     
-    # 2.5 Parse to MediaItem
-    items = []
-    for media in favorites + watchlist:
-        item = MediaItem(
-            id=f"tmdb:{media.get('id')}",
-            name=media.get('title') or media.get('name'),
-            tmdb_id=media.get('id'),
-            type=media.get('media_type'),
-            overview=media.get('overview'),
-            status="unknown",
-            genres=[g['name'] for g in media.get('genres', [])],
-            score=media.get('vote_average'),
-            poster_url=f"https://image.tmdb.org/t/p/w500{media.get('poster_path')}",
-            is_favorite=media in favorites,
-            is_watchlist=media in watchlist
-        )
-        items.append(item)
-        logger.debug("Parsed TMDB item: {}", item.name)
+    # 5.4 Classify by ID Sets and Merge One Record per (Type, TMDB ID)
+    members = {
+        (list_name, media_type): {media['id'] for media in results}
+        for (list_name, media_type), results in lists.items()
+    }
+    records = {}
+    for (list_name, media_type), results in lists.items():
+        for media in results:
+            key = (media_type, media['id'])
+            if key in records:
+                continue
+            records[key] = {
+                'id': f"tmdb:{media_type}:{media['id']}",  # TMDB numbers TV and movies separately
+                'name': media.get('title') or media.get('name'),
+                'tmdb_id': media['id'],
+                'type': media_type,
+                'overview': media.get('overview'),
+                'status': "unknown",
+                'genres': [genres[media_type][g] for g in media.get('genre_ids', []) if g in genres[media_type]],
+                'score': media.get('vote_average'),
+                'poster_url': f"{TMDB_IMAGE_URL}{media['poster_path']}" if media.get('poster_path') else None,
+                'banner_url': f"{TMDB_IMAGE_URL}{media['backdrop_path']}" if media.get('backdrop_path') else None,
+                **{flag: media['id'] in members[(name, media_type)] for name, flag in LISTS.items()}
+            }
+    items = validate_media_items(list(records.values()))
     
-    # 2.6 Log Completion
+    # 5.5 Log Completion
     logger.info("Fetched {} TMDB items", len(items))
     return items
 ```
@@ -1,54 +1,199 @@
 ```python
 # -*- coding: utf-8 -*-
-# File: show_mapper.py
-# Description: Maps media items across TVMaze, TMDB, and Trakt APIs using fuzzy matching
+# File: trakt_fetcher.py
+# Description: Fetches the Trakt watchlist and favorites (shows and movies) with concurrent paginated requests,
+#              skipped entirely while /sync/last_activities reports no list changes
 # Author: Grok 4 (xAI)
 # Created: 2025-10-10
-# Version: 1.0
+# Version: 1.1
 
 # 1.0 Imports
-from rapidfuzz import fuzz
-from core.data_models import MediaItem
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from core.data_models import MediaItem, validate_media_items
+from core.db.repository import load_media_items
 from core.utils.logger import logger
+from core.utils.helpers import get_trakt_oauth_session, load_config, retry_api
 
-# 2.0 Mapping Logic
-def map_shows(items: list[MediaItem]) -> list[MediaItem]:
-    """Consolidates media items from multiple sources."""
-    # 2.1 Initialize Result
-    consolidated = {}
+# 2.0 Endpoints
+TRAKT_API_URL = "https://api.trakt.tv"
+PAGE_LIMIT = 100  # Entries per page request
+LISTS = {'watchlist': 'is_watchlist', 'favorites': 'is_favorite'}
+MEDIA_TYPES = {'shows': 'tv', 'movies': 'movie'}  # Trakt path segment -> MediaItem.type
+METADATA_FIELDS = ('overview', 'status', 'genres', 'networks', 'score', 'poster_url', 'banner_url')
+LIST_CACHE_FILE = Path("data/trakt_lists.json")  # Last fetched lists plus the activity stamps they reflect
+LIST_CACHE_VERSION = 2  # Bumped when cached records change shape (2: type-qualified ids)
+ACTIVITY_FIELDS = {
+    'shows': ('watchlisted_at', 'favorited_at'),
+    'movies': ('watchlisted_at', 'favorited_at'),
+    'watchlist': ('updated_at',),
+    'favorites': ('updated_at',),
+}
+
+# 3.0 Paginated Requests
+def _get_page(trakt, path: str, page: int, extended: bool) -> tuple[list[dict], int]:
+    """GETs one page of a Trakt list; returns (entries, page count from X-Pagination-Page-Count)."""
+    params = {'page': page, 'limit': PAGE_LIMIT}
+    if extended:
+        params['extended'] = 'full'
+    response = trakt.get(f"{TRAKT_API_URL}{path}", params=params)
+    response.raise_for_status()
+    return response.json(), int(response.headers.get('X-Pagination-Page-Count', 1))
+
+def _fetch_lists(executor: ThreadPoolExecutor, trakt, paths: list[str], extended: bool) -> dict[str, list[dict]]:
+    """Fetches every page of each list path: first pages together, then all remaining pages together."""
+    # 3.1 First Pages (Carry the Page Count)
+    first = {path: executor.submit(_get_page, trakt, path, 1, extended) for path in paths}
+    first = {path: future.result() for path, future in first.items()}
     
-    # 2.2 Group by Name (Fuzzy Matching)
+    # 3.2 Remaining Pages of All Lists Concurrently
+    rest = {
+        (path, page): executor.submit(_get_page, trakt, path, page, extended)
+        for path, (_, pages) in first.items()
+        for page in range(2, pages + 1)
+    }
+    results = {path: list(entries) for path, (entries, _) in first.items()}
+    for (path, page), future in sorted(rest.items(), key=lambda entry: entry[0][1]):
+        results[path].extend(future.result()[0])
+    return results
+
+# 3.3 Last Activities Gate
+def get_list_activity(trakt) -> dict[str, str | None]:
+    """Returns the watchlist/favorites timestamps from /sync/last_activities (one small request)."""
+    response = trakt.get(f"{TRAKT_API_URL}/sync/last_activities")
+    response.raise_for_status()
+    data = response.json()
+    return {
+        f"{section}.{field}": (data.get(section) or {}).get(field)
+        for section, fields in ACTIVITY_FIELDS.items() for field in fields
+    }
+
+def load_list_cache() -> dict | None:
+    """Loads {'activity': {...}, 'items': [records]} from the last full fetch, if any."""
+    if not LIST_CACHE_FILE.exists():
+        return None
+    try:
+        cache = json.loads(LIST_CACHE_FILE.read_text())
+    except ValueError as e:
+        logger.warning("Discarding unreadable Trakt list cache: {}", str(e))
+        return None
+    if cache.get('version') != LIST_CACHE_VERSION:
+        logger.info("Discarding Trakt list cache from an older format")
+        return None
+    return cache
+
+def save_list_cache(activity: dict, records: list[dict]) -> None:
+    """Stores the fetched lists together with the activity stamps they correspond to."""
+    LIST_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    LIST_CACHE_FILE.write_text(json.dumps({'version': LIST_CACHE_VERSION, 'activity': activity, 'items': records}))
+
+def drop_list_cache(reason: str) -> None:
+    """Deletes the list cache so the next refresh downloads the lists in full."""
+    LIST_CACHE_FILE.unlink(missing_ok=True)
+    logger.info("Trakt list cache dropped until next full fetch: {}", reason)
+
+def patch_list_cache(items: list[MediaItem], before: dict, after: dict) -> None:
+    """Applies our own pushed watchlist changes to the cache, or drops it if Trakt changed elsewhere first."""
+    cache = load_list_cache()
+    if cache is None:
+        return
+    if cache['activity'] != before:
+        drop_list_cache("lists changed remotely")
+        return
+    records = {(r['type'], r['trakt_id']): r for r in cache['items']}
     for item in items:
-        name = item.name.lower()
-        matched = False
-        
-        # 2.3 Check for Existing Match
-        for key, existing in consolidated.items():
-            if item.tmdb_id and item.tmdb_id == existing.tmdb_id:
-                matched = True
-                existing.id = f"{existing.id}|{item.id}"
-                existing.tvmaze_id = existing.tvmaze_id or item.tvmaze_id
-                existing.trakt_id = existing.trakt_id or item.trakt_id
-                existing.is_favorite |= item.is_favorite
-                existing.is_watchlist |= item.is_watchlist
-                logger.debug("Merged by TMDB ID: {}", item.name)
-                break
-            elif fuzz.ratio(name, key.lower()) > 80:
-                matched = True
-                existing.id = f"{existing.id}|{item.id}"
-                existing.tvmaze_id = existing.tvmaze_id or item.tvmaze_id
-                existing.trakt_id = existing.trakt_id or item.trakt_id
-                existing.is_favorite |= item.is_favorite
-                existing.is_watchlist |= item.is_watchlist
-                logger.debug("Merged by fuzzy match: {}", item.name)
-                break
+        record = records.setdefault((item.type, item.trakt_id), {
+            'id': _record_id(item.type, item.trakt_id),
+            **item.model_dump(mode="json", include={'name', 'trakt_id', 'tmdb_id', 'tvdb_id', 'type', *METADATA_FIELDS}),
+            **{flag: False for flag in LISTS.values()}
+        })
+        record['is_watchlist'] = item.is_watchlist
+        if not any(record[flag] for flag in LISTS.values()):
+            del records[(item.type, item.trakt_id)]
+    save_list_cache(after, list(records.values()))
+
+# 4.0 Record Building
+def _record_id(media_type: str, trakt_id: int) -> str:
+    """Returns a Trakt record's ID; Trakt numbers shows and movies separately ('trakt:tv:1390')."""
+    return f"trakt:{media_type}:{trakt_id}"
+
+def _record(media: dict, media_type: str) -> dict:
+    """Builds a MediaItem record from a Trakt show/movie object, including its ids block."""
+    ids = media.get('ids', {})
+    record = {
+        'id': _record_id(media_type, ids['trakt']),
+        'name': media.get('title'),
+        'trakt_id': ids['trakt'],
+        'tmdb_id': ids.get('tmdb'),
+        'tvdb_id': ids.get('tvdb'),
+        'type': media_type,
+    }
+    # 4.1 Metadata Present Only in extended=full Responses
+    if 'overview' in media:
+        record.update({
+            'overview': media.get('overview'),
+            'status': media.get('status') or "unknown",
+            'genres': [g.replace('-', ' ').title() for g in media.get('genres') or []],
+            'networks': [{'name': media['network']}] if media.get('network') else None,
+            'score': media.get('rating'),
+        })
+    return record
+
+# 5.0 Fetch Logic
+@retry_api()
+def get_favorites_and_watchlist() -> list[MediaItem]:
+    """Fetches the Trakt watchlist and favorites, requesting full metadata only for titles not stored locally."""
+    # 5.1 Skip the Download When No List Activity Happened Since the Cached Fetch
+    trakt = get_trakt_oauth_session()
+    activity = get_list_activity(trakt)
+    cache = load_list_cache()
+    if cache and cache['activity'] == activity:
+        items = [MediaItem.from_storage(record) for record in cache['items']]
+        logger.info("Trakt lists unchanged since last fetch, reusing {} items", len(items))
+        return items
+    
+    # 5.2 Local Metadata
+    stored = {(i.type, i.trakt_id): i for i in load_media_items() if i.trakt_id and i.overview}
+    paths = {
+        f"/sync/{list_name}/{segment}": (list_name, media_type)
+        for list_name in LISTS for segment, media_type in MEDIA_TYPES.items()
+    }
+    workers = load_config().get('rate_limits', {}).get('trakt', {}).get('max_concurrency', 4)
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trakt") as executor:
+        # 5.3 Fetch Lists (IDs Only Once Titles Are Known Locally)
+        lists = _fetch_lists(executor, trakt, list(paths), extended=not stored)
         
-        # 2.4 Add New Item
-        if not matched:
-            consolidated[name] = item
-            logger.debug("Added new item: {}", item.name)
+        # 5.4 Refetch with extended=full Only the Lists Holding Titles Without Local Metadata
+        if stored:
+            missing = [
+                path for path, entries in lists.items()
+                if any((paths[path][1], e[e['type']]['ids']['trakt']) not in stored for e in entries)
+            ]
+            if missing:
+                logger.debug("Fetching full Trakt metadata for {}", ", ".join(missing))
+                lists.update(_fetch_lists(executor, trakt, missing, extended=True))
+    
+    # 5.5 Merge One Record per (Type, Trakt ID) Across Lists
+    records = {}
+    for path, entries in lists.items():
+        list_name, media_type = paths[path]
+        for entry in entries:
+            media = entry[entry['type']]
+            key = (media_type, media['ids']['trakt'])
+            if key not in records:
+                records[key] = {**_record(media, media_type), **{flag: False for flag in LISTS.values()}}
+            records[key][LISTS[list_name]] = True
+    
+    # 5.6 Reuse Stored Metadata for Titles Fetched Without extended=full
+    for key, record in records.items():
+        if 'overview' not in record and key in stored:
+            record.update({field: getattr(stored[key], field) for field in METADATA_FIELDS})
+    items = validate_media_items(list(records.values()))
+    save_list_cache(activity, [i.model_dump(mode="json") for i in items])
     
-    # 2.5 Log Completion
-    logger.info("Consolidated {} items", len(consolidated))
-    return list(consolidated.values())
+    # 5.7 Log Completion
+    logger.info("Fetched {} Trakt items", len(items))
+    return items
 ```
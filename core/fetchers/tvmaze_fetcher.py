@@ -1,59 +1,169 @@
 ```python
 # -*- coding: utf-8 -*-
 # File: tvmaze_fetcher.py
-# Description: Fetches favorites and watchlists from TVMaze API
+# Description: Fetches favorites and watchlists from TVMaze API (incremental via the /updates/shows index)
 # Author: Grok 4 (xAI)
 # Created: 2025-10-10
-# Version: 1.0
+# Version: 1.1
 
 # 1.0 Imports
-import requests
-from core.data_models import MediaItem
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from core.data_models import MediaItem, validate_media_items
 from core.utils.logger import logger
-from core.utils.helpers import load_env_vars, retry_api
+from core.utils.helpers import get_tvmaze_session, load_config, load_env_vars, retry_api
+from core.utils.http_cache import cached_get_json
 
-# 2.0 Fetch Logic
+# 2.0 Endpoints, State File and Parsed Results of the Last Download (Reused While the Server Answers 304)
+TVMAZE_API_URL = "https://api.tvmaze.com"
+UPDATES_STATE_FILE = Path("data/tvmaze_updates.json")
+UPDATE_WINDOWS = (('day', 86_400), ('week', 604_800), ('month', 2_592_000))  # /updates/shows?since= values
+_LAST_PARSED: dict[str, list[MediaItem]] = {}
+_PENDING_STATE: tuple[list[MediaItem], dict] | None = None  # Last incremental fetch's items and state, until stored
+
+# 3.0 Record Building
+def _show_record(show: dict) -> dict:
+    """Builds a favorite MediaItem record from a TVMaze show object.
+
+    network, webChannel (streaming shows), image and rating may each be null.
+    """
+    net = show.get('network') or show.get('webChannel')
+    return {
+        'id': f"tvmaze:{show.get('id')}",
+        'name': show.get('name'),
+        'tvmaze_id': show.get('id'),
+        'tvdb_id': (show.get('externals') or {}).get('thetvdb'),
+        'type': "tv",
+        'overview': show.get('summary'),
+        'status': show.get('status', 'unknown'),
+        'genres': show.get('genres') or [],
+        'networks': [{'name': net['name']}] if net else None,
+        'score': (show.get('rating') or {}).get('average'),
+        'poster_url': (show.get('image') or {}).get('medium'),
+        'is_favorite': True,
+        'is_watchlist': False
+    }
+
+# 4.0 Full Fetch
+def _fetch_full(email: str) -> list[MediaItem]:
+    """Downloads all favorites with their show objects in one (conditional) request."""
+    # 4.1 Fetch Favorites (Conditional Request)
+    url = f"{TVMAZE_API_URL}/v1/user/{email}/favorites"
+    data, not_modified = cached_get_json(get_tvmaze_session(), url)
+    if not_modified and url in _LAST_PARSED:
+        logger.info("TVMaze favorites unchanged, reusing {} items", len(_LAST_PARSED[url]))
+        return [item.model_copy() for item in _LAST_PARSED[url]]
+    
+    # 4.2 Build Records and Validate in Bulk
+    items = validate_media_items([_show_record(fav.get('show', {})) for fav in data.get('favorites', [])])
+    _LAST_PARSED[url] = [item.model_copy() for item in items]
+    return items
+
+# 5.0 Incremental Fetch
+def _load_updates_state() -> dict:
+    """Loads {'last_run': epoch, 'shows': {tvmaze_id: {'updated': epoch, 'record': TVMaze record}}}.
+
+    Empty if never run; shows saved in an older format count as unseen.
+    """
+    if not UPDATES_STATE_FILE.exists():
+        return {'last_run': None, 'shows': {}}
+    state = json.loads(UPDATES_STATE_FILE.read_text())
+    state['shows'] = {int(k): v for k, v in state.get('shows', {}).items() if isinstance(v, dict)}
+    return state
+
+def _save_updates_state(state: dict) -> None:
+    """Saves the per-show last-seen update timestamps and source records."""
+    UPDATES_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    UPDATES_STATE_FILE.write_text(json.dumps(state))
+
+def commit_fetch_state(items: list[MediaItem]) -> None:
+    """Saves the state of the incremental fetch that returned items; call once those items are stored.
+
+    Until then the previous timestamps stay on disk, so a refresh that fails
+    after fetching refetches the same shows next time.
+    """
+    global _PENDING_STATE
+    if _PENDING_STATE is None or _PENDING_STATE[0] is not items:
+        return
+    _save_updates_state(_PENDING_STATE[1])
+    _PENDING_STATE = None
+
+def _updated_since(last_run: float | None) -> dict[int, int] | None:
+    """Returns {tvmaze_id: updated epoch} covering the time since last_run; None when there is no usable baseline."""
+    if last_run is None:
+        return None
+    age = time.time() - last_run
+    window = next((name for name, seconds in UPDATE_WINDOWS if age < seconds), None)
+    data, _ = cached_get_json(
+        get_tvmaze_session(), f"{TVMAZE_API_URL}/updates/shows", {'since': window} if window else None
+    )
+    return {int(show_id): updated for show_id, updated in data.items()}
+
+def _fetch_incremental() -> list[MediaItem]:
+    """Refetches only followed shows updated since their last-seen timestamp; reuses their last records for the rest.
+
+    The new timestamps are staged, not saved; see commit_fetch_state.
+    """
+    global _PENDING_STATE
+    # 5.1 Followed Show IDs and Baseline
+    started = time.time()
+    session = get_tvmaze_session()
+    follows, _ = cached_get_json(session, f"{TVMAZE_API_URL}/v1/user/follows/shows")
+    followed = [entry['show_id'] for entry in follows]
+    state = _load_updates_state()
+    updates = _updated_since(state['last_run'])
+    
+    # 5.2 Decide What Changed
+    seen = state['shows']
+    changed = [
+        show_id for show_id in followed
+        if updates is None or show_id not in seen or updates.get(show_id, 0) > seen[show_id]['updated']
+    ]
+    
+    # 5.3 Refetch Changed Shows Concurrently
+    workers = load_config().get('rate_limits', {}).get('tvmaze', {}).get('max_concurrency', 2)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tvmaze") as executor:
+        shows = list(executor.map(
+            lambda show_id: cached_get_json(session, f"{TVMAZE_API_URL}/shows/{show_id}")[0], changed
+        ))
+    fetched = {show['id']: show for show in shows}
+    
+    # 5.4 Build Records (Fresh or Last Seen) and Validate in Bulk
+    shows_state = {
+        show_id: {'updated': fetched[show_id].get('updated', 0), 'record': _show_record(fetched[show_id])}
+        if show_id in fetched else seen[show_id]
+        for show_id in followed
+    }
+    items = validate_media_items([shows_state[show_id]['record'] for show_id in followed])
+    
+    # 5.5 Stage Last-Seen Timestamps and Records (Unfollowed Shows Dropped) Until the Items Are Stored
+    _PENDING_STATE = (items, {'last_run': started, 'shows': shows_state})
+    logger.info("TVMaze incremental refresh: {} changed, {} reused", len(fetched), len(followed) - len(fetched))
+    return items
+
+# 6.0 Fetch Logic
 @retry_api()
 def get_favorites_and_watchlist() -> list[MediaItem]:
     """Fetches TVMaze favorites and watchlists."""
-    # 2.1 Load Environment Variables
+    # 6.1 Load Environment Variables
     env_vars = load_env_vars()
     email = env_vars.get('API_TVMAZE_EMAIL')
     api_key = env_vars.get('API_TVMAZE_KEY')
     
-    # 2.2 Validate Credentials
+    # 6.2 Validate Credentials
     if not email or not api_key:
         logger.critical("Missing TVMaze credentials")
         raise ValueError("TVMaze email or API key not set")
     
-    # 2.3 Fetch Favorites
-    headers = {"Authorization": f"Bearer {api_key}"}
-    response = requests.get(f"https://api.tvmaze.com/v1/user/{email}/favorites", headers=headers)
-    response.raise_for_status()
-    favorites = response.json().get('favorites', [])
-    
-    # 2.4 Parse to MediaItem
-    items = []
-    for fav in favorites:
-        show = fav.get('show', {})
-        item = MediaItem(
-            id=f"tvmaze:{show.get('id')}",
-            name=show.get('name'),
-            tvmaze_id=show.get('id'),
-            type="tv",
-            overview=show.get('summary'),
-            status=show.get('status', 'unknown'),
-            genres=show.get('genres', []),
-            networks=[{'name': n.get('name')} for n in show.get('network', [])],
-            score=show.get('rating', {}).get('average'),
-            poster_url=show.get('image', {}).get('medium'),
-            is_favorite=True,
-            is_watchlist=False
-        )
-        items.append(item)
-        logger.debug("Parsed TVMaze favorite: {}", item.name)
-    
-    # 2.5 Log Completion
+    # 6.3 Fetch Incrementally or in Full
+    if load_config().get('api', {}).get('tvmaze_incremental', True):
+        items = _fetch_incremental()
+    else:
+        items = _fetch_full(email)
+    
+    # 6.4 Log Completion
     logger.info("Fetched {} TVMaze items", len(items))
     return items
 ```
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# File: id_map.py
+# Description: Persistent cross-provider identity table (e.g. tvmaze:82 <-> tmdb:tv:1399 <-> trakt:tv:1390) with manual overrides
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import json
+import re
+from pathlib import Path
+import yaml
+from core.data_models import MediaItem
+from core.utils.logger import logger
+
+# 2.0 File Paths
+IDENTITY_FILE = Path("data/id_map.json")
+OVERRIDES_FILE = Path("config/id_overrides.yaml")
+
+# 3.0 Provider Keys
+KEY_PATTERN = re.compile(r"(tvmaze:\d+|(tmdb|trakt):(tv|movie):\d+)")  # TMDB and Trakt number shows and movies separately
+
+def provider_keys(item: MediaItem) -> set[str]:
+    """Returns the provider keys (e.g. 'tmdb:tv:1399') folded into an item's composite ID."""
+    return {key for key in item.id.split("|") if key}
+
+def _warn_unknown_keys(overrides: dict, path: Path) -> None:
+    """Warns about override keys that can never match a provider key (e.g. the old untyped 'tmdb:1399')."""
+    for section in ('link', 'split'):
+        for keys in overrides.get(section) or []:
+            for key in keys:
+                if not KEY_PATTERN.fullmatch(str(key)):
+                    logger.warning("Override {} key {} in {} matches no provider key format "
+                                   "(tvmaze:82, tmdb:tv:1399, trakt:tv:1390)", section, key, path)
+
+# 4.0 Identity Map
+class IdentityMap:
+    """Groups of provider keys known to be the same title."""
+
+    def __init__(self, groups: list[list[str]] | None = None,
+                 links: list[list[str]] | None = None,
+                 splits: list[list[str]] | None = None):
+        """Builds the table from stored groups, forced links and forbidden pairs."""
+        # 4.1 Lookup Tables
+        self._groups: list[set[str] | None] = []
+        self._group_of: dict[str, int] = {}
+        self.splits = {frozenset(pair) for pair in splits or [] if len(pair) == 2}
+
+        # 4.2 Load Stored Groups (Dropping Any a Split Override Contradicts)
+        for keys in groups or []:
+            if self.allows(keys, keys):
+                self._union(keys)
+            else:
+                logger.info("Dropped stored identity group {} (split override)", keys)
+
+        # 4.3 Apply Forced Links
+        for keys in links or []:
+            self._union(keys)
+        self.dirty = False
+
+    # 4.4 Load from Disk
+    @classmethod
+    def load(cls, path: Path = IDENTITY_FILE, overrides_path: Path = OVERRIDES_FILE) -> "IdentityMap":
+        """Loads the identity table and manual overrides; missing files mean empty."""
+        groups = json.loads(path.read_text()).get('groups', []) if path.exists() else []
+        overrides = {}
+        if overrides_path.exists():
+            overrides = yaml.safe_load(overrides_path.read_text()) or {}
+            _warn_unknown_keys(overrides, overrides_path)
+        identity = cls(groups, overrides.get('link'), overrides.get('split'))
+        logger.debug("Loaded {} identity groups", len(identity))
+        return identity
+
+    # 4.5 Save to Disk
+    def save(self, path: Path = IDENTITY_FILE) -> None:
+        """Writes the identity table if consolidation changed it."""
+        if not self.dirty:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        groups = [sorted(g) for g in self._groups if g]
+        path.write_text(json.dumps({'groups': groups}, indent=2))
+        self.dirty = False
+        logger.info("Saved {} identity groups", len(groups))
+
+    def __len__(self) -> int:
+        """Number of live groups."""
+        return sum(1 for g in self._groups if g)
+
+    # 4.6 Group Union
+    def _union(self, keys) -> int:
+        """Merges keys and every group they touch into one group; returns its ID."""
+        merged = set(keys)
+        for key in keys:
+            gid = self._group_of.get(key)
+            if gid is not None and self._groups[gid]:
+                merged |= self._groups[gid]
+                self._groups[gid] = None
+        gid = len(self._groups)
+        self._groups.append(merged)
+        for key in merged:
+            self._group_of[key] = gid
+        return gid
+
+    # 4.7 Lookup
+    def lookup(self, item: MediaItem) -> int | None:
+        """Returns the known group of an item, or None for a new title."""
+        return next((self._group_of[k] for k in provider_keys(item) if k in self._group_of), None)
+
+    # 4.8 Split Check
+    def allows(self, keys_a, keys_b) -> bool:
+        """Returns False if a split override forbids merging the two key sets."""
+        return not any(frozenset((a, b)) in self.splits for a in keys_a for b in keys_b if a != b)
+
+    # 4.9 Record Consolidation Results
+    def record(self, items: list[MediaItem]) -> None:
+        """Stores each consolidated item's provider keys as one group."""
+        for item in items:
+            keys = provider_keys(item)
+            gid = self._group_of.get(next(iter(keys), None))
+            if gid is not None and keys <= self._groups[gid]:
+                continue
+            self._union(keys)
+            self.dirty = True
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# File: match_engine.py
+# Description: Indexed matching engine for show consolidation (exact-ID lookups, candidate blocking, batched fuzzy scoring)
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from collections import Counter, defaultdict
+import numpy as np
+from rapidfuzz import fuzz, process
+from core.data_models import MediaItem
+from core.utils.logger import logger
+
+# 2.0 Matching Constants
+FUZZY_THRESHOLD = 80  # Names must score strictly above this, after rounding to an int like fuzzywuzzy, to merge
+ID_FIELDS = ('tmdb_id', 'tvmaze_id', 'trakt_id', 'tvdb_id')
+MATRIX_CHUNK_ROWS = 2048  # Rows per cdist call, bounds matrix memory to chunk x n
+
+# 3.0 Scoring and Blocking Helpers
+def _passes(scores: np.ndarray) -> np.ndarray:
+    """Marks scores above FUZZY_THRESHOLD once rounded half-to-even, as fuzzywuzzy's int ratio did."""
+    return np.rint(scores) > FUZZY_THRESHOLD
+
+def _bigrams(name: str) -> Counter:
+    """Returns the multiset of adjacent character pairs in a name."""
+    return Counter(name[i:i + 2] for i in range(len(name) - 1))
+
+def _min_shared_bigrams(total_length: int) -> float:
+    """Lower bound on shared bigrams for any pair scoring above FUZZY_THRESHOLD.
+
+    fuzz.ratio is 100 * (1 - d / S) with d the insert/delete distance and S the
+    summed length, so ratio > 80 means d < 0.2 * S. The pair's longest common
+    subsequence keeps at least M - 1 - d bigrams intact in both strings, where
+    M = (S - d) / 2, giving shared > 0.2 * S - 1. Pairs at or below this bound
+    can never match and are skipped without scoring.
+    """
+    return (1 - FUZZY_THRESHOLD / 100) * total_length - 1
+
+# 4.0 Match Index
+class MatchIndex:
+    """Consolidated items indexed by provider IDs, name length and name bigrams."""
+
+    def __init__(self):
+        """Initialize empty indexes."""
+        # 4.1 Consolidated Items in Insertion Order
+        self.items: list[MediaItem] = []
+        self.keys: list[str] = []  # Lowercased name of each item when it was added
+
+        # 4.2 Lookup Tables
+        self._ids = {field: {} for field in ID_FIELDS}  # field -> {(type, ID): position}; IDs are per media type
+        self._by_length = defaultdict(list)
+        self._postings = defaultdict(list)  # bigram -> [(position, count)]
+
+        # 4.3 Batch Mode: Precomputed Matches by Source Row
+        self._row_matches: dict[int, list[int]] = {}
+        self._row_to_pos: dict[int, int] = {}
+
+    # 4.4 Add Item
+    def add(self, item: MediaItem, row: int | None = None) -> int:
+        """Adds a new consolidated item and returns its position; row is its index in the batch."""
+        pos = len(self.items)
+        if row is not None:
+            self._row_to_pos[row] = pos
+        key = item.name.lower()
+        self.items.append(item)
+        self.keys.append(key)
+        self._by_length[len(key)].append(pos)
+        for gram, count in _bigrams(key).items():
+            self._postings[gram].append((pos, count))
+        self.index_ids(pos)
+        return pos
+
+    # 4.5 Index Provider IDs
+    def index_ids(self, pos: int) -> None:
+        """Indexes the current provider IDs of the item at pos under its media type (first owner wins)."""
+        item = self.items[pos]
+        for field in ID_FIELDS:
+            value = getattr(item, field)
+            if value:
+                self._ids[field].setdefault((item.type, value), pos)
+
+    # 4.6 Exact-ID Lookup
+    def find_by_id(self, item: MediaItem) -> tuple[int, str] | None:
+        """Returns (position, field) of the earliest item of the same media type sharing a provider ID."""
+        hits = [
+            (self._ids[field][(item.type, getattr(item, field))], field)
+            for field in ID_FIELDS
+            if getattr(item, field) and (item.type, getattr(item, field)) in self._ids[field]
+        ]
+        return min(hits) if hits else None
+
+    # 4.7 Candidate Blocking
+    def candidates(self, key: str) -> list[int]:
+        """Returns positions (ascending) of items whose names could score above the threshold."""
+        length = len(key)
+        shared = Counter()
+        for gram, count in _bigrams(key).items():
+            for pos, other in self._postings.get(gram, ()):
+                shared[pos] += min(count, other)
+
+        # 4.8 Keep Pairs Passing Length and Shared-Bigram Bounds
+        result = []
+        for other_length, positions in self._by_length.items():
+            if max(length, other_length) >= 1.5 * min(length, other_length):
+                continue
+            bound = _min_shared_bigrams(length + other_length)
+            result.extend(p for p in positions if shared[p] > bound)
+        return sorted(result)
+
+    # 4.9 Batched Fuzzy Scoring
+    def find_fuzzy(self, key: str, accept=None) -> int | None:
+        """Returns the earliest accepted candidate position whose name scores above the threshold."""
+        positions = self.candidates(key)
+        if not positions:
+            return None
+        scores = process.cdist([key], [self.keys[p] for p in positions], scorer=fuzz.ratio)[0]
+        for i in np.flatnonzero(_passes(scores)).tolist():
+            if accept is None or accept(positions[i]):
+                return positions[i]
+        logger.debug("No fuzzy match for {} among {} candidates", key, len(positions))
+        return None
+
+    # 4.10 Full Score Matrix
+    def precompute(self, keys: list[str], rows: list[int] | None = None, workers: int = 1) -> None:
+        """Scores the names at `rows` (default all) against every name with rapidfuzz.process.cdist.
+
+        Rows are scored in chunks of MATRIX_CHUNK_ROWS so memory stays at
+        chunk x n; only the column indexes scoring above the threshold are kept.
+        """
+        rows = list(range(len(keys))) if rows is None else rows
+        self._row_matches = {}
+        for start in range(0, len(rows), MATRIX_CHUNK_ROWS):
+            chunk = rows[start:start + MATRIX_CHUNK_ROWS]
+            matrix = process.cdist(
+                [keys[r] for r in chunk], keys,
+                scorer=fuzz.ratio,
+                score_cutoff=FUZZY_THRESHOLD,
+                dtype=np.float32,
+                workers=workers
+            )
+            for row, scores in zip(chunk, matrix):
+                self._row_matches[row] = np.flatnonzero(_passes(scores)).tolist()
+        logger.debug("Precomputed {}x{} title score matrix", len(rows), len(keys))
+
+    # 4.11 Matrix Lookup
+    def find_fuzzy_row(self, row: int, key: str, accept=None) -> int | None:
+        """Returns the earliest accepted position matching batch row, using the precomputed matrix."""
+        if not key:
+            return None
+        hits = sorted(self._row_to_pos[c] for c in self._row_matches[row] if c in self._row_to_pos)
+        return next((pos for pos in hits if accept is None or accept(pos)), None)
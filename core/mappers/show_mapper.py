@@ -6,47 +6,92 @@
 # Version: 1.0
 
 # 1.0 Imports
-from fuzzywuzzy import fuzz
 from core.data_models import MediaItem
+from core.mappers.match_engine import MatchIndex
+from core.mappers.id_map import IdentityMap, provider_keys
+from core.utils.helpers import load_config
 from core.utils.logger import logger
 
-# 2.0 Mapping Logic
-def map_shows(items: list[MediaItem]) -> list[MediaItem]:
-    """Consolidates media items from multiple sources."""
-    # 2.1 Initialize Result
-    consolidated = {}
+# 2.0 Merge Helper
+def _merge_into(existing: MediaItem, item: MediaItem) -> None:
+    """Folds a duplicate item's IDs and user flags into the consolidated item."""
+    existing.id = f"{existing.id}|{item.id}"
+    existing.tmdb_id = existing.tmdb_id or item.tmdb_id
+    existing.tvmaze_id = existing.tvmaze_id or item.tvmaze_id
+    existing.trakt_id = existing.trakt_id or item.trakt_id
+    existing.tvdb_id = existing.tvdb_id or item.tvdb_id
+    existing.is_favorite |= item.is_favorite
+    existing.is_watchlist |= item.is_watchlist
+
+# 3.0 Mapping Logic
+def map_shows(items: list[MediaItem], batch: bool | None = None, workers: int | None = None,
+              identity: IdentityMap | None = None) -> list[MediaItem]:
+    """Consolidates media items from multiple sources.
+
+    batch scores all names in one rapidfuzz cdist pass across `workers` cores
+    (-1 = all); by default it switches on at mapping.batch_min_items. With an
+    identity table, known titles are grouped from it and only new titles are
+    matched; the table is updated with the result.
+    """
+    # 3.1 Resolve Scoring Mode
+    mapping_config = load_config().get('mapping', {})
+    if batch is None:
+        batch = len(items) >= mapping_config.get('batch_min_items', 500)
+    workers = workers if workers is not None else mapping_config.get('workers', -1)
+    keys = [item.name.lower() for item in items]
+    index = MatchIndex()
+    
+    # 3.2 Seed Clusters from Identity Table
+    pending, group_pos = [], {}
+    for row, item in enumerate(items):
+        group = identity.lookup(item) if identity else None
+        if group is None:
+            pending.append(row)
+        elif group in group_pos:
+            _merge_into(index.items[group_pos[group]], item)
+            index.index_ids(group_pos[group])
+        else:
+            group_pos[group] = index.add(item, row=row)
+    if identity:
+        logger.debug("Identity table resolved {} of {} items", len(items) - len(pending), len(items))
     
-    # 2.2 Group by Name (Fuzzy Matching)
-    for item in items:
-        name = item.name.lower()
-        matched = False
+    # 3.3 Precompute Scores for New Titles
+    if batch and pending:
+        index.precompute(keys, rows=pending, workers=workers)
+    
+    # 3.4 Group New Titles by Provider ID, then Name (Fuzzy Matching)
+    for row in pending:
+        item = items[row]
+        
+        # 3.5 Exact-ID Hash Lookup
+        hit = index.find_by_id(item)
+        if hit:
+            pos, field = hit
+            _merge_into(index.items[pos], item)
+            index.index_ids(pos)
+            logger.debug("Merged by {}: {}", field, item.name)
+            continue
         
-        # 2.3 Check for Existing Match
-        for key, existing in consolidated.items():
-            if item.tmdb_id and item.tmdb_id == existing.tmdb_id:
-                matched = True
-                existing.id = f"{existing.id}|{item.id}"
-                existing.tvmaze_id = existing.tvmaze_id or item.tvmaze_id
-                existing.trakt_id = existing.trakt_id or item.trakt_id
-                existing.is_favorite |= item.is_favorite
-                existing.is_watchlist |= item.is_watchlist
-                logger.debug("Merged by TMDB ID: {}", item.name)
-                break
-            elif fuzz.ratio(name, key.lower()) > 80:
-                matched = True
-                existing.id = f"{existing.id}|{item.id}"
-                existing.tvmaze_id = existing.tvmaze_id or item.tvmaze_id
-                existing.trakt_id = existing.trakt_id or item.trakt_id
-                existing.is_favorite |= item.is_favorite
-                existing.is_watchlist |= item.is_watchlist
-                logger.debug("Merged by fuzzy match: {}", item.name)
-                break
+        # 3.6 Fuzzy Match (Precomputed Matrix or Blocked Candidates), Honoring Split Overrides
+        accept = None
+        if identity and identity.splits:
+            accept = lambda pos: identity.allows(provider_keys(item), provider_keys(index.items[pos]))
+        if batch:
+            pos = index.find_fuzzy_row(row, keys[row], accept)
+        else:
+            pos = index.find_fuzzy(keys[row], accept)
+        if pos is not None:
+            _merge_into(index.items[pos], item)
+            index.index_ids(pos)
+            logger.debug("Merged by fuzzy match: {}", item.name)
+            continue
         
-        # 2.4 Add New Item
-        if not matched:
-            consolidated[name] = item
-            logger.debug("Added new item: {}", item.name)
+        # 3.7 Add New Item
+        index.add(item, row=row)
+        logger.debug("Added new item: {}", item.name)
     
-    # 2.5 Log Completion
-    logger.info("Consolidated {} items", len(consolidated))
-    return list(consolidated.values())
+    # 3.8 Record Identities and Log Completion
+    if identity:
+        identity.record(index.items)
+    logger.info("Consolidated {} items", len(index.items))
+    return index.items
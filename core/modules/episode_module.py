@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# File: episode_module.py
+# Description: Episode pipeline: fetch seasons/episodes/schedules of tracked TVMaze shows and store changed seasons
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from concurrent.futures import ThreadPoolExecutor
+from core.data_models import MediaItem
+from core.db.episode_repo import save_show_episodes
+from core.fetchers.episode_fetcher import fetch_show, parse_seasons, season_hash, upcoming_episodes
+from core.utils.helpers import load_config
+from core.utils.logger import logger
+
+# 2.0 Tracked Shows
+def tracked_show_ids(items: list[MediaItem]) -> list[int]:
+    """Returns TVMaze IDs of TV items on the favorites or watchlist."""
+    return sorted({
+        i.tvmaze_id for i in items
+        if i.tvmaze_id and i.type == 'tv' and (i.is_favorite or i.is_watchlist)
+    })
+
+# 3.0 Refresh Pipeline
+def refresh_episodes(items: list[MediaItem]) -> dict[str, int]:
+    """Fetches each tracked show in one embedded request and persists only seasons whose content changed."""
+    # 3.1 Fetch Shows Concurrently (Bounded by the TVMaze Scheduler)
+    show_ids = tracked_show_ids(items)
+    if not show_ids:
+        return {'shows': 0, 'seasons': 0, 'episodes': 0}
+    workers = load_config().get('rate_limits', {}).get('tvmaze', {}).get('max_concurrency', 2)
+    shows, failed = {}, []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="episodes") as executor:
+        futures = {show_id: executor.submit(fetch_show, show_id) for show_id in show_ids}
+        for show_id, future in futures.items():
+            try:
+                shows[show_id] = future.result()
+            except Exception as e:
+                failed.append(show_id)
+                logger.error("Episode fetch failed for show {}: {}", show_id, str(e))
+    
+    # 3.2 Parse into Seasons, Fingerprints and Upcoming Airings
+    parsed, schedule = {}, {}
+    for show_id, show in shows.items():
+        seasons = parse_seasons(show)
+        parsed[show_id] = [(season, season_hash(season)) for season in seasons]
+        schedule[show_id] = upcoming_episodes(show, seasons)
+    
+    # 3.3 Persist Changed Seasons in One Bulk Write
+    seasons_written, episodes_written = save_show_episodes(parsed, schedule)
+    logger.info("Episode refresh: {} shows, {} failed", len(shows), len(failed))
+    return {'shows': len(shows), 'seasons': seasons_written, 'episodes': episodes_written}
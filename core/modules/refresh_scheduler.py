@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# File: refresh_scheduler.py
+# Description: Background thread that refreshes the shared watchlist store (stale-while-revalidate) and episode data
+#              on a fixed interval
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import threading
+from core.modules.episode_module import refresh_episodes
+from core.modules.watchlist_store import WatchlistStore
+from core.utils.logger import logger
+
+# 2.0 Refresh Scheduler
+class RefreshScheduler:
+    """Runs store refreshes off the UI thread; readers keep the last good snapshot until a new one is published."""
+
+    def __init__(self, store: WatchlistStore, interval_minutes: float = 30, run_on_start: bool = True,
+                 episodes: bool = True):
+        """Initialize for a store and refresh interval; episodes also refreshes tracked shows' episodes."""
+        self.store = store
+        self.interval = interval_minutes * 60
+        self.run_on_start = run_on_start
+        self.episodes = episodes
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # 2.1 Lifecycle
+    def start(self) -> None:
+        """Starts the daemon refresh thread once."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="watchlist-refresh", daemon=True)
+        self._thread.start()
+        logger.info("Background refresh every {:.0f} min", self.interval / 60)
+
+    def stop(self) -> None:
+        """Asks the refresh thread to exit after its current refresh."""
+        self._stop.set()
+        self._wake.set()
+
+    # 2.2 Manual Trigger
+    def trigger(self) -> None:
+        """Requests an immediate refresh without blocking the caller."""
+        self._wake.set()
+
+    # 2.3 Refresh Loop
+    def _run(self) -> None:
+        """Refreshes, then sleeps until the interval elapses or a trigger arrives."""
+        due = self.run_on_start
+        while not self._stop.is_set():
+            if due:
+                try:
+                    self.store.refresh()
+                    if self.episodes:
+                        refresh_episodes(list(self.store.current().items))
+                except Exception as e:
+                    logger.error("Background refresh failed: {}", str(e))
+            due = True
+            self._wake.wait(self.interval)
+            self._wake.clear()
@@ -1,68 +1,201 @@
 ```python
 # -*- coding: utf-8 -*-
 # File: watchlist_module.py
-# Description: Core module for managing watchlist and favorites across APIs (uses JSON storage)
+# Description: Core module for managing watchlist and favorites across APIs (uses configured storage backend)
 # Author: Grok 4 (xAI)
 # Created: 2025-10-10
 # Version: 1.0
 
 # 1.0 Imports
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from core.data_models import MediaItem
 from core.fetchers import tvmaze_fetcher, tmdb_fetcher, trakt_fetcher
 from core.mappers import map_shows
-from core.db.crud import upsert_media_items
+from core.mappers.id_map import IdentityMap
+from core.db.repository import load_media_items, prune_media_items, upsert_media_items
+from core.db import sync_state
 from core.syncers import tvmaze_syncer, tmdb_syncer, trakt_syncer
+from core.utils.helpers import load_config
 from core.utils.logger import logger
 
-# 2.0 Fetch Watchlist
-def get_personal_watchlist() -> list[MediaItem]:
-    """Fetches and consolidates watchlist/favorites from all sources."""
-    # 2.1 Fetch Data
+# 2.0 Concurrent Fetch Stage
+PROVIDER_FETCHERS = {
+    'tvmaze': tvmaze_fetcher,
+    'tmdb': tmdb_fetcher,
+    'trakt': trakt_fetcher,
+}
+
+def enabled_providers() -> list[str]:
+    """Returns providers switched on in the api config."""
+    api_config = load_config().get('api', {})
+    return [p for p in PROVIDER_FETCHERS if api_config.get(f"{p}_enabled", True)]
+
+def fetch_all_providers(timeout: float | None = None) -> tuple[dict[str, list[MediaItem]], dict[str, str]]:
+    """Fetches all enabled providers in parallel; returns (results, errors) keyed by provider."""
+    # 2.1 Resolve Enabled Providers
+    api_config = load_config().get('api', {})
+    timeout = timeout if timeout is not None else api_config.get('fetch_timeout', 30)
+    enabled = enabled_providers()
+    results, errors = {}, {}
+    if not enabled:
+        logger.warning("No providers enabled for fetch")
+        return results, errors
+    
+    # 2.2 Submit One Task per Provider
+    executor = ThreadPoolExecutor(
+        max_workers=api_config.get('fetch_workers', len(enabled)),
+        thread_name_prefix="fetch"
+    )
+    futures = {
+        p: executor.submit(PROVIDER_FETCHERS[p].get_favorites_and_watchlist)
+        for p in enabled
+    }
+    
+    # 2.3 Collect Results Against Per-Provider Deadline
+    deadline = time.monotonic() + timeout
+    for provider, future in futures.items():
+        try:
+            results[provider] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            errors[provider] = f"timed out after {timeout}s"
+            logger.error("{} fetch timed out after {}s", provider, timeout)
+        except Exception as e:
+            errors[provider] = str(e)
+            logger.error("{} fetch failed: {}", provider, str(e))
+    
+    # 2.4 Release Workers Without Blocking on Stragglers
+    executor.shutdown(wait=False, cancel_futures=True)
+    return results, errors
+
+# 3.0 Fetch Watchlist
+def _carried_records(previous: list[MediaItem], provider: str, state: dict) -> list[MediaItem]:
+    """Rebuilds a failed provider's source records from previously consolidated items.
+
+    Each record keeps only the provider's own key and ID, and the flags the
+    provider last reported (from the sync state), so it re-merges into the
+    same title without claiming flags another provider set.
+    """
+    prefix = f"{provider}:"
+    id_field = sync_state.PROVIDER_ID_FIELDS[provider]
+    flags = sync_state.PROVIDER_FLAGS[provider]
+    records = []
+    for item in previous:
+        keys = [k for k in item.id.split("|") if k.startswith(prefix)]
+        if not keys:
+            continue
+        remote = state[provider].get(sync_state.state_key(item, provider), {})
+        update = {'id': "|".join(keys)}
+        update.update({f: None for f in sync_state.PROVIDER_ID_FIELDS.values() if f != id_field})
+        update.update({f: remote.get(f, getattr(item, f)) if f in flags else False
+                       for f in ('is_favorite', 'is_watchlist')})
+        records.append(item.model_copy(update=update))
+    return records
+
+def refresh_watchlist(previous: list[MediaItem] | None = None) -> tuple[list[MediaItem], dict[str, str]]:
+    """Fetches and consolidates all sources; returns (items, errors keyed by failed provider).
+
+    A failed provider's titles are carried over from previous (default: the
+    stored items) so a partial refresh never drops them.
+    """
+    # 3.1 Fetch Data
     logger.info("Starting watchlist fetch")
-    tvmaze_data = tvmaze_fetcher.get_favorites_and_watchlist()
-    tmdb_data = tmdb_fetcher.get_favorites_and_watchlist()
-    trakt_data = trakt_fetcher.get_favorites_and_watchlist()
+    results, errors = fetch_all_providers()
+    
+    # 3.2 Log Fetch Results
+    logger.debug("Fetched {}", {p: len(items) for p, items in results.items()})
+    if errors:
+        logger.warning("Partial refresh, failed providers: {}", ", ".join(sorted(errors)))
     
-    # 2.2 Log Fetch Results
-    logger.debug("Fetched {} TVMaze, {} TMDB, {} Trakt items", 
-                 len(tvmaze_data), len(tmdb_data), len(trakt_data))
+    # 3.3 Record What Each Provider Holds (Baseline for Delta Sync)
+    state = sync_state.load_sync_state()
+    for provider, items in results.items():
+        sync_state.record_remote_state(state, provider, items)
+    sync_state.save_sync_state(state)
     
-    # 2.3 Consolidate Data
-    combined = map_shows(tvmaze_data + tmdb_data + trakt_data)
+    # 3.3.1 Carry Over Failed Providers' Titles from the Last Known Items
+    sources = dict(results)
+    if errors:
+        previous = previous if previous is not None else load_media_items()
+        for provider in errors:
+            sources[provider] = _carried_records(previous, provider, state)
+            logger.info("Carried over {} {} items from the last refresh", len(sources[provider]), provider)
     
-    # 2.4 Save to JSON
+    # 3.4 Consolidate Data (Known Titles Resolved from the Identity Table)
+    identity = IdentityMap.load()
+    combined = map_shows([i for items in sources.values() for i in items], identity=identity)
+    identity.save()
+    
+    # 3.5 Save to Storage (Dropping Re-Keyed and Removed Titles), Then Advance TVMaze's Update Timestamps
     upsert_media_items(combined)
+    prune_media_items({i.id for i in combined})
+    if 'tvmaze' in results:
+        tvmaze_fetcher.commit_fetch_state(results['tvmaze'])
     
-    # 2.5 Log Completion
+    # 3.6 Log Completion
     logger.info("Consolidated {} unique items", len(combined))
-    return combined
+    return combined, errors
+
+def get_personal_watchlist() -> list[MediaItem]:
+    """Fetches and consolidates watchlist/favorites from all sources."""
+    return refresh_watchlist()[0]
+
+# 4.0 Edit and Sync
+PROVIDER_SYNCERS = {
+    'tvmaze': (tvmaze_syncer, 'sync_to_tvmaze'),
+    'tmdb': (tmdb_syncer, 'sync_to_tmdb'),
+    'trakt': (trakt_syncer, 'sync_to_trakt'),
+}
+
+def edit_and_sync(watchlist: list[MediaItem], changes: dict) -> dict[str, bool]:
+    """Applies edits and pushes only the flags that differ from each provider's last-synced state.
 
-# 3.0 Edit and Sync
-def edit_and_sync(watchlist: list[MediaItem], changes: dict) -> bool:
-    """Applies edits and syncs to APIs."""
-    # 3.1 Apply Changes
+    Returns success per changed item ID; an item fails if any provider push for it failed.
+    """
+    # 4.1 Apply Changes
     logger.info("Applying changes and syncing")
+    by_id = {i.id: i for i in watchlist}
+    changed = []
     for item_id, updates in changes.items():
-        item = next(i for i in watchlist if i.id == item_id)
+        item = by_id.get(item_id)
+        if item is None:
+            logger.warning("Skipping edit for unknown item {}", item_id)
+            continue
         for k, v in updates.items():
             setattr(item, k, v)
-    # 3.2 Save Updated Watchlist to JSON
-    upsert_media_items(watchlist)
+        changed.append(item)
+    # 4.2 Save Changed Items to Storage
+    upsert_media_items(changed)
     
-    # 3.3 Prepare Sync Data
-    tvmaze_deltas = [i for i in watchlist if i.tvmaze_id]
-    tmdb_deltas = [i for i in watchlist if i.tmdb_id]
-    trakt_deltas = [i for i in watchlist if i.trakt_id]
+    # 4.3 Plan Minimal Mutations
+    state = sync_state.load_sync_state()
+    plan = sync_state.plan_mutations(changed, state)
     
-    # 3.4 Sync to APIs
-    success = all([
-        tvmaze_syncer.sync_to_tvmaze(tvmaze_deltas),
-        tmdb_syncer.sync_to_tmdb(tmdb_deltas),
-        trakt_syncer.sync_to_trakt(trakt_deltas)
-    ])
+    # 4.4 Sync to APIs
+    results = {item.id: True for item in changed}
+    for provider, fields in plan.items():
+        if not fields:
+            continue
+        targets = [i for i in changed if i.id in fields]
+        module, func_name = PROVIDER_SYNCERS[provider]
+        try:
+            outcome = getattr(module, func_name)(targets, fields)
+        except Exception as e:
+            logger.error("{} sync failed: {}", provider, str(e))
+            outcome = {i.id: False for i in targets}
+        
+        # 4.5 Record Successful Pushes
+        for item in targets:
+            ok = outcome.get(item.id, False)
+            results[item.id] &= ok
+            if ok:
+                sync_state.mark_synced(state, provider, item, fields[item.id])
+    sync_state.save_sync_state(state)
     
-    # 3.5 Log Completion
-    logger.info("Sync {}", "complete" if success else "failed")
-    return success
+    # 4.6 Log Completion
+    failed = [item_id for item_id, ok in results.items() if not ok]
+    logger.info("Sync complete: {}/{} items succeeded", len(results) - len(failed), len(results))
+    return results
 ```
 
 
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# File: watchlist_store.py
+# Description: Process-wide watchlist store publishing immutable, versioned snapshots shared by all UI sessions,
+#              with per-provider last-success timestamps
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from core.data_models import MediaItem
+from core.db.repository import load_media_items, upsert_media_items
+from core.modules.watchlist_module import refresh_watchlist, enabled_providers, edit_and_sync
+from core.utils.image_cache import prefetch_in_background
+from core.utils.logger import logger
+
+# 1.1 Provider Status File
+REFRESH_STATUS_FILE = Path("data/refresh_status.json")
+
+# 2.0 Snapshot
+@dataclass(frozen=True)
+class WatchlistSnapshot:
+    """One committed version of the watchlist; never mutated after publish."""
+    version: int
+    items: tuple[MediaItem, ...]
+    changed_ids: frozenset[str] | None = None  # IDs edited since the previous version; None after a full refresh
+    by_id: dict[str, MediaItem] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Indexes items by ID once per version."""
+        object.__setattr__(self, 'by_id', {i.id: i for i in self.items})
+
+# 3.0 Shared Store
+class WatchlistStore:
+    """Holds the current snapshot; refreshes and syncs commit new versions under one writer lock.
+
+    Refreshes run one at a time under their own lock and fetch without the
+    writer lock, so a sync never waits on the network fetch of a refresh.
+    """
+
+    def __init__(self):
+        """Initialize with an empty version-0 snapshot and the persisted provider status."""
+        self._snapshot = WatchlistSnapshot(0, ())
+        self._write_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._edited_ids: set[str] = set()  # Items synced since the running refresh started fetching
+        self._refreshing = threading.Event()
+        self.provider_status: dict[str, dict] = {}  # Provider -> {'last_success': ISO time, 'last_error': str | None}
+        if REFRESH_STATUS_FILE.exists():
+            self.provider_status = json.loads(REFRESH_STATUS_FILE.read_text())
+
+    # 3.1 Read Current Version
+    def current(self) -> WatchlistSnapshot:
+        """Returns the latest committed snapshot (a plain attribute read, safe without locking)."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Returns the latest committed version number."""
+        return self._snapshot.version
+
+    @property
+    def refreshing(self) -> bool:
+        """True while a provider refresh is running."""
+        return self._refreshing.is_set()
+
+    def last_success(self, provider: str) -> datetime | None:
+        """Returns when a provider last fetched successfully, if ever."""
+        stamp = self.provider_status.get(provider, {}).get('last_success')
+        return datetime.fromisoformat(stamp) if stamp else None
+
+    # 3.1.1 Warm Start
+    def load_stored(self) -> WatchlistSnapshot:
+        """Publishes the items already in storage so the UI has data before the first refresh completes."""
+        with self._write_lock:
+            if self._snapshot.version == 0:
+                items = load_media_items()
+                if items:
+                    snapshot = self.publish(items)
+                    prefetch_in_background(items)
+                    return snapshot
+            return self._snapshot
+
+    # 3.2 Commit a New Version
+    def publish(self, items: list[MediaItem], changed_ids: set[str] | None = None) -> WatchlistSnapshot:
+        """Commits items as the next version; callers must hold the writer lock."""
+        snapshot = WatchlistSnapshot(
+            self._snapshot.version + 1,
+            tuple(items),
+            frozenset(changed_ids) if changed_ids is not None else None
+        )
+        self._snapshot = snapshot
+        logger.info("Published watchlist version {} ({} items)", snapshot.version, len(snapshot.items))
+        return snapshot
+
+    # 3.3 Refresh from Providers
+    def refresh(self, seen_version: int | None = None) -> WatchlistSnapshot:
+        """Refetches all providers once; sessions that queued behind a running refresh reuse its result."""
+        with self._refresh_lock:
+            if seen_version is not None and self._snapshot.version != seen_version:
+                logger.debug("Skipping refresh, version {} already newer than {}", self._snapshot.version, seen_version)
+                return self._snapshot
+            
+            # 3.3.1 Fetch and Consolidate Without the Writer Lock
+            with self._write_lock:
+                base = self._snapshot
+                self._edited_ids = set()
+            self._refreshing.set()
+            try:
+                items, errors = refresh_watchlist(list(base.items) if base.version else None)
+            finally:
+                self._refreshing.clear()
+            
+            # 3.3.2 Record Provider Outcomes
+            providers = enabled_providers()
+            self._record_status(providers, errors)
+            
+            # 3.3.3 Keep Serving the Last Good Snapshot if Every Provider Failed
+            if providers and len(errors) == len(providers):
+                logger.warning("All providers failed, keeping watchlist version {}", self._snapshot.version)
+                return self._snapshot
+            
+            # 3.3.4 Publish, Keeping Edits Synced While the Fetch Ran
+            with self._write_lock:
+                current = self._snapshot
+                edited = {i: current.by_id[i] for i in self._edited_ids if i in current.by_id}
+                if edited:
+                    items = [edited.get(i.id, i) for i in items]
+                    upsert_media_items([i for i in items if i.id in edited])
+                    logger.info("Kept {} edits synced during refresh", len(edited))
+                snapshot = self.publish(items)
+            
+            # 3.3.5 Cache Thumbnails in the Background (Tables Show Remote URLs Until Then)
+            prefetch_in_background(items)
+            return snapshot
+
+    def _record_status(self, providers: list[str], errors: dict[str, str]) -> None:
+        """Stamps successful providers with the current time and keeps the last error of failed ones."""
+        now = datetime.now(timezone.utc).isoformat()
+        for provider in providers:
+            status = self.provider_status.setdefault(provider, {'last_success': None, 'last_error': None})
+            if provider in errors:
+                status['last_error'] = errors[provider]
+            else:
+                status.update(last_success=now, last_error=None)
+        REFRESH_STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        REFRESH_STATUS_FILE.write_text(json.dumps(self.provider_status))
+
+    # 3.4 Edit and Sync
+    def sync(self, changes: dict) -> tuple[WatchlistSnapshot, dict[str, bool]]:
+        """Applies edits to copies of the changed items, syncs them and commits the result as a new version."""
+        with self._write_lock:
+            items = [i.model_copy() if i.id in changes else i for i in self._snapshot.items]
+            results = edit_and_sync(items, changes)
+            self._edited_ids.update(changes)
+            return self.publish(items, set(changes)), results
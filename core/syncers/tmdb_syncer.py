@@ -10,12 +10,15 @@
 from tmdbv3api import TMDb, Account
 from core.data_models import MediaItem
 from core.utils.logger import logger
-from core.utils.helpers import load_env_vars, retry_api
+from core.utils.helpers import get_tmdb_session, load_env_vars, retry_api
 
 # 2.0 Sync Logic
 @retry_api()
-def sync_to_tmdb(items: list[MediaItem]) -> bool:
-    """Syncs changed items to TMDB favorites/watchlist."""
+def sync_to_tmdb(items: list[MediaItem], fields: dict[str, list[str]] | None = None) -> dict[str, bool]:
+    """Syncs changed items to TMDB favorites/watchlist; returns success per item ID.
+
+    fields maps item ID to the flags to push; None pushes both.
+    """
     # 2.1 Load Environment Variables
     env_vars = load_env_vars()
     api_key = env_vars.get('API_TMDB_KEY')
@@ -24,41 +27,46 @@ def sync_to_tmdb(items: list[MediaItem]) -> bool:
     # 2.2 Validate Credentials
     if not api_key or not token:
         logger.critical("Missing TMDB credentials")
-        return False
+        return {item.id: False for item in items}
     
     # 2.3 Initialize TMDB Client
-    tmdb = TMDb()
+    tmdb = TMDb(session=get_tmdb_session())
     tmdb.api_key = api_key
-    account = Account()
+    account = Account(session=get_tmdb_session())
     
     # 2.4 Sync Items
+    results = {}
     for item in items:
         if not item.tmdb_id:
             logger.warning("Skipping sync for {}: No TMDB ID", item.name)
             continue
+        pending = fields.get(item.id, ()) if fields is not None else ('is_favorite', 'is_watchlist')
         try:
             # 2.5 Update Favorite Status
-            account.mark_as_favorite(
-                session_id=token,
-                media_type=item.type,
-                media_id=item.tmdb_id,
-                favorite=item.is_favorite
-            )
-            logger.info("Updated {} favorite status on TMDB", item.name)
+            if 'is_favorite' in pending:
+                account.mark_as_favorite(
+                    session_id=token,
+                    media_type=item.type,
+                    media_id=item.tmdb_id,
+                    favorite=item.is_favorite
+                )
+                logger.info("Updated {} favorite status on TMDB", item.name)
             
             # 2.6 Update Watchlist Status
-            account.add_to_watchlist(
-                session_id=token,
-                media_type=item.type,
-                media_id=item.tmdb_id,
-                watchlist=item.is_watchlist
-            )
-            logger.info("Updated {} watchlist status on TMDB", item.name)
+            if 'is_watchlist' in pending:
+                account.add_to_watchlist(
+                    session_id=token,
+                    media_type=item.type,
+                    media_id=item.tmdb_id,
+                    watchlist=item.is_watchlist
+                )
+                logger.info("Updated {} watchlist status on TMDB", item.name)
+            results[item.id] = True
         except Exception as e:
             logger.error("Failed to sync {}: {}", item.name, str(e))
-            return False
+            results[item.id] = False
     
     # 2.7 Log Completion
-    logger.info("TMDB sync complete")
-    return True
+    logger.info("TMDB sync complete: {}/{} succeeded", sum(results.values()), len(results))
+    return results
 ```
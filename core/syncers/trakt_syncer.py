@@ -7,41 +7,100 @@
 # Version: 1.0
 
 # 1.0 Imports
-from trakt.users import User
 from core.data_models import MediaItem
+from core.fetchers.trakt_fetcher import drop_list_cache, get_list_activity, patch_list_cache
 from core.utils.logger import logger
 from core.utils.helpers import get_trakt_oauth_session, retry_api
 
-# 2.0 Sync Logic
+# 2.0 Bulk Endpoint Settings
+TRAKT_API_URL = "https://api.trakt.tv"
+BATCH_SIZE = 100  # Shows + movies per sync request
+
+# 3.0 Batch Helpers
+def _list_activity(trakt) -> dict | None:
+    """Reads the list activity stamps; None if the request fails (the sync itself goes ahead)."""
+    try:
+        return get_list_activity(trakt)
+    except Exception as e:
+        logger.warning("Could not read Trakt list activity: {}", str(e))
+        return None
+
+def _media_key(item: MediaItem) -> str:
+    """Returns the Trakt sync payload key for an item's type."""
+    return 'movies' if item.type == 'movie' else 'shows'
+
+def _post_batch(trakt, path: str, batch: list[MediaItem]) -> tuple[dict, set[tuple[str, int]]]:
+    """Posts one chunk to a Trakt sync endpoint; returns (counts, not-found (payload key, Trakt ID) pairs)."""
+    # 3.1 Build Payload
+    payload = {'shows': [], 'movies': []}
+    for item in batch:
+        payload[_media_key(item)].append({'ids': {'trakt': item.trakt_id}})
+    
+    # 3.2 Send Request
+    response = trakt.post(f"{TRAKT_API_URL}{path}", json=payload)
+    response.raise_for_status()
+    data = response.json()
+    
+    # 3.3 Parse Added/Deleted, Existing and Not-Found (Trakt Numbers Shows and Movies Separately)
+    counts = {
+        section: sum(data.get(section, {}).get(k, 0) for k in ('shows', 'movies'))
+        for section in ('added', 'deleted', 'existing')
+    }
+    not_found = {
+        (k, entry.get('ids', {}).get('trakt'))
+        for k in ('shows', 'movies')
+        for entry in data.get('not_found', {}).get(k, [])
+    }
+    return counts, not_found
+
+# 4.0 Sync Logic
 @retry_api()
-def sync_to_trakt(items: list[MediaItem]) -> bool:
-    """Syncs changed items to Trakt watchlist/favorites."""
-    # 2.1 Initialize OAuth Session
+def sync_to_trakt(items: list[MediaItem], fields: dict[str, list[str]] | None = None) -> dict[str, bool]:
+    """Syncs changed items to the Trakt watchlist in chunked bulk requests; returns success per item ID."""
+    # 4.1 Initialize OAuth Session and Note List Activity Before Pushing
     trakt = get_trakt_oauth_session()
-    user = User('me', client=trakt)
+    before = _list_activity(trakt)
     
-    # 2.2 Sync Items
+    # 4.2 Group Additions and Removals
+    additions, removals = [], []
     for item in items:
         if not item.trakt_id:
             logger.warning("Skipping sync for {}: No Trakt ID", item.name)
             continue
-        try:
-            # 2.3 Update Watchlist Status
-            if item.is_watchlist:
-                user.add_to_watchlist({'ids': {'trakt': item.trakt_id}})
-                logger.info("Added {} to Trakt watchlist", item.name)
-            else:
-                user.remove_from_watchlist({'ids': {'trakt': item.trakt_id}})
-                logger.info("Removed {} from Trakt watchlist", item.name)
+        if fields is not None and 'is_watchlist' not in fields.get(item.id, ()):
+            continue
+        (additions if item.is_watchlist else removals).append(item)
+    # Trakt favorites are not synced yet; only the watchlist flag is pushed
+    
+    # 4.3 Send Chunked Bulk Requests
+    results = {}
+    for path, group in (("/sync/watchlist", additions), ("/sync/watchlist/remove", removals)):
+        for start in range(0, len(group), BATCH_SIZE):
+            batch = group[start:start + BATCH_SIZE]
+            try:
+                counts, not_found = _post_batch(trakt, path, batch)
+            except Exception as e:
+                logger.error("Trakt {} batch of {} failed: {}", path, len(batch), str(e))
+                results.update({item.id: False for item in batch})
+                continue
             
-            # 2.4 Update Favorite Status (Note: Trakt favorites are less common)
-            # Trakt API may require custom handling for favorites; placeholder
-            logger.debug("Favorite sync not implemented for {}", item.name)
-        except Exception as e:
-            logger.error("Failed to sync {}: {}", item.name, str(e))
-            return False
+            # 4.4 Mark Per-Item Outcome
+            for item in batch:
+                results[item.id] = (_media_key(item), item.trakt_id) not in not_found
+                if not results[item.id]:
+                    logger.warning("Trakt could not find {} (trakt:{})", item.name, item.trakt_id)
+            logger.info("Trakt {}: {} (batch of {}, {} not found)", path, counts, len(batch), len(not_found))
+    
+    # 4.5 Fold Our Own Pushes into the Fetch Cache So the Next Refresh Can Still Skip the Download
+    pushed = [item for item in additions + removals if results.get(item.id)]
+    if pushed:
+        after = _list_activity(trakt)
+        if before is None or after is None:
+            drop_list_cache("list activity unavailable around sync")
+        else:
+            patch_list_cache(pushed, before, after)
     
-    # 2.5 Log Completion
-    logger.info("Trakt sync complete")
-    return True
+    # 4.6 Log Completion
+    logger.info("Trakt sync complete: {}/{} succeeded", sum(results.values()), len(results))
+    return results
 ```
@@ -7,15 +7,14 @@
 # Version: 1.0
 
 # 1.0 Imports
-import requests
 from core.data_models import MediaItem
 from core.utils.logger import logger
-from core.utils.helpers import load_env_vars, retry_api
+from core.utils.helpers import get_tvmaze_session, load_env_vars, retry_api
 
 # 2.0 Sync Logic
 @retry_api()
-def sync_to_tvmaze(items: list[MediaItem]) -> bool:
-    """Syncs changed items to TVMaze favorites."""
+def sync_to_tvmaze(items: list[MediaItem], fields: dict[str, list[str]] | None = None) -> dict[str, bool]:
+    """Syncs changed items to TVMaze favorites; returns success per item ID."""
     # 2.1 Load Environment Variables
     env_vars = load_env_vars()
     email = env_vars.get('API_TVMAZE_EMAIL')
@@ -24,33 +23,35 @@ def sync_to_tvmaze(items: list[MediaItem]) -> bool:
     # 2.2 Validate Credentials
     if not email or not api_key:
         logger.critical("Missing TVMaze credentials")
-        return False
+        return {item.id: False for item in items}
     
     # 2.3 Sync Items
-    headers = {"Authorization": f"Bearer {api_key}"}
+    session = get_tvmaze_session()
+    results = {}
     for item in items:
         if not item.tvmaze_id:
             logger.warning("Skipping sync for {}: No TVMaze ID", item.name)
             continue
+        if fields is not None and 'is_favorite' not in fields.get(item.id, ()):
+            continue
         try:
             # 2.4 Update Favorite Status
             if item.is_favorite:
-                requests.post(
-                    f"https://api.tvmaze.com/v1/user/{email}/favorites/{item.tvmaze_id}",
-                    headers=headers
+                session.post(
+                    f"https://api.tvmaze.com/v1/user/{email}/favorites/{item.tvmaze_id}"
                 ).raise_for_status()
                 logger.info("Added {} to TVMaze favorites", item.name)
             else:
-                requests.delete(
-                    f"https://api.tvmaze.com/v1/user/{email}/favorites/{item.tvmaze_id}",
-                    headers=headers
+                session.delete(
+                    f"https://api.tvmaze.com/v1/user/{email}/favorites/{item.tvmaze_id}"
                 ).raise_for_status()
                 logger.info("Removed {} from TVMaze favorites", item.name)
+            results[item.id] = True
         except Exception as e:
             logger.error("Failed to sync {}: {}", item.name, str(e))
-            return False
+            results[item.id] = False
     
     # 2.5 Log Completion
-    logger.info("TVMaze sync complete")
-    return True
+    logger.info("TVMaze sync complete: {}/{} succeeded", sum(results.values()), len(results))
+    return results
 ```
@@ -8,9 +8,17 @@
 
 # 1.0 Imports
 import os
+import json
+import time
+import threading
+from functools import lru_cache, wraps
+import yaml
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from requests_oauthlib import OAuth2Session
 from core.utils.logger import logger
+from core.utils.rate_limiter import ProviderScheduler, get_scheduler, parse_retry_after
 
 # 2.0 Environment Setup
 def load_env_vars() -> dict:
@@ -34,7 +42,7 @@ def load_env_vars() -> dict:
     return env_vars
 
 # 3.0 OAuth2 Helper for Trakt
-def get_trakt_oauth_session() -> OAuth2Session:
+def _create_trakt_oauth_session() -> OAuth2Session:
     """Creates an OAuth2 session for Trakt API."""
     # 3.1 Load Client Credentials
     env_vars = load_env_vars()
@@ -67,7 +75,14 @@ def get_trakt_oauth_session() -> OAuth2Session:
         # Note: Manual step; future module can automate via web UI
         raise NotImplementedError("Manual OAuth flow required; save token to data/trakt_token.json")
     
-    # 3.6 Log Session Creation
+    # 3.6 Apply Pooling and Trakt API Headers
+    _configure_session(trakt, "trakt", {
+        'Content-Type': 'application/json',
+        'trakt-api-version': '2',
+        'trakt-api-key': client_id
+    })
+    
+    # 3.7 Log Session Creation
     logger.debug("Trakt OAuth session initialized")
     return trakt
 
@@ -90,4 +105,133 @@ def retry_api(max_attempts: int = 3, backoff_factor: int = 2):
                     time.sleep(backoff_factor ** attempt)
         return wrapper
     return decorator
+
+# 5.0 App Configuration
+@lru_cache(maxsize=None)
+def load_config(config_path: str = "config/app_config.yaml") -> dict:
+    """Loads app settings from app_config.yaml (cached per path; a failed load raises and is not cached)."""
+    # 5.1 Read YAML
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.critical("Failed to load config {}: {}", config_path, str(e))
+        raise
+
+    # 5.2 Reject Non-Mapping Documents
+    if not isinstance(config, dict):
+        logger.critical("Config {} is not a mapping", config_path)
+        raise ValueError(f"Config {config_path} must be a YAML mapping")
+
+    # 5.3 Log Loaded Sections
+    logger.debug("Loaded config sections: {}", list(config.keys()))
+    return config
+
+# 6.0 Pooled HTTP Sessions
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout and routes requests through a provider scheduler."""
+
+    def __init__(self, timeout=None, scheduler: ProviderScheduler | None = None, **kwargs):
+        """Initialize adapter with a default (connect, read) timeout and optional rate scheduler."""
+        self.timeout = timeout
+        self.scheduler = scheduler
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        """Sends the request within the provider's rate/concurrency limits, honoring Retry-After on 429."""
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        if self.scheduler is None:
+            return super().send(request, **kwargs)
+        
+        # 6.1 Send Under Scheduler, Pausing the Provider on 429
+        for attempt in range(self.scheduler.max_retries + 1):
+            with self.scheduler.slot():
+                response = super().send(request, **kwargs)
+            if response.status_code != 429 or attempt == self.scheduler.max_retries:
+                return response
+            self.scheduler.throttled(parse_retry_after(response.headers.get('Retry-After'), 2 ** attempt))
+            response.close()
+        return response
+
+def _configure_session(session: requests.Session, provider: str, headers: dict) -> requests.Session:
+    """Mounts a pooled adapter and default headers on a provider session."""
+    # 6.2 Pool, Timeout and Rate Limit Settings
+    config = load_config()
+    http_config = config.get('http', {})
+    adapter = PooledHTTPAdapter(
+        timeout=(http_config.get('connect_timeout', 5), http_config.get('read_timeout', 30)),
+        scheduler=get_scheduler(provider, config.get('rate_limits', {})),
+        pool_connections=http_config.get('pool_connections', 4),
+        pool_maxsize=http_config.get('pool_maxsize', 10)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    # 6.3 Default Headers (Compression, JSON, Auth)
+    session.headers.update({
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip, deflate',
+        'User-Agent': 'MY_Fav_Shows-TV_Portal/1.0'
+    })
+    session.headers.update(headers)
+    logger.debug("Configured pooled {} session", provider)
+    return session
+
+def _get_session(provider: str, factory) -> requests.Session:
+    """Returns the shared session for a provider, creating it once (thread-safe)."""
+    with _SESSIONS_LOCK:
+        if provider not in _SESSIONS:
+            _SESSIONS[provider] = factory()
+        return _SESSIONS[provider]
+
+def _create_tvmaze_session() -> requests.Session:
+    """Creates a pooled TVMaze session with bearer auth."""
+    api_key = load_env_vars().get('API_TVMAZE_KEY')
+    if not api_key:
+        logger.critical("Missing TVMaze credentials")
+        raise ValueError("TVMaze API key not set")
+    return _configure_session(requests.Session(), "tvmaze", {"Authorization": f"Bearer {api_key}"})
+
+def _create_tmdb_session() -> requests.Session:
+    """Creates a pooled TMDB session carrying the API key."""
+    api_key = load_env_vars().get('API_TMDB_KEY')
+    if not api_key:
+        logger.critical("Missing TMDB credentials")
+        raise ValueError("TMDB API key not set")
+    session = _configure_session(requests.Session(), "tmdb", {})
+    session.params = {'api_key': api_key}
+    return session
+
+def _create_image_session() -> requests.Session:
+    """Creates a pooled session for poster downloads (no auth, image accept header)."""
+    return _configure_session(requests.Session(), "images", {'Accept': 'image/*'})
+
+# 6.4 Public Accessors
+def get_tvmaze_session() -> requests.Session:
+    """Returns the shared TVMaze session."""
+    return _get_session("tvmaze", _create_tvmaze_session)
+
+def get_tmdb_session() -> requests.Session:
+    """Returns the shared TMDB session."""
+    return _get_session("tmdb", _create_tmdb_session)
+
+def get_trakt_oauth_session() -> OAuth2Session:
+    """Returns the shared Trakt OAuth2 session."""
+    return _get_session("trakt", _create_trakt_oauth_session)
+
+def get_image_session() -> requests.Session:
+    """Returns the shared image download session."""
+    return _get_session("images", _create_image_session)
+
+def close_sessions() -> None:
+    """Closes and forgets all provider sessions (e.g. after credentials change)."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+    logger.info("Closed provider sessions")
 ```
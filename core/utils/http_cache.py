@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# File: http_cache.py
+# Description: On-disk conditional-request cache (ETag / Last-Modified) for provider GET requests
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import hashlib
+import json
+import threading
+from pathlib import Path
+import requests
+from core.utils.logger import logger
+
+# 2.0 Cache Location and Counters
+CACHE_DIR = Path("cache/http")
+_STATS = {'hits': 0, 'misses': 0, 'revalidations': 0}
+_STATS_LOCK = threading.Lock()
+
+def _count(name: str) -> None:
+    """Increments a cache counter."""
+    with _STATS_LOCK:
+        _STATS[name] += 1
+
+def cache_stats() -> dict:
+    """Returns counters: revalidations (conditional requests sent), hits (304s), misses (full downloads)."""
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+# 3.0 Entry Storage
+def _entry_path(url: str, params: dict | None) -> Path:
+    """Returns the cache file for a URL and its query parameters."""
+    key = json.dumps([url, sorted((params or {}).items())], default=str)
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+def _load_entry(path: Path) -> dict | None:
+    """Loads a cached entry, ignoring unreadable files."""
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning("Discarding unreadable cache entry {}: {}", path.name, str(e))
+        return None
+
+def _save_entry(path: Path, entry: dict) -> None:
+    """Writes a cache entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entry))
+
+# 4.0 Conditional GET
+def cached_get_json(session: requests.Session, url: str, params: dict | None = None) -> tuple[object, bool]:
+    """GETs JSON with If-None-Match / If-Modified-Since; returns (data, not_modified)."""
+    # 4.1 Attach Stored Validators
+    path = _entry_path(url, params)
+    entry = _load_entry(path)
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    if headers:
+        _count('revalidations')
+
+    # 4.2 Serve Cached Body on 304
+    response = session.get(url, params=params, headers=headers)
+    if response.status_code == 304 and entry:
+        _count('hits')
+        logger.debug("Cache hit (304) for {}", url)
+        return entry['body'], True
+
+    # 4.3 Store Fresh Body and Validators
+    response.raise_for_status()
+    _count('misses')
+    body = response.json()
+    etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+    if etag or last_modified:
+        _save_entry(path, {'url': url, 'etag': etag, 'last_modified': last_modified, 'body': body})
+    logger.debug("Cache miss for {}", url)
+    return body, False
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# File: image_cache.py
+# Description: Local poster cache: background parallel prefetch, table-sized thumbnails, data URIs and LRU eviction
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import base64
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from PIL import Image
+from core.data_models import MediaItem
+from core.db.codec import atomic_write_bytes
+from core.utils.helpers import get_image_session, load_config
+from core.utils.logger import logger
+
+# 2.0 Settings and Prefetch State
+_EVICT_LOCK = threading.Lock()
+_PREFETCH_LOCK = threading.Lock()
+_PREFETCH_THREAD: threading.Thread | None = None
+_PENDING: list[MediaItem] | None = None  # Latest items waiting for the prefetch thread
+
+def _settings() -> dict:
+    """Returns the images config section with defaults."""
+    return {
+        'cache_dir': 'cache/images',
+        'max_cache_mb': 100,
+        'poster_size': [92, 138],
+        'quality': 80,
+        'workers': 8,
+        **load_config().get('images', {})
+    }
+
+def _thumb_path(url: str) -> Path:
+    """Returns the thumbnail file for a poster URL."""
+    digest = hashlib.sha1(url.encode()).hexdigest()
+    return Path(_settings()['cache_dir']) / f"poster_{digest}.jpg"
+
+# 3.0 Download and Thumbnail
+def _make_thumbnail(data: bytes, size: tuple[int, int], quality: int) -> bytes:
+    """Shrinks an image to fit size and re-encodes it as JPEG."""
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail(size)
+        out = io.BytesIO()
+        image.convert("RGB").save(out, format="JPEG", quality=quality, optimize=True)
+    return out.getvalue()
+
+def _fetch(url: str) -> bool:
+    """Downloads one poster and stores its thumbnail; cached files are only touched (marks them recently used)."""
+    path = _thumb_path(url)
+    if path.exists():
+        os.utime(path)
+        return True
+    settings = _settings()
+    try:
+        response = get_image_session().get(url)
+        response.raise_for_status()
+        thumbnail = _make_thumbnail(response.content, tuple(settings['poster_size']), settings['quality'])
+    except Exception as e:
+        logger.warning("Image fetch failed for {}: {}", url, str(e))
+        return False
+    atomic_write_bytes(path, thumbnail)
+    return True
+
+# 4.0 Prefetch
+def prefetch_images(items: list[MediaItem]) -> int:
+    """Caches thumbnails for every poster in parallel, then evicts down to the size bound."""
+    urls = {item.poster_url for item in items if item.poster_url}
+    if not urls:
+        return 0
+    with ThreadPoolExecutor(max_workers=_settings()['workers'], thread_name_prefix="images") as executor:
+        cached = sum(executor.map(_fetch, urls))
+    logger.info("Image cache holds {}/{} thumbnails", cached, len(urls))
+    evict()
+    return cached
+
+def prefetch_in_background(items: list[MediaItem]) -> None:
+    """Queues a prefetch on a daemon thread; a newer request replaces one still waiting."""
+    global _PREFETCH_THREAD, _PENDING
+    with _PREFETCH_LOCK:
+        _PENDING = list(items)
+        if _PREFETCH_THREAD is None:
+            _PREFETCH_THREAD = threading.Thread(target=_drain_prefetches, name="image-prefetch", daemon=True)
+            _PREFETCH_THREAD.start()
+
+def _drain_prefetches() -> None:
+    """Runs queued prefetches until none are waiting."""
+    global _PREFETCH_THREAD, _PENDING
+    while True:
+        with _PREFETCH_LOCK:
+            items, _PENDING = _PENDING, None
+            if items is None:
+                _PREFETCH_THREAD = None
+                return
+        try:
+            prefetch_images(items)
+        except Exception as e:
+            logger.error("Image prefetch failed: {}", str(e))
+
+# 5.0 LRU Eviction
+def evict(max_bytes: int | None = None) -> int:
+    """Deletes least recently used thumbnails until the cache fits; returns the number removed."""
+    max_bytes = max_bytes if max_bytes is not None else _settings()['max_cache_mb'] * 1024 * 1024
+    cache_dir = Path(_settings()['cache_dir'])
+    if not cache_dir.exists():
+        return 0
+    with _EVICT_LOCK:
+        files = [(f.stat(), f) for f in cache_dir.glob("*.jpg")]
+        total = sum(stat.st_size for stat, _ in files)
+        removed = 0
+        for stat, path in sorted(files, key=lambda entry: entry[0].st_mtime):
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+    if removed:
+        _data_uri.cache_clear()
+        logger.info("Evicted {} thumbnails from image cache", removed)
+    return removed
+
+# 6.0 Table Sources
+@lru_cache(maxsize=4096)
+def _data_uri(path: str) -> str:
+    """Encodes a cached thumbnail as a data URI (memoized; thumbnails never change under a path)."""
+    return "data:image/jpeg;base64," + base64.b64encode(Path(path).read_bytes()).decode()
+
+def thumbnail_uri(url: str | None) -> str | None:
+    """Returns a cached poster thumbnail as a data URI, or the remote URL if it is not cached yet."""
+    if not url:
+        return None
+    path = _thumb_path(url)
+    if not path.exists():
+        return url
+    try:
+        return _data_uri(str(path))
+    except OSError:
+        return url
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# File: rate_limiter.py
+# Description: Per-provider token-bucket request scheduler with bounded concurrency and Retry-After handling
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from core.utils.logger import logger
+
+# 2.0 Token Bucket
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    # 2.1 Take One Token
+    def acquire(self) -> None:
+        """Blocks until a token is available, then consumes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    # 2.2 Server-Requested Pause
+    def pause(self, seconds: float) -> None:
+        """Stops handing out tokens for `seconds` and drains the bucket."""
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0
+            self._updated = now
+
+# 3.0 Provider Scheduler
+class ProviderScheduler:
+    """Rate and concurrency gate for one provider's requests."""
+
+    def __init__(self, provider: str, rate: float, per: float = 1.0, burst: float | None = None,
+                 max_concurrency: int = 4, max_retries: int = 3):
+        """Initialize from a quota of `rate` requests every `per` seconds."""
+        self.provider = provider
+        self.bucket = TokenBucket(rate / per, burst or max(1.0, rate / per))
+        self.max_retries = max_retries
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    # 3.1 Request Slot
+    @contextmanager
+    def slot(self):
+        """Holds a concurrency slot and one rate token for the duration of a request."""
+        with self._slots:
+            self.bucket.acquire()
+            yield
+
+    # 3.2 Throttle Feedback
+    def throttled(self, retry_after: float) -> None:
+        """Pauses every request to this provider after an HTTP 429."""
+        logger.warning("{} throttled, pausing {:.1f}s", self.provider, retry_after)
+        self.bucket.pause(retry_after)
+
+# 4.0 Retry-After Parsing
+def parse_retry_after(value: str | None, default: float = 1.0) -> float:
+    """Returns seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+# 5.0 Scheduler Registry
+_SCHEDULERS: dict[str, ProviderScheduler] = {}
+_SCHEDULERS_LOCK = threading.Lock()
+
+def get_scheduler(provider: str, limits: dict) -> ProviderScheduler:
+    """Returns the shared scheduler for a provider, created from its rate_limits config once."""
+    with _SCHEDULERS_LOCK:
+        if provider not in _SCHEDULERS:
+            provider_limits = limits.get(provider, {})
+            _SCHEDULERS[provider] = ProviderScheduler(
+                provider,
+                rate=provider_limits.get('rate', 10),
+                per=provider_limits.get('per', 1),
+                burst=provider_limits.get('burst'),
+                max_concurrency=provider_limits.get('max_concurrency', 4),
+                max_retries=limits.get('max_retries', 3)
+            )
+            logger.debug("Created {} scheduler: {}", provider, provider_limits)
+        return _SCHEDULERS[provider]
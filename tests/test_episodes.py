@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# File: test_episodes.py
+# Description: Unit tests for the episode pipeline (parsing, changed-season persistence and calendar queries)
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from datetime import datetime
+import pytest
+from core.db import calendar_index, episode_repo, sqlite_repo
+from core.fetchers.episode_fetcher import parse_seasons, season_hash, upcoming_episodes
+from core.utils.logger import logger
+
+# 2.0 Test Setup
+def make_show(finale_name: str = "Finale") -> dict:
+    """Builds a TVMaze show payload with embedded seasons, episodes and next episode."""
+    episodes = [
+        {'id': 11, 'season': 1, 'number': 1, 'name': "Pilot", 'airstamp': "2020-01-01T02:00:00+00:00"},
+        {'id': 12, 'season': 1, 'number': 2, 'name': finale_name, 'airstamp': "2020-01-08T02:00:00+00:00"},
+        {'id': 21, 'season': 2, 'number': 1, 'name': "Return", 'airstamp': "2030-05-01T01:00:00+00:00"},
+    ]
+    return {'id': 5, '_embedded': {
+        'seasons': [{'id': 101, 'number': 1, 'name': ""}, {'id': 102, 'number': 2}],
+        'episodes': episodes,
+        'nextepisode': episodes[2],
+    }}
+
+@pytest.fixture
+def sqlite_db(mocker, tmp_path):
+    """Points the SQLite engine at a temp database."""
+    mocker.patch("core.db.sqlite_repo.load_config", return_value={'storage': {'sqlite_path': str(tmp_path / "media.db")}})
+    mocker.patch.object(sqlite_repo, "_ENGINE", None)
+
+# 3.0 Test Parsing
+def test_parse_seasons_and_upcoming():
+    """Tests grouping episodes under seasons and picking upcoming airings."""
+    show = make_show()
+    seasons = parse_seasons(show)
+    assert [(s.id, len(s.episodes)) for s in seasons] == [(101, 2), (102, 1)]
+    assert seasons[0].episodes[0].air_date == datetime(2020, 1, 1, 2, 0)
+    upcoming = upcoming_episodes(show, seasons, now=datetime(2026, 1, 1))
+    assert [e.id for e in upcoming] == [21]
+    logger.info("Tested episode parsing")
+
+# 4.0 Test Changed-Season Writes
+def test_save_rewrites_only_changed_seasons(sqlite_db):
+    """Tests that an unchanged season is skipped and an edited one is rewritten."""
+    # 4.1 First Save Writes Everything
+    def save(show):
+        seasons = parse_seasons(show)
+        return episode_repo.save_show_episodes(
+            {5: [(s, season_hash(s)) for s in seasons]},
+            {5: upcoming_episodes(show, seasons, now=datetime(2026, 1, 1))}
+        )
+    assert save(make_show()) == (2, 3)
+
+    # 4.2 Same Payload Writes Nothing; Renamed Episode Rewrites Its Season Only
+    assert save(make_show()) == (0, 0)
+    assert save(make_show("Season Finale")) == (1, 2)
+
+    # 4.3 Assert Stored Result
+    stored = episode_repo.load_seasons(5)
+    assert [e.name for e in stored[0].episodes] == ["Pilot", "Season Finale"]
+    logger.info("Tested changed-season writes")
+
+# 5.0 Test Calendar Queries
+def test_calendar_range_queries(sqlite_db):
+    """Tests time-range and premiere queries over the indexed air dates."""
+    # 5.1 Store One Show
+    show = make_show()
+    seasons = parse_seasons(show)
+    episode_repo.save_show_episodes({5: [(s, season_hash(s)) for s in seasons]},
+                                    {5: upcoming_episodes(show, seasons, now=datetime(2030, 4, 28))})
+
+    # 5.2 Query Ranges
+    week = calendar_index.airing_next(7, now=datetime(2030, 4, 28))
+    premieres = calendar_index.premieres_since(datetime(2019, 12, 1), now=datetime(2020, 2, 1))
+
+    # 5.3 Assert Only Matching Episodes
+    assert [r['id'] for r in week] == [21]
+    assert [r['id'] for r in premieres] == [11]
+    assert calendar_index.airing_next(7, show_ids=[6], now=datetime(2030, 4, 28)) == []
+    assert [r['id'] for r in calendar_index.scheduled_between(datetime(2030, 1, 1), datetime(2031, 1, 1))] == [21]
+
+    # 5.4 Assert Upcoming Airings Come from the Schedule, Not Every Stored Episode
+    episode_repo.save_show_episodes({}, {5: []})
+    assert calendar_index.airing_next(7, now=datetime(2030, 4, 28)) == []
+    logger.info("Tested calendar queries")
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# File: test_helpers.py
+# Description: Unit tests for app configuration loading
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import pytest
+from core.utils.helpers import load_config
+from core.utils.logger import logger
+
+# 2.0 Test Shipped Config
+def test_shipped_config_parses():
+    """Tests that config/app_config.yaml parses into every section the app reads."""
+    config = load_config()
+    assert {'api', 'mapping', 'rate_limits', 'storage', 'refresh', 'images'} <= set(config)
+    assert config['api']['fetch_workers'] == 3
+    logger.info("Tested shipped config")
+
+# 3.0 Test Broken Config
+def test_broken_config_raises_and_is_not_cached(tmp_path):
+    """Tests that an unparsable config raises on every call instead of caching an empty dict."""
+    path = tmp_path / "app_config.yaml"
+    path.write_text("```yaml\napi: {fetch_workers: 3}\n```\n")
+    with pytest.raises(Exception):
+        load_config(str(path))
+
+    # 3.1 Fixing the File Takes Effect on the Next Call
+    path.write_text("api: {fetch_workers: 3}\n")
+    assert load_config(str(path)) == {'api': {'fetch_workers': 3}}
+    logger.info("Tested broken config")
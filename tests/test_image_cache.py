@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# File: test_image_cache.py
+# Description: Unit tests for the poster image cache
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import io
+import os
+from PIL import Image
+from core.data_models import MediaItem
+from core.utils import image_cache
+from core.utils.logger import logger
+
+# 2.0 Helpers
+def make_jpeg(size: tuple[int, int]) -> bytes:
+    """Builds an in-memory JPEG of the given size."""
+    out = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(out, format="JPEG")
+    return out.getvalue()
+
+def use_cache_dir(mocker, path) -> None:
+    """Points the image cache at a temp directory."""
+    mocker.patch("core.utils.image_cache.load_config", return_value={'images': {'cache_dir': str(path)}})
+    image_cache._data_uri.cache_clear()
+
+# 3.0 Test Prefetch and Thumbnails
+def test_prefetch_writes_table_sized_thumbnails(mocker, tmp_path):
+    """Tests that prefetch downloads once, shrinks images and serves data URIs."""
+    # 3.1 Mock Downloads
+    use_cache_dir(mocker, tmp_path)
+    session = mocker.Mock()
+    session.get.return_value = mocker.Mock(content=make_jpeg((500, 750)), raise_for_status=lambda: None)
+    mocker.patch("core.utils.image_cache.get_image_session", return_value=session)
+    items = [MediaItem(id="tmdb:1", name="Dark", type="tv", poster_url="https://img/1.jpg")]
+
+    # 3.2 Prefetch Twice
+    assert image_cache.prefetch_images(items) == 1
+    image_cache.prefetch_images(items)
+
+    # 3.3 Assert Single Download, Small Thumbnail and Local URI
+    assert session.get.call_count == 1
+    with Image.open(image_cache._thumb_path("https://img/1.jpg")) as thumb:
+        assert thumb.size == (92, 138)
+    assert image_cache.thumbnail_uri("https://img/1.jpg").startswith("data:image/jpeg;base64,")
+    assert image_cache.thumbnail_uri("https://img/missing.jpg") == "https://img/missing.jpg"
+    logger.info("Tested image prefetch")
+
+# 4.0 Test LRU Eviction
+def test_evict_removes_least_recently_used(mocker, tmp_path):
+    """Tests that eviction drops the oldest thumbnails first."""
+    # 4.1 Create Thumbnails with Increasing Access Times
+    use_cache_dir(mocker, tmp_path)
+    paths = []
+    for n in range(3):
+        path = tmp_path / f"poster_{n}.jpg"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 + n, 1000 + n))
+        paths.append(path)
+
+    # 4.2 Evict Down to Two Files
+    removed = image_cache.evict(max_bytes=200)
+
+    # 4.3 Assert Oldest Removed
+    assert removed == 1
+    assert [p.exists() for p in paths] == [False, True, True]
+    logger.info("Tested image cache eviction")
+
+# 5.0 Test Background Prefetch
+def test_prefetch_in_background_fills_cache(mocker, tmp_path):
+    """Tests that a queued prefetch caches posters off the caller's thread."""
+    # 5.1 Mock Downloads
+    use_cache_dir(mocker, tmp_path)
+    session = mocker.Mock()
+    session.get.return_value = mocker.Mock(content=make_jpeg((500, 750)), raise_for_status=lambda: None)
+    mocker.patch("core.utils.image_cache.get_image_session", return_value=session)
+    url = "https://img/2.jpg"
+
+    # 5.2 Queue and Wait for the Prefetch Thread
+    assert image_cache.thumbnail_uri(url) == url
+    image_cache.prefetch_in_background([MediaItem(id="tmdb:2", name="Lost", type="tv", poster_url=url)])
+    thread = image_cache._PREFETCH_THREAD
+    if thread is not None:  # None once the queue has drained
+        thread.join(5)
+
+    # 5.3 Assert the Table Now Gets the Local Thumbnail
+    assert image_cache.thumbnail_uri(url).startswith("data:image/jpeg;base64,")
+    logger.info("Tested background prefetch")
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# File: test_show_mapper.py
+# Description: Unit tests for show consolidation and the match engine
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from core.data_models import MediaItem
+from core.mappers.show_mapper import map_shows
+from core.mappers.match_engine import MatchIndex
+from core.mappers.id_map import IdentityMap
+from core.utils.logger import logger
+
+# 2.0 Test Helpers
+def make_item(source: str, source_id: int, name: str, **fields) -> MediaItem:
+    """Builds a minimal MediaItem for one provider."""
+    return MediaItem(
+        id=f"{source}:{source_id}",
+        name=name,
+        type="tv",
+        **{f"{source}_id": source_id},
+        **fields
+    )
+
+# 3.0 Test Exact-ID Merge
+def test_map_shows_merges_by_id():
+    """Tests that items sharing a TMDB ID merge even when names differ."""
+    # 3.1 Consolidate
+    items = map_shows([
+        make_item("tmdb", 1399, "Game of Thrones", is_favorite=True),
+        make_item("tmdb", 1399, "GoT", is_watchlist=True),
+    ])
+
+    # 3.2 Assert Single Merged Item
+    assert len(items) == 1
+    assert items[0].is_favorite and items[0].is_watchlist
+    logger.info("Tested ID merge")
+
+# 4.0 Test Fuzzy Merge
+def test_map_shows_merges_by_fuzzy_name():
+    """Tests that near-identical names from different providers merge."""
+    # 4.1 Consolidate
+    items = map_shows([
+        make_item("tvmaze", 82, "Game of Thrones"),
+        make_item("tmdb", 1399, "Game of Thrones!"),
+        make_item("tmdb", 1396, "Breaking Bad"),
+    ])
+
+    # 4.2 Assert Merge and Linked IDs
+    assert [i.name for i in items] == ["Game of Thrones", "Breaking Bad"]
+    assert items[0].id == "tvmaze:82|tmdb:1399"
+    logger.info("Tested fuzzy merge")
+
+# 5.0 Test Blocking Keeps Matches
+def test_candidates_include_all_close_names():
+    """Tests that blocking never drops a name that would score above the threshold."""
+    # 5.1 Index Variants of One Title Plus Noise
+    index = MatchIndex()
+    for n, name in enumerate(["the office", "the offices", "office", "lost", "the wire"]):
+        index.add(make_item("tvmaze", n + 1, name))
+
+    # 5.2 Assert Candidates
+    candidates = index.candidates("the office us")
+    assert 0 in candidates and 1 in candidates
+    assert 3 not in candidates
+    logger.info("Tested candidate blocking")
+
+# 6.0 Test Batch Matrix Mode
+def test_map_shows_batch_matches_incremental():
+    """Tests that cdist batch scoring merges exactly like blocked scoring."""
+    # 6.1 Build Identical Inputs
+    names = ["The Office", "The Office US", "Lost", "Lost Girl", "The Wire", "the wire ", "Dark"]
+    def build():
+        return [make_item("tvmaze", n + 1, name) for n, name in enumerate(names)]
+
+    # 6.2 Consolidate Both Ways
+    incremental = map_shows(build(), batch=False)
+    batched = map_shows(build(), batch=True, workers=2)
+
+    # 6.3 Assert Same Merges
+    assert [i.id for i in batched] == [i.id for i in incremental]
+    logger.info("Tested batch scoring parity")
+
+# 7.0 Test Identity Table
+def test_map_shows_uses_identity_table():
+    """Tests that stored groups link titles without fuzzy matching and splits veto bad merges."""
+    # 7.1 Known Link Plus a Split Override
+    identity = IdentityMap(
+        groups=[["tvmaze:82", "tmdb:1399"]],
+        splits=[["tvmaze:1", "tmdb:2"]]
+    )
+
+    # 7.2 Consolidate
+    items = map_shows([
+        make_item("tvmaze", 82, "Game of Thrones"),
+        make_item("tmdb", 1399, "A Song of Ice and Fire"),
+        make_item("tvmaze", 1, "Shameless"),
+        make_item("tmdb", 2, "Shameless"),
+    ], batch=False, identity=identity)
+
+    # 7.3 Assert Linked, Split and Recorded
+    assert [i.id for i in items] == ["tvmaze:82|tmdb:1399", "tvmaze:1", "tmdb:2"]
+    assert identity.dirty and len(identity) == 3
+    logger.info("Tested identity table")
+
+# 8.0 Test Rounded Threshold
+def test_fuzzy_threshold_uses_rounded_scores():
+    """Tests that a pair scoring 80.49 stays apart in both modes, as with fuzzywuzzy's rounded int ratio."""
+    # 8.1 Names Scoring Just Under 80.5
+    names = ["Star Trek The Next Generation Season One", "Star Trek The Next Generation 1987 Special"]
+    def build():
+        return [make_item("tvmaze", n + 1, name) for n, name in enumerate(names)]
+
+    # 8.2 Assert No Merge
+    assert len(map_shows(build(), batch=False)) == 2
+    assert len(map_shows(build(), batch=True, workers=1)) == 2
+    logger.info("Tested rounded fuzzy threshold")
+
+# 9.0 Test Type-Aware ID Index
+def test_exact_id_match_requires_same_type():
+    """Tests that equal provider IDs only merge items of the same media type."""
+    index = MatchIndex()
+    index.add(MediaItem(id="tmdb:tv:1", name="Dark", type="tv", tmdb_id=1))
+    assert index.find_by_id(MediaItem(id="tmdb:movie:1", name="Arrival", type="movie", tmdb_id=1)) is None
+    assert index.find_by_id(MediaItem(id="trakt:5", name="Dark", type="tv", trakt_id=5, tmdb_id=1)) == (0, "tmdb_id")
+    logger.info("Tested type-aware ID index")
+
+# 10.0 Test Override Key Check
+def test_overrides_warn_on_unknown_key_format(mocker, tmp_path):
+    """Tests that override keys in the old untyped form are reported, and typed keys are not."""
+    overrides = tmp_path / "id_overrides.yaml"
+    overrides.write_text('link:\n  - ["tvmaze:82", "tmdb:1399", "trakt:tv:1390"]\nsplit:\n  - ["tvmaze:123", "tmdb:movie:456"]\n')
+    log = mocker.patch("core.mappers.id_map.logger")
+    IdentityMap.load(tmp_path / "id_map.json", overrides)
+    warned = [c.args[2] for c in log.warning.call_args_list]
+    assert warned == ["tmdb:1399"]
+    logger.info("Tested override key check")
+
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# File: test_storage.py
+# Description: Unit tests for the media item storage backends
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import threading
+import pytest
+from sqlalchemy import text
+from core.data_models import MediaItem
+from core.db import codec, log_store, sqlite_repo
+from core.utils.logger import logger
+
+# 2.0 Test Setup
+def make_item(n: int, name: str, **fields) -> MediaItem:
+    """Builds a minimal TVMaze MediaItem."""
+    return MediaItem(id=f"tvmaze:{n}", name=name, type="tv", tvmaze_id=n, **fields)
+
+@pytest.fixture
+def sqlite_db(mocker, tmp_path):
+    """Points the SQLite engine at a temp database."""
+    mocker.patch("core.db.sqlite_repo.load_config", return_value={'storage': {'sqlite_path': str(tmp_path / "media.db")}})
+    mocker.patch.object(sqlite_repo, "_ENGINE", None)
+
+@pytest.fixture
+def log_db(mocker, tmp_path):
+    """Points the log store at temp files with automatic compaction off."""
+    mocker.patch("core.db.log_store.load_config", return_value={'storage': {'log_compact_bytes': 1 << 30}})
+    mocker.patch.object(log_store, "SNAPSHOT_FILE", tmp_path / "media.snapshot.json")
+    mocker.patch.object(log_store, "LOG_FILE", tmp_path / "media.log")
+    mocker.patch.object(log_store, "COMPACTING_FILE", tmp_path / "media.log.compacting")
+    mocker.patch.object(log_store, "_STATE", None)
+
+def reload_log() -> dict[str, MediaItem]:
+    """Drops the in-memory state and rebuilds it from disk, as a restarted process would."""
+    log_store._STATE = None
+    return {i.id: i for i in log_store.load_media_items()}
+
+def paused_compaction(mocker) -> tuple[threading.Thread, threading.Event]:
+    """Starts a compaction that blocks before writing its snapshot until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+    write = log_store._write_temp_snapshot
+    def slow_write(records, suffix):
+        if threading.current_thread().name == "paused-compactor":
+            started.set()
+            release.wait(5)
+        return write(records, suffix)
+    mocker.patch.object(log_store, "_write_temp_snapshot", side_effect=slow_write)
+    thread = threading.Thread(target=log_store.compact, name="paused-compactor")
+    thread.start()
+    assert started.wait(5)
+    return thread, release
+
+# 3.0 Test SQLite Backend
+def test_sqlite_upsert_inserts_and_updates(sqlite_db):
+    """Tests that one bulk upsert updates existing rows, inserts new ones and leaves others alone."""
+    # 3.1 Save Two Items
+    sqlite_repo.save_media_items([make_item(1, "Dark"), make_item(2, "Lost")])
+
+    # 3.2 Upsert One Changed and One New Item
+    sqlite_repo.upsert_media_items([make_item(1, "Dark", is_favorite=True, genres=["Drama"]), make_item(3, "Fargo")])
+
+    # 3.3 Assert Stored Rows and WAL Journaling
+    items = {i.id: i for i in sqlite_repo.load_media_items()}
+    assert sorted(items) == ["tvmaze:1", "tvmaze:2", "tvmaze:3"]
+    assert items["tvmaze:1"].is_favorite and items["tvmaze:1"].genres == ["Drama"]
+    assert items["tvmaze:2"].name == "Lost"
+    with sqlite_repo.get_engine().connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    logger.info("Tested SQLite upsert")
+
+def test_sqlite_save_replaces_all(sqlite_db):
+    """Tests that save_media_items replaces the stored set."""
+    sqlite_repo.save_media_items([make_item(1, "Dark"), make_item(2, "Lost")])
+    sqlite_repo.save_media_items([make_item(2, "Lost")])
+    assert [i.id for i in sqlite_repo.load_media_items()] == ["tvmaze:2"]
+    logger.info("Tested SQLite save")
+
+def test_sqlite_prune_deletes_unkept_rows(sqlite_db):
+    """Tests that prune_media_items deletes only rows outside the kept IDs."""
+    sqlite_repo.save_media_items([make_item(1, "Dark"), make_item(2, "Lost")])
+    assert sqlite_repo.prune_media_items({"tvmaze:2"}) == 1
+    assert [i.id for i in sqlite_repo.load_media_items()] == ["tvmaze:2"]
+    logger.info("Tested SQLite prune")
+
+# 4.0 Test Log Store
+def test_log_replays_snapshot_and_skips_torn_records(log_db):
+    """Tests that a restart rebuilds state from snapshot + log, skipping a torn trailing record."""
+    # 4.1 Snapshot, Then Logged Changes and a Torn Write
+    log_store.save_media_items([make_item(1, "Dark"), make_item(2, "Lost")])
+    log_store.upsert_media_items([make_item(2, "Lost", is_watchlist=True), make_item(3, "Fargo")])
+    with log_store.LOG_FILE.open("ab") as f:
+        f.write(b'{"op":"upsert","item":{"id":"tvm')
+
+    # 4.2 Assert Replayed State
+    items = reload_log()
+    assert sorted(items) == ["tvmaze:1", "tvmaze:2", "tvmaze:3"]
+    assert items["tvmaze:2"].is_watchlist
+    logger.info("Tested log replay")
+
+def test_log_upsert_appends_only_changes(log_db):
+    """Tests that unchanged items are not appended again."""
+    log_store.upsert_media_items([make_item(1, "Dark"), make_item(2, "Lost")])
+    size = log_store.LOG_FILE.stat().st_size
+    log_store.upsert_media_items([make_item(1, "Dark")])
+    assert log_store.LOG_FILE.stat().st_size == size
+    logger.info("Tested log change detection")
+
+def test_log_prune_survives_restart_and_compaction(log_db):
+    """Tests that pruned IDs stay deleted after a replay and after compaction."""
+    log_store.save_media_items([make_item(1, "Dark")])
+    log_store.upsert_media_items([make_item(2, "Lost")])
+    assert log_store.prune_media_items({"tvmaze:2"}) == 1
+    assert sorted(reload_log()) == ["tvmaze:2"]
+    log_store.compact()
+    assert sorted(reload_log()) == ["tvmaze:2"]
+    logger.info("Tested log prune")
+
+def test_compaction_folds_log_into_snapshot(log_db):
+    """Tests that compaction writes every item to the snapshot and removes the folded log."""
+    log_store.upsert_media_items([make_item(1, "Dark"), make_item(2, "Lost")])
+    log_store.compact()
+    assert not log_store.LOG_FILE.exists() and not log_store.COMPACTING_FILE.exists()
+    assert sorted(reload_log()) == ["tvmaze:1", "tvmaze:2"]
+    logger.info("Tested compaction")
+
+def test_older_compaction_cannot_replace_newer(mocker, log_db):
+    """Tests that a compaction finishing after a newer one discards its stale snapshot."""
+    # 4.3 Older Compaction Pauses; Newer Records Are Compacted Meanwhile
+    log_store.upsert_media_items([make_item(1, "Dark")])
+    thread, release = paused_compaction(mocker)
+    log_store.upsert_media_items([make_item(2, "Lost")])
+    log_store.compact()
+
+    # 4.4 Let the Older One Finish Last
+    release.set()
+    thread.join(5)
+
+    # 4.5 Assert Newer Records Survive on Disk
+    assert sorted(reload_log()) == ["tvmaze:1", "tvmaze:2"]
+    assert list(log_store.SNAPSHOT_FILE.parent.glob("*.tmp")) == []
+    logger.info("Tested compaction ordering")
+
+def test_save_during_compaction_wins(mocker, log_db):
+    """Tests that a full save made while a compaction runs is not overwritten by it."""
+    log_store.upsert_media_items([make_item(1, "Dark"), make_item(2, "Lost")])
+    thread, release = paused_compaction(mocker)
+    log_store.save_media_items([make_item(3, "Fargo")])
+    release.set()
+    thread.join(5)
+    assert sorted(reload_log()) == ["tvmaze:3"]
+    logger.info("Tested save generation guard")
+
+# 5.0 Test Codec
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_records_round_trip(tmp_path, compression):
+    """Tests that written records stream back unchanged with and without compression."""
+    records = [{'id': "tvmaze:1", 'name': "Dark", 'genres': ["Drama"]}, {'id': "tvmaze:2", 'name': "Lost, the \"Series\""}]
+    path = tmp_path / "media.json"
+    codec.write_records(path, records, compression)
+    assert list(codec.iter_records(path)) == records
+    logger.info("Tested {} record round trip", compression)
+
+def test_iter_records_reads_indented_json(tmp_path):
+    """Tests the whole-file fallback for JSON written in another layout."""
+    path = tmp_path / "media.json"
+    path.write_text('[\n  {\n    "id": "tvmaze:1"\n  }\n]\n')
+    assert list(codec.iter_records(path)) == [{'id': "tvmaze:1"}]
+    logger.info("Tested indented JSON fallback")
+
+# 6.0 Test Trusted Construction
+def test_from_storage_restores_dumped_items():
+    """Tests that from_storage rebuilds an equal item from its JSON record, parsing updated_at."""
+    item = make_item(1, "Dark", genres=["Drama"], networks=[{'name': "Netflix"}], score=8.7, is_favorite=True)
+    restored = MediaItem.from_storage(item.model_dump(mode="json"))
+    assert restored == item
+    assert restored.updated_at == item.updated_at
+    logger.info("Tested from_storage")
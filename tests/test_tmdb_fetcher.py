@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# File: test_tmdb_fetcher.py
+# Description: Unit tests for the paginated TMDB fetcher
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from core.fetchers import tmdb_fetcher
+from core.mappers.show_mapper import map_shows
+from core.utils.logger import logger
+
+# 2.0 Fake API
+PAGES = {
+    "/account/7/favorite/tv": [[{'id': 1, 'name': "Dark", 'genre_ids': [18]}], [{'id': 2, 'name': "Lost"}]],
+    "/account/7/watchlist/tv": [[{'id': 1, 'name': "Dark", 'genre_ids': [18]}]],
+    "/account/7/favorite/movies": [[]],
+    "/account/7/watchlist/movies": [[{'id': 1, 'title': "Arrival", 'poster_path': "/a.jpg"}]],
+}
+
+def fake_get(session, url, params=None):
+    """Serves canned TMDB responses by path and page."""
+    path = url.removeprefix(tmdb_fetcher.TMDB_API_URL)
+    if path == "/account":
+        return {'id': 7}, False
+    if path.startswith("/genre/"):
+        return {'genres': [{'id': 18, 'name': "Drama"}]}, False
+    pages = PAGES[path]
+    return {'results': pages[params['page'] - 1], 'total_pages': len(pages)}, False
+
+def mock_api(mocker) -> None:
+    """Mocks TMDB credentials and HTTP with the fake API."""
+    mocker.patch("core.fetchers.tmdb_fetcher.load_env_vars", return_value={'API_TMDB_KEY': "k", 'API_TMDB_TOKEN': "t"})
+    mocker.patch("core.fetchers.tmdb_fetcher.get_tmdb_session")
+    mocker.patch("core.fetchers.tmdb_fetcher.cached_get_json", side_effect=fake_get)
+
+# 3.0 Test Fetch
+def test_fetches_all_pages_and_merges_per_type_and_id(mocker):
+    """Tests pagination, set-based classification and one item per (type, TMDB ID)."""
+    # 3.1 Mock Credentials and HTTP
+    mock_api(mocker)
+
+    # 3.2 Fetch
+    items = {(i.type, i.tmdb_id): i for i in tmdb_fetcher.get_favorites_and_watchlist()}
+
+    # 3.3 Assert Merged, Classified Items
+    assert set(items) == {("tv", 1), ("tv", 2), ("movie", 1)}
+    dark = items[("tv", 1)]
+    assert (dark.is_favorite, dark.is_watchlist, dark.genres) == (True, True, ["Drama"])
+    assert (items[("tv", 2)].is_favorite, items[("tv", 2)].is_watchlist) == (True, False)
+    arrival = items[("movie", 1)]
+    assert (arrival.is_favorite, arrival.is_watchlist) == (False, True)
+    assert arrival.poster_url == "https://image.tmdb.org/t/p/w500/a.jpg"
+    assert (dark.id, arrival.id) == ("tmdb:tv:1", "tmdb:movie:1")
+    logger.info("Tested TMDB pagination and merging")
+
+# 4.0 Test Shared TMDB IDs Across Types
+def test_show_and_movie_with_same_id_stay_apart(mocker):
+    """Tests that a TV show and a movie sharing a TMDB ID are not consolidated."""
+    mock_api(mocker)
+    items = map_shows(tmdb_fetcher.get_favorites_and_watchlist(), batch=False)
+    assert sorted(i.id for i in items) == ["tmdb:movie:1", "tmdb:tv:1", "tmdb:tv:2"]
+    logger.info("Tested TMDB IDs per media type")
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# File: test_trakt_fetcher.py
+# Description: Unit tests for the paginated Trakt fetcher
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+from core.data_models import MediaItem
+from core.fetchers import trakt_fetcher
+from core.mappers.show_mapper import map_shows
+from core.syncers.trakt_syncer import sync_to_trakt
+from core.utils.logger import logger
+
+# 2.0 Fake API
+def show(trakt_id: int, title: str, full: bool, kind: str = "show") -> dict:
+    """Builds a Trakt list entry for a show (or movie), with metadata when full."""
+    media = {'title': title, 'ids': {'trakt': trakt_id, 'tmdb': trakt_id + 1000, 'tvdb': trakt_id + 2000}}
+    if full:
+        media.update(overview=f"{title} overview", status="ended", genres=["science-fiction"], network="Netflix", rating=8.5)
+    return {'type': kind, kind: media}
+
+PAGES = {
+    "/sync/watchlist/shows": [[(1, "Dark")], [(2, "Lost")]],
+    "/sync/favorites/shows": [[(1, "Dark")]],
+    "/sync/watchlist/movies": [[]],
+    "/sync/favorites/movies": [[]],
+}
+
+def fake_session(mocker):
+    """Returns a session whose get serves PAGES with pagination headers."""
+    def get(url, params=None):
+        if url.endswith("/sync/last_activities"):
+            return mocker.Mock(json=lambda: {'watchlist': {'updated_at': "2026-10-01T00:00:00.000Z"}},
+                               raise_for_status=lambda: None)
+        pages = PAGES[url.removeprefix(trakt_fetcher.TRAKT_API_URL)]
+        entries = [show(e[0], e[1], params.get('extended') == 'full', *e[2:]) for e in pages[params['page'] - 1]]
+        return mocker.Mock(json=lambda: entries, headers={'X-Pagination-Page-Count': str(len(pages))},
+                           raise_for_status=lambda: None)
+    session = mocker.Mock()
+    session.get.side_effect = get
+    return session
+
+# 3.0 Test Fetch
+def test_fetches_pages_and_only_missing_metadata(mocker, tmp_path):
+    """Tests pagination, ids parsing, list merging and extended=full only for unknown titles."""
+    # 3.1 One Title Already Stored with Metadata
+    mocker.patch.object(trakt_fetcher, "LIST_CACHE_FILE", tmp_path / "trakt_lists.json")
+    session = fake_session(mocker)
+    mocker.patch("core.fetchers.trakt_fetcher.get_trakt_oauth_session", return_value=session)
+    mocker.patch("core.fetchers.trakt_fetcher.load_media_items", return_value=[
+        MediaItem(id="tvmaze:9|trakt:1", name="Dark", type="tv", trakt_id=1, overview="Stored", genres=["Drama"])
+    ])
+
+    # 3.2 Fetch
+    items = {i.trakt_id: i for i in trakt_fetcher.get_favorites_and_watchlist()}
+
+    # 3.3 Assert Linked IDs, Merged Flags and Metadata Sources
+    assert set(items) == {1, 2}
+    assert (items[1].tmdb_id, items[1].tvdb_id) == (1001, 2001)
+    assert (items[1].is_favorite, items[1].is_watchlist) == (True, True)
+    assert items[2].overview == "Lost overview"
+    assert items[2].genres == ["Science Fiction"]
+    full_paths = {c.args[0] for c in session.get.call_args_list if (c.kwargs.get('params') or {}).get('extended')}
+    assert full_paths == {f"{trakt_fetcher.TRAKT_API_URL}/sync/watchlist/shows"}
+    logger.info("Tested Trakt pagination and metadata")
+
+# 4.0 Test Last Activities Gate
+def test_unchanged_activity_skips_list_download(mocker, tmp_path):
+    """Tests that a refresh with unchanged last_activities makes only the activities request."""
+    # 4.1 Prime the List Cache with One Full Fetch
+    mocker.patch.object(trakt_fetcher, "LIST_CACHE_FILE", tmp_path / "trakt_lists.json")
+    session = fake_session(mocker)
+    mocker.patch("core.fetchers.trakt_fetcher.get_trakt_oauth_session", return_value=session)
+    mocker.patch("core.fetchers.trakt_fetcher.load_media_items", return_value=[])
+    first = trakt_fetcher.get_favorites_and_watchlist()
+    session.get.reset_mock()
+
+    # 4.2 Refresh Again
+    second = trakt_fetcher.get_favorites_and_watchlist()
+
+    # 4.3 Assert Single Tiny Request and Same Items
+    assert [c.args[0] for c in session.get.call_args_list] == [f"{trakt_fetcher.TRAKT_API_URL}/sync/last_activities"]
+    assert sorted(i.id for i in second) == sorted(i.id for i in first)
+    logger.info("Tested Trakt last_activities gate")
+
+# 5.0 Test Shared Trakt IDs Across Types
+def test_show_and_movie_with_same_ids_stay_apart(mocker, tmp_path):
+    """Tests that a show and a movie sharing Trakt, TMDB and TVDB IDs are neither merged nor confused in the cache."""
+    # 5.1 Movie 1 Shares Every ID Number with Show 1
+    mocker.patch.dict(PAGES, {"/sync/watchlist/movies": [[(1, "Arrival", "movie")]]})
+    mocker.patch.object(trakt_fetcher, "LIST_CACHE_FILE", tmp_path / "trakt_lists.json")
+    session = fake_session(mocker)
+    mocker.patch("core.fetchers.trakt_fetcher.get_trakt_oauth_session", return_value=session)
+    mocker.patch("core.fetchers.trakt_fetcher.load_media_items", return_value=[])
+
+    # 5.2 Fetch and Consolidate
+    items = map_shows(trakt_fetcher.get_favorites_and_watchlist(), batch=False)
+    assert sorted(i.id for i in items) == ["trakt:movie:1", "trakt:tv:1", "trakt:tv:2"]
+
+    # 5.3 Unwatchlisting the Movie Patches Only the Movie Record
+    activity = trakt_fetcher.load_list_cache()['activity']
+    movie = next(i for i in items if i.type == "movie").model_copy(update={'is_watchlist': False})
+    trakt_fetcher.patch_list_cache([movie], activity, activity)
+    cached = sorted(r['id'] for r in trakt_fetcher.load_list_cache()['items'])
+    assert cached == ["trakt:tv:1", "trakt:tv:2"]
+    logger.info("Tested Trakt IDs per media type")
+
+# 6.0 Test Sync Without Activity Stamps
+def test_sync_drops_cache_when_activity_read_fails(mocker, tmp_path):
+    """Tests that a sync whose after-push activity read fails still succeeds but drops the list cache."""
+    # 6.1 Cached Lists from a Full Fetch
+    mocker.patch.object(trakt_fetcher, "LIST_CACHE_FILE", tmp_path / "trakt_lists.json")
+    session = fake_session(mocker)
+    mocker.patch("core.fetchers.trakt_fetcher.get_trakt_oauth_session", return_value=session)
+    mocker.patch("core.fetchers.trakt_fetcher.load_media_items", return_value=[])
+    items = trakt_fetcher.get_favorites_and_watchlist()
+    assert trakt_fetcher.load_list_cache() is not None
+
+    # 6.2 Push Succeeds, Then last_activities Fails
+    get = session.get.side_effect
+    calls = []
+    def flaky_get(url, params=None):
+        calls.append(url)
+        if url.endswith("/sync/last_activities") and len(calls) > 1:
+            raise ConnectionError("timeout")
+        return get(url, params)
+    session.get.side_effect = flaky_get
+    session.post.return_value = mocker.Mock(json=lambda: {'deleted': {'shows': 1}}, raise_for_status=lambda: None)
+    mocker.patch("core.syncers.trakt_syncer.get_trakt_oauth_session", return_value=session)
+    lost = next(i for i in items if i.name == "Lost").model_copy(update={'is_watchlist': False})
+    results = sync_to_trakt([lost])
+
+    # 6.3 Assert One Push and No Stale Cache
+    assert results == {lost.id: True}
+    assert session.post.call_count == 1
+    assert trakt_fetcher.load_list_cache() is None
+    logger.info("Tested sync with failed activity read")
+
+# 7.0 Test Not-Found per Media Type
+def test_sync_not_found_show_does_not_fail_movie_with_same_id(mocker):
+    """Tests that a not-found show only fails the show, not a movie sharing its Trakt ID."""
+    session = mocker.Mock()
+    session.get.return_value = mocker.Mock(json=lambda: {}, raise_for_status=lambda: None)
+    session.post.return_value = mocker.Mock(json=lambda: {
+        'added': {'movies': 1}, 'not_found': {'shows': [{'ids': {'trakt': 1390}}], 'movies': []}
+    }, raise_for_status=lambda: None)
+    mocker.patch("core.syncers.trakt_syncer.get_trakt_oauth_session", return_value=session)
+    mocker.patch("core.syncers.trakt_syncer.patch_list_cache")
+    show_item = MediaItem(id="trakt:tv:1390", name="Game of Thrones", type="tv", trakt_id=1390, is_watchlist=True)
+    movie = MediaItem(id="trakt:movie:1390", name="Arrival", type="movie", trakt_id=1390, is_watchlist=True)
+    assert sync_to_trakt([show_item, movie]) == {show_item.id: False, movie.id: True}
+    logger.info("Tested Trakt not-found per media type")
+
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# File: test_tvmaze_fetcher.py
+# Description: Unit tests for the incremental TVMaze fetcher
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import json
+import time
+import pytest
+from core.fetchers import tvmaze_fetcher
+from core.modules.watchlist_module import refresh_watchlist
+from core.utils.logger import logger
+
+# 2.0 Test Setup
+def show_payload(show_id: int, name: str, summary: str, **fields) -> dict:
+    """Builds a /shows/{id} payload shaped like the real API (network object, image and rating blocks)."""
+    return {
+        'id': show_id, 'name': name, 'summary': summary, 'status': "Ended", 'genres': ["Drama"],
+        'network': {'id': 8, 'name': "ABC", 'country': {'code': "US"}}, 'webChannel': None,
+        'rating': {'average': 8.3}, 'image': {'medium': f"https://img/{show_id}.jpg", 'original': None},
+        'externals': {'tvrage': None, 'thetvdb': 73739, 'imdb': "tt0411008"}, **fields
+    }
+
+def seen(show_id: int, name: str, updated: int) -> dict:
+    """Builds a state entry: last-seen timestamp plus the TVMaze record from that fetch."""
+    return {'updated': updated, 'record': tvmaze_fetcher._show_record({'id': show_id, 'name': name, 'summary': "Stored"})}
+
+def mock_api(mocker, tmp_path) -> tuple:
+    """Seeds state (both shows seen at t=100, last run an hour ago) and serves canned API responses."""
+    state_file = tmp_path / "tvmaze_updates.json"
+    state_file.write_text(json.dumps({'last_run': time.time() - 3600, 'shows': {'1': seen(1, "Dark", 100), '2': seen(2, "Lost", 100)}}))
+    mocker.patch.object(tvmaze_fetcher, "UPDATES_STATE_FILE", state_file)
+    mocker.patch.object(tvmaze_fetcher, "_PENDING_STATE", None)
+    mocker.patch("core.fetchers.tvmaze_fetcher.get_tvmaze_session")
+    responses = {
+        "/v1/user/follows/shows": [{'show_id': 1}, {'show_id': 2}],
+        "/updates/shows": {'2': 200, '99': 150},
+        "/shows/2": show_payload(2, "Lost", 'Fresh', updated=200),
+    }
+    cached_get = mocker.patch(
+        "core.fetchers.tvmaze_fetcher.cached_get_json",
+        side_effect=lambda session, url, params=None: (responses[url.removeprefix(tvmaze_fetcher.TVMAZE_API_URL)], False)
+    )
+    return state_file, cached_get
+
+def seen_timestamps(state_file) -> dict:
+    """Returns the saved per-show timestamps."""
+    return {k: v['updated'] for k, v in json.loads(state_file.read_text())['shows'].items()}
+
+# 3.0 Test Incremental Refresh
+def test_incremental_refetches_only_updated_shows(mocker, tmp_path):
+    """Tests that only shows newer than their last-seen timestamp are requested."""
+    # 3.1 Baseline and Canned API
+    state_file, cached_get = mock_api(mocker, tmp_path)
+
+    # 3.2 Refresh
+    fetched = tvmaze_fetcher._fetch_incremental()
+    items = {i.tvmaze_id: i for i in fetched}
+
+    # 3.3 Assert Only Show 2 Refetched, Show 1 Rebuilt from Its Own Last Record
+    requested = [c.args[1] for c in cached_get.call_args_list]
+    assert f"{tvmaze_fetcher.TVMAZE_API_URL}/shows/1" not in requested
+    assert cached_get.call_args_list[1].args[2] == {'since': 'day'}
+    assert (items[1].overview, items[2].overview) == ("Stored", "Fresh")
+    assert items[1].id == "tvmaze:1" and items[1].is_favorite
+
+    # 3.4 Assert Timestamps Advance Only Once the Items Are Committed
+    assert seen_timestamps(state_file) == {'1': 100, '2': 100}
+    tvmaze_fetcher.commit_fetch_state(fetched)
+    assert seen_timestamps(state_file) == {'1': 100, '2': 200}
+    logger.info("Tested incremental TVMaze refresh")
+
+# 4.0 Test Failed Store Keeps Timestamps
+def test_failed_store_keeps_timestamps(mocker, tmp_path):
+    """Tests that a refresh failing after the fetch leaves the timestamps, so the next run refetches."""
+    # 4.1 Storage Fails After TVMaze Was Fetched
+    state_file, _ = mock_api(mocker, tmp_path)
+    mocker.patch("core.modules.watchlist_module.load_config", return_value={'api': {'tmdb_enabled': False, 'trakt_enabled': False}})
+    mocker.patch("core.fetchers.tvmaze_fetcher.load_config", return_value={'api': {}})
+    mocker.patch("core.fetchers.tvmaze_fetcher.load_env_vars", return_value={'API_TVMAZE_EMAIL': "e", 'API_TVMAZE_KEY': "k"})
+    mocker.patch("core.modules.watchlist_module.sync_state.save_sync_state")
+    mocker.patch("core.modules.watchlist_module.IdentityMap.save")
+    mocker.patch("core.modules.watchlist_module.upsert_media_items", side_effect=OSError("disk full"))
+
+    # 4.2 Refresh Fails
+    with pytest.raises(OSError):
+        refresh_watchlist()
+
+    # 4.3 Assert Show 2 Still Counts as Changed
+    assert seen_timestamps(state_file) == {'1': 100, '2': 100}
+    logger.info("Tested TVMaze timestamps after failed store")
+
+# 5.0 Test Record Building
+@pytest.mark.parametrize("fields, networks", [
+    ({}, [{'name': "ABC"}]),
+    ({'network': None, 'webChannel': {'id': 1, 'name': "Netflix"}}, [{'name': "Netflix"}]),
+    ({'network': None, 'image': None, 'rating': None, 'genres': None}, None),
+])
+def test_show_record_handles_real_payload_shapes(fields, networks):
+    """Tests record building from network/webChannel objects and null image, rating and genres."""
+    item = tvmaze_fetcher.validate_media_items([tvmaze_fetcher._show_record(show_payload(2, "Lost", "Fresh", **fields))])[0]
+    assert item.networks == networks
+    assert item.tvdb_id == 73739
+    if 'image' in fields:
+        assert (item.poster_url, item.score, item.genres) == (None, None, [])
+    else:
+        assert (item.poster_url, item.score) == ("https://img/2.jpg", 8.3)
+    logger.info("Tested TVMaze record building")
+
@@ -7,8 +7,14 @@
 # Version: 1.0
 
 # 1.0 Imports
+import threading
 import pytest
-from core.modules.watchlist_module import get_personal_watchlist
+from core.data_models import MediaItem
+from core.db import crud, sync_state
+from core.modules.watchlist_module import get_personal_watchlist, fetch_all_providers, edit_and_sync, refresh_watchlist
+from core.modules import watchlist_store
+from core.modules.watchlist_store import WatchlistStore
+from core.mappers.id_map import IdentityMap, provider_keys
 from core.utils.logger import logger
 
 # 2.0 Test Setup
@@ -42,4 +48,186 @@ def test_get_personal_watchlist(mock_fetchers):
     assert isinstance(items, list)
     assert len(items) == 0
     logger.info("Tested watchlist fetch: empty result")
+
+# 4.0 Test Partial Fetch
+def test_fetch_all_providers_partial(mock_fetchers, mocker):
+    """Tests that one failing provider does not abort the refresh."""
+    # 4.1 Fail TMDB Only
+    mocker.patch(
+        "core.fetchers.tmdb_fetcher.get_favorites_and_watchlist",
+        side_effect=RuntimeError("TMDB down")
+    )
+    
+    # 4.2 Fetch All Providers
+    results, errors = fetch_all_providers(timeout=5)
+    
+    # 4.3 Assert Partial Results
+    assert set(results) == {"tvmaze", "trakt"}
+    assert errors == {"tmdb": "TMDB down"}
+    logger.info("Tested partial provider fetch")
+
+# 5.0 Test Delta Sync
+def test_edit_and_sync_pushes_only_changed_flags(mocker, tmp_path):
+    """Tests that only differing flags are pushed and failures are reported per item."""
+    # 5.1 Isolate Storage
+    mocker.patch.object(sync_state, "SYNC_STATE_FILE", tmp_path / "sync_state.json")
+    mocker.patch("core.modules.watchlist_module.upsert_media_items")
+    tvmaze = mocker.patch("core.syncers.tvmaze_syncer.sync_to_tvmaze", return_value={"tvmaze:1|tmdb:2": False})
+    tmdb = mocker.patch("core.syncers.tmdb_syncer.sync_to_tmdb", return_value={"tvmaze:1|tmdb:2": True})
+    trakt = mocker.patch("core.syncers.trakt_syncer.sync_to_trakt")
+    watchlist = [
+        MediaItem(id="tvmaze:1|tmdb:2", name="Dark", type="tv", tvmaze_id=1, tmdb_id=2),
+        MediaItem(id="tvmaze:3", name="Lost", type="tv", tvmaze_id=3),
+    ]
+    
+    # 5.2 Favorite One Item
+    results = edit_and_sync(watchlist, {"tvmaze:1|tmdb:2": {"is_favorite": True}})
+    
+    # 5.3 Assert Minimal Plan and Per-Item Result
+    assert results == {"tvmaze:1|tmdb:2": False}
+    assert tmdb.call_args.args[1] == {"tvmaze:1|tmdb:2": ["is_favorite"]}
+    assert [i.id for i in tvmaze.call_args.args[0]] == ["tvmaze:1|tmdb:2"]
+    trakt.assert_not_called()
+    logger.info("Tested delta sync")
+
+# 6.0 Test Shared Store Versions
+def test_store_sync_publishes_new_version_without_mutating_old(mocker):
+    """Tests that a sync commits a new snapshot and leaves the previous one intact."""
+    # 6.1 Seed the Store
+    mocker.patch("core.modules.watchlist_store.edit_and_sync", side_effect=lambda items, changes: {
+        i.id: bool(setattr(i, "is_favorite", True)) or True for i in items if i.id in changes
+    })
+    store = WatchlistStore()
+    first = store.publish([MediaItem(id="tvmaze:1", name="Dark", type="tv", tvmaze_id=1)])
+    
+    # 6.2 Sync an Edit
+    second, results = store.sync({"tvmaze:1": {"is_favorite": True}})
+    
+    # 6.3 Assert Versioned Snapshots
+    assert results == {"tvmaze:1": True}
+    assert (first.version, second.version) == (1, 2)
+    assert second.changed_ids == {"tvmaze:1"}
+    assert first.items[0].is_favorite is False
+    assert second.items[0].is_favorite is True
+    assert store.refresh(seen_version=first.version) is second
+    logger.info("Tested shared store versions")
+
+# 7.0 Test Stale-While-Revalidate Refresh
+def test_store_refresh_keeps_last_good_snapshot(mocker, tmp_path):
+    """Tests that a refresh where every provider fails keeps serving the previous version."""
+    # 7.1 Fail Every Provider
+    mocker.patch.object(watchlist_store, "REFRESH_STATUS_FILE", tmp_path / "refresh_status.json")
+    mocker.patch("core.modules.watchlist_store.enabled_providers", return_value=["tvmaze", "tmdb"])
+    mocker.patch("core.modules.watchlist_store.refresh_watchlist", return_value=([], {"tvmaze": "down", "tmdb": "down"}))
+    store = WatchlistStore()
+    good = store.publish([MediaItem(id="tvmaze:1", name="Dark", type="tv", tvmaze_id=1)])
+    
+    # 7.2 Refresh
+    snapshot = store.refresh()
+    
+    # 7.3 Assert Old Snapshot Served and Failures Recorded
+    assert snapshot is good
+    assert store.last_success("tvmaze") is None
+    assert store.provider_status["tmdb"]["last_error"] == "down"
+    logger.info("Tested stale-while-revalidate refresh")
+
+# 8.0 Test Partial Refresh Carry-Over
+def test_refresh_carries_over_failed_provider(mock_fetchers, mocker, tmp_path):
+    """Tests that a failed provider's titles and flags survive a partial refresh."""
+    # 8.1 TVMaze Last Reported a Favorite; Now It Fails While TMDB Succeeds
+    mocker.patch.object(sync_state, "SYNC_STATE_FILE", tmp_path / "sync_state.json")
+    sync_state.save_sync_state({'tvmaze': {'tv:1': {'is_favorite': True}}, 'tmdb': {}, 'trakt': {}})
+    mocker.patch("core.fetchers.tvmaze_fetcher.get_favorites_and_watchlist", side_effect=RuntimeError("down"))
+    mocker.patch("core.fetchers.tmdb_fetcher.get_favorites_and_watchlist", return_value=[
+        MediaItem(id="tmdb:2", name="Dark", type="tv", tmdb_id=2, is_watchlist=True)
+    ])
+    mocker.patch("core.modules.watchlist_module.upsert_media_items")
+    mocker.patch("core.modules.watchlist_module.prune_media_items")
+    mocker.patch("core.modules.watchlist_module.IdentityMap.load", return_value=IdentityMap())
+    mocker.patch("core.modules.watchlist_module.IdentityMap.save")
+    previous = [MediaItem(id="tvmaze:1|tmdb:2", name="Dark", type="tv", tvmaze_id=1, tmdb_id=2,
+                          is_favorite=True, is_watchlist=True),
+                MediaItem(id="tmdb:3", name="Lost", type="tv", tmdb_id=3)]
+
+    # 8.2 Refresh
+    items, errors = refresh_watchlist(previous)
+
+    # 8.3 Assert TVMaze Key and Flag Kept, Removed TMDB Title Gone
+    assert set(errors) == {"tvmaze"}
+    assert len(items) == 1
+    assert provider_keys(items[0]) == {"tvmaze:1", "tmdb:2"}
+    assert items[0].is_favorite and items[0].is_watchlist
+    logger.info("Tested partial refresh carry-over")
+
+# 9.0 Test Sync During Refresh
+def test_sync_does_not_wait_for_refresh_fetch(mocker, tmp_path):
+    """Tests that a sync commits while a refresh is fetching and the refresh keeps the edit."""
+    # 9.1 Refresh Blocks Inside the Fetch
+    fetching, release = threading.Event(), threading.Event()
+    def slow_refresh(previous):
+        fetching.set()
+        release.wait(5)
+        return [MediaItem(id="tvmaze:1", name="Dark", type="tv", tvmaze_id=1)], {}
+    mocker.patch.object(watchlist_store, "REFRESH_STATUS_FILE", tmp_path / "refresh_status.json")
+    mocker.patch("core.modules.watchlist_store.refresh_watchlist", side_effect=slow_refresh)
+    mocker.patch("core.modules.watchlist_store.enabled_providers", return_value=["tvmaze"])
+    mocker.patch("core.modules.watchlist_store.upsert_media_items")
+    mocker.patch("core.modules.watchlist_store.prefetch_in_background")
+    mocker.patch("core.modules.watchlist_store.edit_and_sync", side_effect=lambda items, changes: {
+        i.id: bool(setattr(i, "is_favorite", True)) or True for i in items if i.id in changes
+    })
+    store = WatchlistStore()
+    store.publish([MediaItem(id="tvmaze:1", name="Dark", type="tv", tvmaze_id=1)])
+    thread = threading.Thread(target=store.refresh)
+    thread.start()
+    assert fetching.wait(5)
+
+    # 9.2 Sync While the Fetch Runs
+    synced, _ = store.sync({"tvmaze:1": {"is_favorite": True}})
+    release.set()
+    thread.join(5)
+
+    # 9.3 Assert Sync Committed First and the Refresh Kept Its Edit
+    assert synced.version == 2
+    assert store.version == 3
+    assert store.current().items[0].is_favorite is True
+    logger.info("Tested sync during refresh")
+
+# 10.0 Test Warm Start
+def test_load_stored_publishes_before_images(mocker):
+    """Tests that stored items are published at once and thumbnails are only queued."""
+    stored = [MediaItem(id="tmdb:2", name="Lost", type="tv", poster_url="https://img/2.jpg")]
+    mocker.patch("core.modules.watchlist_store.load_media_items", return_value=stored)
+    queued = mocker.patch("core.modules.watchlist_store.prefetch_in_background")
+    snapshot = WatchlistStore().load_stored()
+    assert snapshot.version == 1 and list(snapshot.items) == stored
+    queued.assert_called_once_with(stored)
+    logger.info("Tested warm start")
+
+# 11.0 Test Restart After a Re-Keyed Refresh
+def test_restart_after_rekeyed_refresh_shows_one_row(mock_fetchers, mocker, tmp_path):
+    """Tests that a title whose ID changed between refreshes is stored once, so a restart shows one row."""
+    # 11.1 JSON Storage and State in a Temp Dir
+    mocker.patch.object(crud, "DATA_FILE", tmp_path / "media.json")
+    mocker.patch.object(sync_state, "SYNC_STATE_FILE", tmp_path / "sync_state.json")
+    mocker.patch("core.db.repository.load_config", return_value={'storage': {'backend': 'json'}})
+    mocker.patch("core.modules.watchlist_module.IdentityMap.load", side_effect=IdentityMap)
+    mocker.patch("core.modules.watchlist_module.IdentityMap.save")
+    mocker.patch("core.modules.watchlist_store.prefetch_in_background")
+
+    # 11.2 First Refresh Sees Dark on TMDB Only; the Second Also on TVMaze
+    mocker.patch("core.fetchers.tmdb_fetcher.get_favorites_and_watchlist", return_value=[
+        MediaItem(id="tmdb:tv:2", name="Dark", type="tv", tmdb_id=2, is_watchlist=True)
+    ])
+    assert [i.id for i in refresh_watchlist()[0]] == ["tmdb:tv:2"]
+    mocker.patch("core.fetchers.tvmaze_fetcher.get_favorites_and_watchlist", return_value=[
+        MediaItem(id="tvmaze:1", name="Dark", type="tv", tvmaze_id=1, is_favorite=True)
+    ])
+    merged = refresh_watchlist()[0]
+    assert len(merged) == 1 and provider_keys(merged[0]) == {"tvmaze:1", "tmdb:tv:2"}
+
+    # 11.3 Restart: the Warm Start Publishes the Merged Row Only
+    snapshot = WatchlistStore().load_stored()
+    assert [i.id for i in snapshot.items] == [merged[0].id]
+    logger.info("Tested restart after re-keyed refresh")
 ```
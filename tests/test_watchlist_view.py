@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# File: test_watchlist_view.py
+# Description: Unit tests for the columnar watchlist view model
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import pytest
+from core.data_models import MediaItem
+from ui.watchlist_view import (
+    build_watchlist_frame, filter_watchlist_frame, page_frame,
+    apply_pending_edits, collect_page_edits
+)
+from core.utils.logger import logger
+
+# 2.0 Test Setup
+@pytest.fixture
+def frame(mocker):
+    """Builds a small watchlist frame with remote poster URLs."""
+    mocker.patch("ui.watchlist_view.thumbnail_uri", side_effect=lambda url: url)
+    return build_watchlist_frame([
+        MediaItem(id="tvmaze:1", name="Dark", type="tv", score=8.7, genres=["Drama", "Mystery"],
+                  networks=[{'name': "Netflix"}], is_favorite=True),
+        MediaItem(id="tmdb:2", name="Arrival", type="movie", score=7.9, genres=["Drama", "Science-Fiction"]),
+        MediaItem(id="tvmaze:3", name="The Dark Crystal", type="tv", score=8.4, genres=["Fantasy"],
+                  networks=[{'name': "Netflix"}], is_watchlist=True),
+    ])
+
+# 3.0 Test Filtering and Sorting
+def test_filter_watchlist_frame(frame):
+    """Tests search, list-column filters, flag filters and sorting."""
+    # 3.1 Search Plus Sort
+    result = filter_watchlist_frame(frame, search="dark", sort_by="Score", descending=True)
+    assert result['ID'].to_list() == ["tvmaze:1", "tvmaze:3"]
+
+    # 3.2 Genre, Network and Flag Filters
+    assert filter_watchlist_frame(frame, genres=["Drama"])['ID'].to_list() == ["tvmaze:1", "tmdb:2"]
+    assert filter_watchlist_frame(frame, networks=["Netflix"], watchlist=True)['ID'].to_list() == ["tvmaze:3"]
+    assert filter_watchlist_frame(frame, types=["movie"], favorite=False)['ID'].to_list() == ["tmdb:2"]
+    logger.info("Tested watchlist filtering")
+
+# 4.0 Test Page Edits
+def test_page_edits_map_back_by_id(frame):
+    """Tests that page edits are keyed by item ID and overlaid on later renders."""
+    # 4.1 Edit the Second Page
+    page = page_frame(filter_watchlist_frame(frame, sort_by="Name"), page=1, page_size=2)
+    edited = page.with_columns(Favorite=page['ID'] == "tvmaze:3")
+    pending = collect_page_edits(page, edited, {})
+
+    # 4.2 Assert Edit Keyed by ID and Reapplied
+    assert pending == {"tvmaze:3": {"is_favorite": True}}
+    assert apply_pending_edits(page, pending)['Favorite'].to_list() == [True]
+
+    # 4.3 Reverting Drops the Pending Edit
+    assert collect_page_edits(page, page, pending) == {}
+    logger.info("Tested page edits")
+
+# 5.0 Test Reordered Edits
+def test_collect_page_edits_ignores_row_order(frame):
+    """Tests that the ID join matches rows even when the edited frame comes back re-sorted."""
+    # 5.1 Edit and Reverse the Row Order
+    edited = frame.with_columns(Watchlist=frame['Watchlist'] | (frame['ID'] == "tmdb:2")).reverse()
+
+    # 5.2 Assert Only the Edited Item Is Recorded
+    assert collect_page_edits(frame, edited, {}) == {"tmdb:2": {"is_watchlist": True}}
+    logger.info("Tested reordered page edits")
+
+# 6.0 Test Page Posters
+def test_page_frame_uses_cached_thumbnails(frame, mocker):
+    """Tests that posters are resolved per page, so thumbnails cached after the frame was built show up."""
+    # 6.1 Frame Built with Remote URLs; One Poster Cached Since
+    frame = frame.with_columns(Poster=frame['ID'].str.replace(":", "/"))
+    mocker.patch("ui.watchlist_view.thumbnail_uri", side_effect=lambda url: "data:cached" if url == "tmdb/2" else url)
+
+    # 6.2 Assert Only the Page Is Resolved, and Cached Posters Are Local
+    page = page_frame(frame, page=0, page_size=2)
+    assert page['Poster'].to_list() == ["tvmaze/1", "data:cached"]
+    assert frame['Poster'].to_list() == ["tvmaze/1", "tmdb/2", "tvmaze/3"]
+    logger.info("Tested page posters")
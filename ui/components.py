@@ -10,10 +10,11 @@
 import streamlit as st
 import polars as pl  # Replaced pandas with polars
 from core.utils.logger import logger
+from ui.watchlist_view import DISPLAY_COLUMNS, SORT_COLUMNS, page_count
 
 # 2.0 Editable Table
-def editable_watchlist_table(df: pl.DataFrame) -> pl.DataFrame:
-    """Renders an editable table for watchlist/favorites."""
+def editable_watchlist_table(df: pl.DataFrame, key: str | None = None) -> pl.DataFrame:
+    """Renders an editable table for watchlist/favorites from the columnar watchlist frame."""
     # 2.1 Configure Table
     logger.info("Rendering watchlist table with {} items", df.height)
     
@@ -26,12 +27,82 @@ def editable_watchlist_table(df: pl.DataFrame) -> pl.DataFrame:
             "Watchlist": st.column_config.CheckboxColumn("Watchlist"),
             "Trakt Synced": st.column_config.TextColumn("Trakt Synced", disabled=True)
         },
-        use_container_width=True
+        column_order=DISPLAY_COLUMNS,
+        use_container_width=True,
+        key=key
     )
     
     # 2.3 Log Changes
     logger.debug("Table edited: {} rows", edited_df.height)
     return edited_df
+
+# 3.0 Filter Bar
+FLAG_CHOICES = {"Any": None, "Yes": True, "No": False}
+
+def watchlist_filter_bar(options: dict[str, list[str]]) -> dict:
+    """Renders search, filter and sort controls; returns keyword arguments for filter_watchlist_frame."""
+    # 3.1 Search and Multi-Select Filters
+    search = st.text_input("🔍 Search", placeholder="Title contains…", help="Case-insensitive title search")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        types = st.multiselect("Type", options['types'])
+    with col2:
+        genres = st.multiselect("Genre", options['genres'])
+    with col3:
+        networks = st.multiselect("Network", options['networks'])
+    
+    # 3.2 Flag Filters and Sort
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        favorite = st.selectbox("Favorite", list(FLAG_CHOICES))
+    with col2:
+        watchlist = st.selectbox("Watchlist", list(FLAG_CHOICES))
+    with col3:
+        sort_by = st.selectbox("Sort by", ["None"] + SORT_COLUMNS)
+    with col4:
+        descending = st.toggle("Descending", value=sort_by == "Score")
+    return {
+        'search': search.strip(),
+        'types': types,
+        'genres': genres,
+        'networks': networks,
+        'favorite': FLAG_CHOICES[favorite],
+        'watchlist': FLAG_CHOICES[watchlist],
+        'sort_by': None if sort_by == "None" else sort_by,
+        'descending': descending,
+    }
+
+# 4.0 Page Controls
+def page_controls(rows: int, page_sizes: tuple[int, ...] = (25, 50, 100)) -> tuple[int, int]:
+    """Renders page size and page number inputs; returns (zero-based page, page size)."""
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        page_size = st.selectbox("Rows per page", page_sizes)
+    pages = page_count(rows, page_size)
+    with col2:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+    with col3:
+        st.caption(f"{rows} matching items · page {page} of {pages}")
+    return int(page) - 1, page_size
+
+# 5.0 Calendar Table
+def calendar_table(rows: list[dict], show_names: dict[int, str]) -> None:
+    """Renders calendar query rows (see core.db.calendar_index) as a date-ordered table."""
+    if not rows:
+        st.caption("Nothing in this range.")
+        return
+    df = pl.DataFrame({
+        'Airs': [r['air_date'] for r in rows],
+        'Show': [show_names.get(r['show_tvmaze_id'], f"tvmaze:{r['show_tvmaze_id']}") for r in rows],
+        'Episode': [f"S{r['season_number'] or 0:02}E{r['number']:02}" for r in rows],
+        'Title': [r['name'] for r in rows],
+    })
+    st.dataframe(
+        df,
+        column_config={"Airs": st.column_config.DatetimeColumn("Airs (UTC)", format="ddd D MMM, HH:mm")},
+        hide_index=True,
+        use_container_width=True
+    )
 ```
 
 
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# File: watchlist_view.py
+# Description: Columnar (Polars) view model of the watchlist, built on refresh and patched incrementally on edits
+# Author: Grok 4 (xAI)
+# Created: 2026-10-18
+# Version: 1.0
+
+# 1.0 Imports
+import threading
+import polars as pl
+from core.data_models import MediaItem
+from core.modules.watchlist_store import WatchlistSnapshot
+from core.utils.image_cache import thumbnail_uri
+from core.utils.logger import logger
+
+# 2.0 Frame Schema
+SCHEMA = {
+    'ID': pl.Utf8,
+    'Poster': pl.Utf8,
+    'Name': pl.Utf8,
+    'Type': pl.Utf8,
+    'Score': pl.Float64,
+    'Networks': pl.Utf8,
+    'Network List': pl.List(pl.Utf8),
+    'Genres': pl.List(pl.Utf8),
+    'Favorite': pl.Boolean,
+    'Watchlist': pl.Boolean,
+    'Trakt Synced': pl.Utf8,
+}
+DISPLAY_COLUMNS = ['Poster', 'Name', 'Type', 'Score', 'Networks', 'Favorite', 'Watchlist', 'Trakt Synced']
+
+# 3.0 Column Builder
+def _columns(items: list[MediaItem]) -> dict[str, list]:
+    """Collects item fields column by column in a single pass."""
+    columns = {name: [] for name in SCHEMA}
+    for i in items:
+        columns['ID'].append(i.id)
+        columns['Poster'].append(i.poster_url)
+        columns['Name'].append(i.name)
+        columns['Type'].append(i.type)
+        columns['Score'].append(i.score)
+        networks = [n['name'] for n in i.networks or [] if n.get('name')]
+        columns['Networks'].append(', '.join(networks))
+        columns['Network List'].append(networks)
+        columns['Genres'].append(list(i.genres))
+        columns['Favorite'].append(i.is_favorite)
+        columns['Watchlist'].append(i.is_watchlist)
+        columns['Trakt Synced'].append('✅' if i.trakt_id else '❌')
+    return columns
+
+# 4.0 Build Frame
+def build_watchlist_frame(items: list[MediaItem]) -> pl.DataFrame:
+    """Builds the canonical watchlist frame (one row per item, keyed by ID)."""
+    df = pl.DataFrame(_columns(items), schema=SCHEMA)
+    logger.debug("Built watchlist frame with {} rows", df.height)
+    return df
+
+# 5.0 Incremental Update
+def update_watchlist_frame(df: pl.DataFrame, items: list[MediaItem]) -> pl.DataFrame:
+    """Patches rows for the given items in place of a rebuild; unknown IDs are appended."""
+    if not items:
+        return df
+    patch = build_watchlist_frame(items)
+    known = patch.filter(pl.col('ID').is_in(df['ID']))
+    added = patch.filter(~pl.col('ID').is_in(df['ID']))
+    if known.height:
+        df = df.update(known, on='ID', include_nulls=True)
+    if added.height:
+        df = pl.concat([df, added])
+    logger.debug("Patched {} rows, appended {} rows", known.height, added.height)
+    return df
+
+# 6.0 Shared Per-Version Frames
+_FRAMES: dict[int, pl.DataFrame] = {}  # Snapshot version -> frame, shared by every session
+_FRAMES_LOCK = threading.Lock()
+
+def snapshot_frame(snapshot: WatchlistSnapshot) -> pl.DataFrame:
+    """Returns the frame for a snapshot, patched from the previous version's frame when only edits changed."""
+    with _FRAMES_LOCK:
+        if snapshot.version not in _FRAMES:
+            previous = _FRAMES.get(snapshot.version - 1)
+            if previous is not None and snapshot.changed_ids is not None:
+                changed = [i for i in snapshot.items if i.id in snapshot.changed_ids]
+                _FRAMES[snapshot.version] = update_watchlist_frame(previous, changed)
+            else:
+                _FRAMES[snapshot.version] = build_watchlist_frame(list(snapshot.items))
+            # 6.1 Keep Only the Newest Frame (Older Versions Are Never Rendered Again)
+            for version in [v for v in _FRAMES if v < snapshot.version]:
+                del _FRAMES[version]
+        return _FRAMES[snapshot.version]
+
+# 7.0 Filtering, Sorting and Paging
+SORT_COLUMNS = ['Name', 'Score', 'Type']
+
+def filter_options(df: pl.DataFrame) -> dict[str, list[str]]:
+    """Returns the distinct types, genres and networks available for filtering."""
+    return {
+        'types': df['Type'].drop_nulls().unique().sort().to_list(),
+        'genres': df['Genres'].explode().drop_nulls().unique().sort().to_list(),
+        'networks': df['Network List'].explode().drop_nulls().unique().sort().to_list(),
+    }
+
+def filter_watchlist_frame(df: pl.DataFrame, search: str = "", types: list[str] | None = None,
+                           genres: list[str] | None = None, networks: list[str] | None = None,
+                           favorite: bool | None = None, watchlist: bool | None = None,
+                           sort_by: str | None = None, descending: bool = False) -> pl.DataFrame:
+    """Applies search, filters and sort as one lazy Polars query; None or empty means no filter."""
+    # 7.1 Build One Combined Predicate
+    predicate = pl.lit(True)
+    if search:
+        predicate &= pl.col('Name').str.to_lowercase().str.contains(search.lower(), literal=True)
+    if types:
+        predicate &= pl.col('Type').is_in(types)
+    if genres:
+        predicate &= pl.col('Genres').list.eval(pl.element().is_in(genres)).list.any()
+    if networks:
+        predicate &= pl.col('Network List').list.eval(pl.element().is_in(networks)).list.any()
+    if favorite is not None:
+        predicate &= pl.col('Favorite') == favorite
+    if watchlist is not None:
+        predicate &= pl.col('Watchlist') == watchlist
+
+    # 7.2 Filter and Sort
+    query = df.lazy().filter(predicate)
+    if sort_by in SORT_COLUMNS:
+        query = query.sort(sort_by, descending=descending, nulls_last=True)
+    return query.collect()
+
+def page_count(rows: int, page_size: int) -> int:
+    """Returns the number of pages needed for rows (at least one)."""
+    return max(1, -(-rows // page_size))
+
+def page_frame(df: pl.DataFrame, page: int, page_size: int) -> pl.DataFrame:
+    """Returns the rows of a zero-based page, with posters served from the thumbnail cache once cached."""
+    page_df = df.slice(page * page_size, page_size)
+    return page_df.with_columns(
+        pl.Series('Poster', [thumbnail_uri(url) for url in page_df['Poster']], dtype=pl.Utf8)
+    )
+
+# 8.0 Pending Edits
+EDITABLE_COLUMNS = {'Favorite': 'is_favorite', 'Watchlist': 'is_watchlist'}
+
+def apply_pending_edits(page: pl.DataFrame, pending: dict[str, dict]) -> pl.DataFrame:
+    """Overlays edits not yet synced onto a page so they survive page and filter changes."""
+    if not pending:
+        return page
+    for column, field in EDITABLE_COLUMNS.items():
+        values = {item_id: edits[field] for item_id, edits in pending.items() if field in edits}
+        if values:
+            page = page.with_columns(
+                pl.col('ID').replace_strict(values, default=pl.col(column), return_dtype=pl.Boolean).alias(column)
+            )
+    return page
+
+def collect_page_edits(original: pl.DataFrame, edited: pl.DataFrame, pending: dict[str, dict]) -> dict[str, dict]:
+    """Records edited flags of one page into pending via an ID join; rows reverted to the original are dropped."""
+    # 8.1 Diff Original and Edited Rows by ID (Row Order and Sorting Do Not Matter)
+    columns = list(EDITABLE_COLUMNS)
+    diff = original.select('ID', *columns).join(
+        edited.select('ID', *columns), on='ID', how='inner', suffix=' Edited'
+    ).with_columns(
+        (pl.col(f"{c} Edited") != pl.col(c)).alias(f"{c} Changed") for c in columns
+    ).with_columns(
+        pl.any_horizontal(f"{c} Changed" for c in columns).alias('Changed')
+    )
+    
+    # 8.2 Drop Pending Edits the User Reverted on This Page
+    if pending:
+        for item_id in set(diff.filter(~pl.col('Changed'))['ID']) & pending.keys():
+            del pending[item_id]
+    
+    # 8.3 Record Changed Rows Only
+    for row in diff.filter(pl.col('Changed')).iter_rows(named=True):
+        pending[row['ID']] = {
+            field: row[f"{column} Edited"]
+            for column, field in EDITABLE_COLUMNS.items() if row[f"{column} Changed"]
+        }
+    return pending